@@ -13,6 +13,8 @@ from app.api.v1 import (
     subscribers,
     campaigns,
     donations,
+    site,
+    search,
 )
 
 # All v1 routes will live under /api/v1
@@ -29,6 +31,8 @@ api_v1_router.include_router(testimonials.router)
 api_v1_router.include_router(subscribers.router)
 api_v1_router.include_router(campaigns.router)
 api_v1_router.include_router(donations.router)
+api_v1_router.include_router(site.router)
+api_v1_router.include_router(search.router)
 
 #  When you later add testimonials/subscribers modules, you’ll extend this file:
 # from app.api.v1 import testimonials, subscribers
@@ -1,16 +1,19 @@
 # backend/app/api/v1/auth.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
 from app.database import get_db
-from app.dependencies import get_current_user, get_current_admin
+from app.dependencies import get_current_user, get_current_admin, DBSessionRoute
 from app.models.user import User
 from app.schemas.auth import Token
 from app.schemas.user import UserOut, UserCreate
+from app.utils.client_ip import client_ip
+from app.utils.hashing import PasswordHashingBusy
+from app.utils.rate_limit import check_login_allowed_async
 from app.services.auth_service import (
-    authenticate_user,
+    authenticate_user_async,
     create_login_token,
     get_user_by_email,
     create_user as service_create_user,
@@ -18,11 +21,16 @@ from app.services.auth_service import (
 
 settings = get_settings()
 
-router = APIRouter(prefix="/auth", tags=["Auth"])
+router = APIRouter(
+    prefix="/auth",
+    tags=["Auth"],
+    route_class=DBSessionRoute,
+)
 
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
+    request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db),
 ) -> Token:
@@ -31,12 +39,31 @@ def login(
 
     OAuth2PasswordRequestForm sends the identifier as `username`,
     but in our case we use the email address as the username.
+
+    bcrypt runs on the bounded hashing pool; when that is saturated we
+    answer 503 right away instead of queueing more CPU work. Callers over
+    the per-IP / per-account login rate get a 429 before any of that.
     """
-    user = authenticate_user(
-        db,
-        email=form_data.username,
-        password=form_data.password,
-    )
+    limit = await check_login_allowed_async(client_ip(request), form_data.username)
+    if not limit.allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts, please retry later.",
+            headers={"Retry-After": str(limit.retry_after)},
+        )
+
+    try:
+        user = await authenticate_user_async(
+            db,
+            email=form_data.username,
+            password=form_data.password,
+        )
+    except PasswordHashingBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many logins in progress, please retry.",
+            headers={"Retry-After": "1"},
+        )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
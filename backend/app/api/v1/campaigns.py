@@ -4,11 +4,19 @@ from __future__ import annotations
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
-from app.dependencies import get_current_admin
+from app.database import get_async_db, get_db, get_read_db
+from app.dependencies import get_current_admin, DBSessionRoute
+from app.utils.response_cache import cache_response
 from app.models.campaign import Campaign, CampaignStatus
+from app.services import list_queries
+from app.services.write_service import (
+    commit_keep_loaded,
+    insert_returning,
+    update_returning,
+)
 from app.schemas.campaign import (
     CampaignCreate,
     CampaignUpdate,
@@ -16,15 +24,20 @@ from app.schemas.campaign import (
     CampaignAdmin,
 )
 
-router = APIRouter(prefix="/campaigns", tags=["Campaigns"])
+router = APIRouter(
+    prefix="/campaigns",
+    tags=["Campaigns"],
+    route_class=DBSessionRoute,
+)
 
 
 # ---------------------------
 # Public endpoints
 # ---------------------------
 @router.get("", response_model=list[CampaignPublic])
-def list_campaigns(
-    db: Session = Depends(get_db),
+@cache_response("campaigns")
+async def list_campaigns(
+    db: AsyncSession = Depends(get_async_db),
     status: CampaignStatus | None = Query(
         None,
         alias="status",  # keeps ?status=active working
@@ -45,29 +58,24 @@ def list_campaigns(
     - Pagination via skip / limit
     - Ordered by sort_order then most recent
     """
-    query = db.query(Campaign)
-
-    if status is not None:
-        query = query.filter(Campaign.status == status)
-
-    if is_featured is not None:
-        query = query.filter(Campaign.is_featured == is_featured)
-
-    campaigns = (
-        query.order_by(Campaign.sort_order, Campaign.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
+    result = await db.scalars(
+        list_queries.campaigns_page(
+            status=status,
+            is_featured=is_featured,
+            offset=skip,
+            limit=limit,
+        )
     )
 
-    return campaigns
+    return result.all()
 
 
 
 @router.get("/{slug}", response_model=CampaignPublic)
+@cache_response("campaigns")
 def get_campaign_by_slug(
     slug: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Public: get campaign details by slug.
@@ -114,24 +122,25 @@ def create_campaign(
             detail="Campaign slug already exists",
         )
 
-    campaign = Campaign(
-        name=payload.name,
-        slug=payload.slug,
-        short_description=payload.short_description,
-        description=payload.description,
-        currency=payload.currency,
-        target_amount=payload.target_amount,
-        hero_image_url=payload.hero_image_url,
-        sort_order=payload.sort_order,
-        start_date=payload.start_date,
-        end_date=payload.end_date,
-        status=payload.status,
-        is_featured=payload.is_featured,
+    campaign = insert_returning(
+        db,
+        Campaign,
+        dict(
+            name=payload.name,
+            slug=payload.slug,
+            short_description=payload.short_description,
+            description=payload.description,
+            currency=payload.currency,
+            target_amount=payload.target_amount,
+            hero_image_url=payload.hero_image_url,
+            sort_order=payload.sort_order,
+            start_date=payload.start_date,
+            end_date=payload.end_date,
+            status=payload.status,
+            is_featured=payload.is_featured,
+        ),
     )
-
-    db.add(campaign)
-    db.commit()
-    db.refresh(campaign)
+    commit_keep_loaded(db)
     return campaign
 
 
@@ -170,11 +179,8 @@ def update_campaign(
                 detail="Another campaign with that slug already exists",
             )
 
-    for field, value in update_data.items():
-        setattr(campaign, field, value)
-
-    db.commit()
-    db.refresh(campaign)
+    campaign = update_returning(db, Campaign, campaign_id, update_data)
+    commit_keep_loaded(db)
     return campaign
 
 
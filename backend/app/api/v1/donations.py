@@ -9,33 +9,41 @@ from fastapi import (
     HTTPException,
     Query,
     Request,
+    Response,
     status,
 )
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from app.database import get_db
-from app.dependencies import get_current_admin
-from app.models.donation import Donation, DonationStatus
+from app.database import get_db, get_read_db
+from app.dependencies import get_current_admin, DBSessionRoute
+from app.models.donation import DonationStatus
 from app.schemas.donation import (
     DonationCreate,
     DonationPublic,
     DonationAdmin,
     DonationIntentResponse,
 )
+from app.services import list_queries
 from app.services.donation_service import (
-    create_donation,
+    create_donation_with_session,
     list_donations,
     get_donation,
 )
 from app.services.payment_provider_service import (
-    create_payment_session,
     verify_webhook_signature,
     parse_webhook_event,
-    apply_webhook_to_donation,
     WebhookSignatureError,
 )
-
-router = APIRouter(prefix="/donations", tags=["Donations"])
+from app.services.webhook_events import process_webhook_event
+from app.utils.client_ip import client_ip
+from app.utils.cursor import InvalidCursor, decode_cursor, split_page
+
+router = APIRouter(
+    prefix="/donations",
+    tags=["Donations"],
+    route_class=DBSessionRoute,
+)
 
 
 # ---------------------------
@@ -67,11 +75,12 @@ def create_donation_intent(
             detail="Donation amount must be greater than zero.",
         )
 
-    ip_address = request.client.host if request.client else None
+    ip_address = client_ip(request)
     user_agent = request.headers.get("user-agent")
 
     try:
-        donation = create_donation(
+        # One transaction: donation row + payment session (card / MoMo)
+        donation, session_info = create_donation_with_session(
             db,
             payload,
             ip_address=ip_address,
@@ -84,9 +93,6 @@ def create_donation_intent(
             detail=str(exc),
         ) from exc
 
-    # Phase 3: create payment session (card / MoMo)
-    session_info = create_payment_session(db, donation)
-
     public = DonationPublic.model_validate(donation)
     return DonationIntentResponse(
         donation=public,
@@ -103,13 +109,14 @@ def create_donation_intent(
     response_model=list[DonationAdmin],
 )
 def admin_list_donations(
-    db: Session = Depends(get_db),
+    response: Response,
+    db: Session = Depends(get_read_db),
     admin=Depends(get_current_admin),
     campaign_id: UUID | None = Query(
         None,
         description="Filter donations by campaign ID",
     ),
-    status: DonationStatus | None = Query(
+    status_filter: DonationStatus | None = Query(
         None,
         alias="status",
         description="Filter by donation status: pending|confirmed|failed|refunded",
@@ -128,7 +135,11 @@ def admin_list_donations(
     max_amount: int | None = Query(
         None, ge=0, description="Filter donations with amount <= this value"
     ),
-    skip: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: str | None = Query(
+        None,
+        description="Opaque cursor from a previous page's X-Next-Cursor header",
+    ),
+    skip: int = Query(0, ge=0, description="Offset for pagination (prefer cursor)"),
     limit: int = Query(100, ge=1, le=200, description="Page size, max 200"),
 ):
     """
@@ -141,6 +152,11 @@ def admin_list_donations(
     - status
     - date_from / date_to (created_at range, ISO8601 string)
     - min_amount / max_amount
+
+    Pagination: newest first. If there are more rows, the response carries
+    an `X-Next-Cursor` header; pass it back as `?cursor=` (with the same
+    filters) for the next page. Cursor pages cost the same at any depth,
+    unlike `skip`.
     """
 
     def _parse_iso_datetime(value: str) -> datetime:
@@ -162,14 +178,6 @@ def admin_list_donations(
             raw = raw.replace(" ", "+", 1)
         return datetime.fromisoformat(raw)
 
-    query = db.query(Donation)
-
-    if campaign_id is not None:
-        query = query.filter(Donation.campaign_id == campaign_id)
-
-    if status is not None:
-        query = query.filter(Donation.status == status)
-
     # Parse optional date range
     parsed_from = None
     parsed_to = None
@@ -192,24 +200,34 @@ def admin_list_donations(
                 detail="Invalid date_to; expected ISO8601 datetime string.",
             )
 
-    if parsed_from is not None:
-        query = query.filter(Donation.created_at >= parsed_from)
-
-    if parsed_to is not None:
-        query = query.filter(Donation.created_at <= parsed_to)
-
-    if min_amount is not None:
-        query = query.filter(Donation.amount >= min_amount)
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+        except InvalidCursor:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor.",
+            )
 
-    if max_amount is not None:
-        query = query.filter(Donation.amount <= max_amount)
+    # One extra row tells us whether there is a next page
+    donations = db.scalars(
+        list_queries.admin_donations_page(
+            campaign_id=campaign_id,
+            status=status_filter,
+            date_from=parsed_from,
+            date_to=parsed_to,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            after=after,
+            offset=0 if after else skip,
+            limit=limit + 1,
+        )
+    ).all()
 
-    donations = (
-        query.order_by(Donation.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    donations, next_cursor = split_page(donations, limit)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
 
     return donations
 
@@ -220,7 +238,7 @@ def admin_list_donations(
 )
 def admin_get_donation(
     donation_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     admin=Depends(get_current_admin),
 ):
     """
@@ -252,6 +270,7 @@ async def donation_webhook(
 
     - Verifies HMAC signature (X-Payment-Signature)
     - Parses generic payload
+    - Answers retried deliveries of an applied event from webhook_events
     - Maps provider status to DonationStatus
     - Updates donation
     """
@@ -268,15 +287,13 @@ async def donation_webhook(
 
     try:
         event = parse_webhook_event(raw_body)
-        donation, new_status = apply_webhook_to_donation(db, event)
+        # Blocking DB work (including the donation row lock wait): keep it
+        # off the event loop
+        outcome, _ = await run_in_threadpool(process_webhook_event, db, raw_body, event)
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(exc),
         ) from exc
 
-    return {
-        "ok": True,
-        "donation_id": str(donation.id),
-        "status": new_status.value,
-    }
+    return outcome
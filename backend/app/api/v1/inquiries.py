@@ -1,16 +1,32 @@
 from uuid import UUID
 from datetime import date
-from sqlalchemy.exc import DataError
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.dependencies import get_db, get_current_admin
+from app.database import engine, get_read_db
+from app.dependencies import get_db, get_current_admin, DBSessionRoute
 from app.models.inquiry import Inquiry, InquiryStatus
 from app.schemas.inquiry import InquiryOut, InquiryCreate, InquiryUpdate
+from app.services import dashboard_stats, list_queries
+from app.services.export_service import NDJSON_MEDIA_TYPE, stream_ndjson
+from app.services.write_service import (
+    commit_keep_loaded,
+    insert_returning,
+    update_returning,
+)
+from app.utils.cursor import InvalidCursor, decode_cursor, split_page
 from app.utils.email_sender import send_inquiry_notification
 
-router = APIRouter(prefix="/inquiries", tags=["Inquiries"])
+router = APIRouter(
+    prefix="/inquiries",
+    tags=["Inquiries"],
+    route_class=DBSessionRoute,
+)
+
+# Postgres full-text search on Inquiry.search_vector; LIKE elsewhere (SQLite)
+FULL_TEXT_SEARCH = engine.dialect.name == "postgresql"
 
 
 # =====================================================
@@ -25,10 +41,8 @@ def submit_inquiry(
     Public: Submit a new inquiry / quote request.
     """
 
-    inquiry = Inquiry(**inquiry_in.model_dump())
-    db.add(inquiry)
-    db.commit()
-    db.refresh(inquiry)
+    inquiry = insert_returning(db, Inquiry, inquiry_in.model_dump())
+    commit_keep_loaded(db)
 
     # 🔔 Fire-and-forget notification
     if inquiry.email:
@@ -52,58 +66,109 @@ Message: {inquiry.message}
 # =====================================================
 @router.get("", response_model=list[InquiryOut])
 def list_inquiries(
-    db: Session = Depends(get_db),
+    response: Response,
+    db: Session = Depends(get_read_db),
     admin=Depends(get_current_admin),
 
-    # Pagination (kept, even if tests don't use it)
+    # Pagination: cursor (preferred) or page
+    cursor: str | None = Query(
+        None,
+        description="Opaque cursor from a previous page's X-Next-Cursor header",
+    ),
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=200),
 
     # Filters
-    status: InquiryStatus | None = Query(None),
+    status_filter: InquiryStatus | None = Query(None, alias="status"),
     source: str | None = Query(None),
     search: str | None = Query(None),
+    order: str = Query(
+        "newest",
+        pattern="^(newest|relevance)$",
+        description="Order of search results: newest | relevance",
+    ),
 ):
     """
-    Admin: list inquiries with optional filters.
+    Admin: list inquiries with optional filters, newest first.
 
     - status: NEW | IN_REVIEW | QUOTED | ...
     - source: quote | contact | website | referral | ...
-    - search: matches full_name, email, or message
+    - search: full-text search over name, email, message and location
+      (web-search syntax: "quoted phrases", -exclude, or), plus partial
+      email matches
+    - order=relevance: rank the newest 1000 search matches by relevance
+
+    When there are more results, the `X-Next-Cursor` header holds the
+    cursor for the next page (pass it back with the same filters).
+    Relevance-ranked search results are paged with `page` instead.
     """
-    query = db.query(Inquiry)
-
-    # Status filter
-    if status is not None:
-        query = query.filter(Inquiry.status == status)
-
-    # Source filter
-    if source:
-        query = query.filter(Inquiry.source == source)
-
-    # Text search (case-insensitive on name/email/message)
-    if search:
-        like = f"%{search.lower()}%"
-        query = query.filter(
-            (Inquiry.full_name.ilike(like))
-            | (Inquiry.email.ilike(like))
-            | (Inquiry.message.ilike(like))
+    ranked = bool(search) and order == "relevance"
+    if cursor and ranked:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Search results are ranked; use page, or order=newest with cursor.",
         )
 
-    # Newest first
-    query = query.order_by(Inquiry.created_at.desc())
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+        except InvalidCursor:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor.",
+            )
 
-    # Pagination (still applied, but we just return the list)
-    inquiries = (
-        query
-        .offset((page - 1) * limit)
-        .limit(limit)
-        .all()
-    )
+    # One extra row tells us whether there is a next page
+    inquiries = db.scalars(
+        list_queries.inquiries_page(
+            status=status_filter,
+            source=source,
+            search=search,
+            full_text=FULL_TEXT_SEARCH,
+            ranked=ranked,
+            after=after,
+            offset=0 if after else (page - 1) * limit,
+            limit=limit + 1,
+        )
+    ).all()
+
+    inquiries, next_cursor = split_page(inquiries, limit)
+    if next_cursor and not ranked:
+        response.headers["X-Next-Cursor"] = next_cursor
 
     return inquiries
 
 
+# =====================================================
+# EXPORT INQUIRIES AS NDJSON (ADMIN)
+# =====================================================
+@router.get("/export")
+def export_inquiries(
+    admin=Depends(get_current_admin),
+    status_filter: InquiryStatus | None = Query(None, alias="status"),
+    source: str | None = Query(None),
+    search: str | None = Query(None),
+):
+    """
+    Admin: stream every matching inquiry as NDJSON (one InquiryOut per
+    line), newest first, in constant memory. Search results are not
+    ranked here: ranking would sort the whole result before the first row.
+    """
+    stmt = list_queries.inquiries_page(
+        status=status_filter,
+        source=source,
+        search=search,
+        full_text=FULL_TEXT_SEARCH,
+        ranked=False,
+        limit=None,
+    )
+    return StreamingResponse(
+        stream_ndjson(stmt, InquiryOut),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
+
 # =====================================================
 # UPDATE INQUIRY STATUS (ADMIN)
 # =====================================================
@@ -118,16 +183,14 @@ def update_inquiry_status(
     Admin: Update inquiry status.
     """
 
-    inquiry = db.query(Inquiry).filter(Inquiry.id == inquiry_id).first()
+    inquiry = update_returning(db, Inquiry, inquiry_id, {"status": status_value})
     if not inquiry:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Inquiry not found.",
         )
 
-    inquiry.status = status_value
-    db.commit()
-    db.refresh(inquiry)
+    commit_keep_loaded(db)
     return inquiry
 
 
@@ -145,19 +208,15 @@ def update_inquiry(
     Admin: Update inquiry details (notes, contact info, etc.)
     """
 
-    inquiry = db.query(Inquiry).filter(Inquiry.id == inquiry_id).first()
+    update_data = inquiry_in.model_dump(exclude_unset=True)
+    inquiry = update_returning(db, Inquiry, inquiry_id, update_data)
     if not inquiry:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Inquiry not found.",
         )
 
-    update_data = inquiry_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(inquiry, field, value)
-
-    db.commit()
-    db.refresh(inquiry)
+    commit_keep_loaded(db)
     return inquiry
 
 # =====================================================
@@ -165,56 +224,12 @@ def update_inquiry(
 # =====================================================
 @router.get("/stats", response_model=dict)
 def inquiry_stats(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     admin=Depends(get_current_admin),
 ):
     """
-    Admin: summary stats for dashboard cards.
+    Admin: summary stats for dashboard cards (one GROUP BY status query).
     """
-    # Total inquiries (safe)
-    total = db.query(Inquiry).count()
-
-    # Per-status counts (defensive: handle enum/DB mismatches)
-    counts_by_status: dict[str, int] = {}
-    for status in InquiryStatus:
-        try:
-            counts_by_status[status.value] = (
-                db.query(Inquiry)
-                .filter(Inquiry.status == status)
-                .count()
-            )
-        except DataError:
-            # Enum value not present in DB type; keep API alive, report 0
-            db.rollback()
-            counts_by_status[status.value] = 0
-
-    # "Open-like" statuses: use all statuses except clearly closed ones,
-    # without hard-coding names that might not exist.
-    # "Open-like" statuses: use all non-closed statuses
-    open_like_statuses = [
-        status
-        for status in InquiryStatus
-        if status not in {InquiryStatus.CLOSED}
-    ]
-
-    try:
-        open_count = (
-            db.query(Inquiry)
-            .filter(Inquiry.status.in_(open_like_statuses))
-            .count()
-        )
-    except DataError:
-        db.rollback()
-        open_count = 0
-
-    # NEW count (lowercase enum now)
-    new_count = counts_by_status.get(InquiryStatus.NEW.value, 0)
-
-    return {
-        "total": total,
-        "open": open_count,
-        "new": new_count,
-        "by_status": counts_by_status,
-    }
+    return dashboard_stats.inquiry_counts(db)
 
 
@@ -4,17 +4,29 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
-from app.dependencies import get_db, get_current_admin
+from app.database import get_read_db
+from app.dependencies import get_db, get_current_admin, DBSessionRoute
+from app.utils.response_cache import cache_response
 from app.models.media import Media
 from app.schemas.media import MediaOut, MediaCreate, MediaUpdate
+from app.services.write_service import (
+    commit_keep_loaded,
+    insert_returning,
+    update_returning,
+)
 
-router = APIRouter(prefix="/media", tags=["Media"])
+router = APIRouter(
+    prefix="/media",
+    tags=["Media"],
+    route_class=DBSessionRoute,
+)
 
 
 @router.get("/project/{project_id}", response_model=list[MediaOut])
+@cache_response("media")
 def list_media_for_project(
     project_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=200),
 ):
@@ -41,10 +53,8 @@ def create_media(
     """
     Admin: create a media item (image/video) for a project.
     """
-    media = Media(**media_in.model_dump())
-    db.add(media)
-    db.commit()
-    db.refresh(media)
+    media = insert_returning(db, Media, media_in.model_dump())
+    commit_keep_loaded(db)
     return media
 
 
@@ -58,19 +68,15 @@ def update_media(
     """
     Admin: update a media item.
     """
-    media = db.query(Media).filter(Media.id == media_id).first()
+    update_data = media_in.model_dump(exclude_unset=True)
+    media = update_returning(db, Media, media_id, update_data)
     if not media:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Media item not found.",
         )
 
-    update_data = media_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(media, field, value)
-
-    db.commit()
-    db.refresh(media)
+    commit_keep_loaded(db)
     return media
 
 
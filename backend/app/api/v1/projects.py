@@ -1,11 +1,20 @@
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import DataError  
 
-from app.dependencies import get_db, get_current_admin
+from app.database import get_async_db, get_read_db
+from app.dependencies import get_db, get_current_admin, DBSessionRoute
+from app.utils.response_cache import cache_response
 from app.models.project import Project, ProjectStatus
 from app.models.service import Service
+from app.services import dashboard_stats, list_queries
+from app.services.write_service import (
+    commit_keep_loaded,
+    insert_returning,
+    update_returning,
+)
 from app.schemas.project import (
     ProjectOut,
     ProjectCreate,
@@ -13,14 +22,19 @@ from app.schemas.project import (
     ProjectListOut,
 )
 
-router = APIRouter(prefix="/projects", tags=["Projects"])
+router = APIRouter(
+    prefix="/projects",
+    tags=["Projects"],
+    route_class=DBSessionRoute,
+)
 
 # =====================================================
 # LIST PROJECTS (PUBLIC)
 # =====================================================
 @router.get("", response_model=ProjectListOut)
-def list_projects(
-    db: Session = Depends(get_db),
+@cache_response("projects", "services")
+async def list_projects(
+    db: AsyncSession = Depends(get_async_db),
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
     status: ProjectStatus | None = Query(None),
@@ -34,55 +48,81 @@ def list_projects(
         None,
         description="Sort by: newest | oldest | featured",
     ),
+    total_mode: str = Query(
+        "exact",
+        alias="total",
+        pattern="^(exact|estimate|none)$",
+        description=(
+            "How to compute `total`: exact | estimate (planner statistics, "
+            "unfiltered lists only; exact otherwise) | none"
+        ),
+    ),
+    include_total: bool = Query(
+        True,
+        description="Shortcut for total=none when false.",
+    ),
 ):
     """
     Public: List projects with filtering, sorting, and pagination.
     MUST return a wrapper object to satisfy test_public_api.py.
-    """
-
-    query = db.query(Project)
-
-    # ---------- Filters ----------
-    if status is not None:
-        query = query.filter(Project.status == status)
-
-    if is_featured is not None:
-        query = query.filter(Project.is_featured == is_featured)
 
-    if service_slug:
-        query = (
-            query.join(Service, Project.service_id == Service.id)
-            .filter(Service.slug == service_slug)
-        )
+    Served from the async engine so it never waits on the threadpool;
+    statements are cached lambda statements (see list_queries).
 
-    # ---------- Sorting ----------
-    if sort == "newest":
-        query = query.order_by(Project.created_at.desc())
-    elif sort == "oldest":
-        query = query.order_by(Project.created_at.asc())
-    elif sort == "featured":
-        query = query.order_by(
-            Project.is_featured.desc(),
-            Project.created_at.desc(),
+    The exact total comes from a window count on the page query itself,
+    so a normal request is a single round trip. `total` is null when
+    omitted, and `total_estimated` is true when it is an estimate.
+    """
+    filters = dict(
+        status=status,
+        is_featured=is_featured,
+        service_slug=service_slug,
+    )
+    if not include_total:
+        total_mode = "none"
+
+    total: int | None = None
+    total_estimated = False
+
+    if total_mode == "estimate" and not any(v is not None for v in filters.values()):
+        conn = await db.connection()
+        if conn.dialect.name == "postgresql":
+            estimate = await db.scalar(list_queries.estimated_row_count("projects"))
+            if estimate is not None and estimate >= 0:
+                total, total_estimated = estimate, True
+
+    with_total = total_mode != "none" and total is None
+
+    # ---------- Sorting + page ----------
+    result = await db.execute(
+        list_queries.projects_page(
+            **filters,
+            sort=sort,
+            offset=(page - 1) * limit,
+            limit=limit,
+            with_total=with_total,
         )
-    else:
-        query = query.order_by(Project.created_at.desc())
-
-    # ---------- Pagination ----------
-    total = query.count()
-    items = (
-        query
-        .offset((page - 1) * limit)
-        .limit(limit)
-        .all()
     )
+    if with_total:
+        rows = result.all()
+        items = [row[0] for row in rows]
+        if rows:
+            total = rows[0][1]
+        elif page == 1:
+            total = 0
+        else:
+            # Past the last page: no rows to carry the window count
+            total = await db.scalar(list_queries.projects_count(**filters))
+    else:
+        items = result.scalars().all()
 
-    pages = (total + limit - 1) // limit
+    pages = (total + limit - 1) // limit if total is not None else None
 
     # ---------- REQUIRED FORMAT FOR TEST ----------
     return {
         "items": items,
         "total": total,
+        "total_estimated": total_estimated,
         "page": page,
         "pages": pages,
         "limit": limit,
@@ -93,55 +133,22 @@ def list_projects(
 # =====================================================
 @router.get("/stats", response_model=dict)
 def project_stats(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     admin=Depends(get_current_admin),
 ):
     """
-    Admin: summary statistics for dashboard.
+    Admin: summary statistics for dashboard (one query).
     """
-    total = db.query(Project).count()
-    completed = (
-        db.query(Project)
-        .filter(Project.status == ProjectStatus.COMPLETED)
-        .count()
-    )
-    ongoing = (
-        db.query(Project)
-        .filter(Project.status == ProjectStatus.ONGOING)
-        .count()
-    )
-    planned = (
-        db.query(Project)
-        .filter(Project.status == ProjectStatus.PLANNED)
-        .count()
-    )
-    on_hold = (
-        db.query(Project)
-        .filter(Project.status == ProjectStatus.ON_HOLD)
-        .count()
-    )
-    featured = (
-        db.query(Project)
-        .filter(Project.is_featured.is_(True))
-        .count()
-    )
-
-    return {
-      "total": total,
-      "completed": completed,
-      "ongoing": ongoing,
-      "planned": planned,
-      "on_hold": on_hold,
-      "featured": featured,
-    }
+    return dashboard_stats.project_counts(db)
 
 # =====================================================
 # GET SINGLE PROJECT (PUBLIC)
 # =====================================================
 @router.get("/{slug}", response_model=ProjectOut)
+@cache_response("projects", "services", "media")
 def get_project_by_slug(
     slug: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     project = (
         db.query(Project)
@@ -178,10 +185,8 @@ def create_project(
             detail="Slug already in use.",
         )
 
-    project = Project(**project_in.model_dump())
-    db.add(project)
-    db.commit()
-    db.refresh(project)
+    project = insert_returning(db, Project, project_in.model_dump())
+    commit_keep_loaded(db)
     return project
 
 
@@ -195,19 +200,15 @@ def update_project(
     db: Session = Depends(get_db),
     admin=Depends(get_current_admin),
 ):
-    project = db.query(Project).filter(Project.id == project_id).first()
+    update_data = project_in.model_dump(exclude_unset=True)
+    project = update_returning(db, Project, project_id, update_data)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found.",
         )
 
-    update_data = project_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(project, field, value)
-
-    db.commit()
-    db.refresh(project)
+    commit_keep_loaded(db)
     return project
 
 
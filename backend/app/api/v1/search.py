@@ -0,0 +1,51 @@
+# app/api/v1/search.py
+from typing import Literal
+
+from fastapi import APIRouter, Query
+from fastapi.concurrency import run_in_threadpool
+
+from app.dependencies import DBSessionRoute
+from app.schemas.search import SearchResults
+from app.services.search_index import rebuild_search_index, search_index, stale_tables
+from app.utils.response_cache import get_cache_backend
+
+router = APIRouter(
+    prefix="/search",
+    tags=["Search"],
+    route_class=DBSessionRoute,
+)
+
+
+@router.get("", response_model=SearchResults)
+async def site_search(
+    q: str = Query(..., min_length=1, max_length=200),
+    types: list[Literal["project", "service", "campaign"]] | None = Query(
+        None,
+        alias="type",
+        description="Restrict to hit types (repeatable): project | service | campaign",
+    ),
+    limit: int = Query(20, ge=1, le=50),
+):
+    """
+    Public: search projects, services and campaigns.
+
+    Answered from the in-memory index (see app.services.search_index);
+    the database is only read if the index is missing, another worker
+    changed one of the indexed tables, or (without a shared cache
+    backend) a table's last full load is older than the cache TTL.
+    """
+    backend = get_cache_backend()
+    if backend is not None and backend.blocking:
+        # The generation check is a Redis round trip
+        tables = await run_in_threadpool(stale_tables)
+    else:
+        tables = stale_tables()
+    if tables:
+        await run_in_threadpool(rebuild_search_index, tables, if_stale=True)
+
+    total, hits = search_index.search(
+        q,
+        kinds=set(types) if types else None,
+        limit=limit,
+    )
+    return SearchResults(query=q, total=total, hits=hits)
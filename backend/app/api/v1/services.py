@@ -3,57 +3,61 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.dependencies import get_db, get_current_admin
+from app.database import get_async_db, get_read_db
+from app.dependencies import get_db, get_current_admin, DBSessionRoute
+from app.utils.response_cache import cache_response
 from app.models.service import Service
 from app.schemas.service import ServiceOut, ServiceCreate, ServiceUpdate
 
 # 🔹 Import service layer logic
+from app.services import list_queries
 from app.services.service_service import (
     create_service as svc_create_service,
     update_service as svc_update,
     delete_service as svc_delete,
 )
 
-router = APIRouter(prefix="/services", tags=["Services"])
+router = APIRouter(
+    prefix="/services",
+    tags=["Services"],
+    route_class=DBSessionRoute,
+)
 
 
 # ---------------------------------------------------------
 # List Services (Public)
 # ---------------------------------------------------------
 @router.get("", response_model=list[ServiceOut])
-def list_services(
-    db: Session = Depends(get_db),
+@cache_response("services")
+async def list_services(
+    db: AsyncSession = Depends(get_async_db),
     is_active: bool | None = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
 ):
-    query = db.query(Service)
-
-    if is_active is None:
-        # Default public behaviour → only show active services
-        query = query.filter(Service.is_active == True)  # noqa: E712
-    else:
-        query = query.filter(Service.is_active == is_active)
-
-    services = (
-        query.order_by(Service.display_order.asc(), Service.name.asc())
-        .offset(skip)
-        .limit(limit)
-        .all()
+    result = await db.scalars(
+        list_queries.services_page(
+            # Default public behaviour → only show active services
+            is_active=True if is_active is None else is_active,
+            offset=skip,
+            limit=limit,
+        )
     )
 
-    return services
+    return result.all()
 
 
 # ---------------------------------------------------------
 # Get Service By Slug (Public)
 # ---------------------------------------------------------
 @router.get("/{slug}", response_model=ServiceOut)
+@cache_response("services")
 def get_service_by_slug(
     slug: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     service = db.query(Service).filter(Service.slug == slug).first()
     if not service:
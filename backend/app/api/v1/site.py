@@ -0,0 +1,42 @@
+# app/api/v1/site.py
+import time
+
+from fastapi import APIRouter, Request, Response
+from fastapi.concurrency import run_in_threadpool
+
+from app.dependencies import DBSessionRoute
+from app.schemas.site import HomeBundle
+from app.services.site_service import current_home_snapshot, rebuild_home_snapshot
+from app.utils.response_cache import etag_matches, get_cache_backend
+
+router = APIRouter(
+    prefix="/site",
+    tags=["Site"],
+    route_class=DBSessionRoute,
+)
+
+
+@router.get("/home", response_model=HomeBundle)
+async def get_home(request: Request):
+    """
+    Public: services, featured projects, featured testimonials and featured
+    campaigns in one response.
+
+    Served from a pre-serialized snapshot that is rebuilt when any of those
+    tables is written, so this normally never touches the database.
+    """
+    started = time.monotonic()
+    backend = get_cache_backend()
+    if backend is not None and backend.blocking:
+        # The generation check is a Redis round trip
+        snapshot = await run_in_threadpool(current_home_snapshot)
+    else:
+        snapshot = current_home_snapshot()
+    if snapshot is None:
+        # Concurrent misses share one rebuild
+        snapshot = await run_in_threadpool(rebuild_home_snapshot, unless_built_since=started)
+
+    headers = {"ETag": snapshot.etag}
+    if etag_matches(request, snapshot.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
@@ -1,97 +1,121 @@
 # app/api/v1/stats.py
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
-from datetime import datetime
-from sqlalchemy import func, distinct
+from datetime import date, datetime, timedelta, timezone
 
-from app.database import get_db
-from app.dependencies import get_current_admin
-from app.models.project import Project
-from app.models.service import Service
-from app.models.inquiry import Inquiry
-from app.models.testimonial import Testimonial
-from app.models.subscriber import Subscriber
-from app.models.donation import Donation
-from app.models.campaign import Campaign
+from app.database import get_read_db
+from app.dependencies import get_current_admin, DBSessionRoute
+from app.schemas.donation import DonationSeriesOut
+from app.services import dashboard_stats, donation_rollups, donation_series
+from app.services.donation_series import Bucket, GroupBy
+from app.utils.pool_metrics import pool_stats
+from app.utils.principal_cache import principal_cache
 
-router = APIRouter(prefix="/stats", tags=["Stats"])
+router = APIRouter(
+    prefix="/stats",
+    tags=["Stats"],
+    route_class=DBSessionRoute,
+)
 
 
 @router.get("/")
 def admin_stats(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     admin=Depends(get_current_admin),
 ):
     """
-    Aggregate counts for the admin dashboard.
+    Aggregate counts for the admin dashboard (one query).
     """
-    services = db.query(Service).count()
-    projects = db.query(Project).count()
-    inquiries = db.query(Inquiry).count()
-    testimonials = db.query(Testimonial).count()
-    subscribers = db.query(Subscriber).count()
+    return dashboard_stats.entity_counts(db)
+
+
+@router.get("/db/pool")
+def db_pool_stats(
+    admin=Depends(get_current_admin),
+):
+    """
+    Admin-only: live connection pool metrics per engine.
+
+    - checked_out / overflow / size: current pool state
+    - checkout_wait: histogram of time spent waiting for a connection
+    - timeouts: `QueuePool limit ... timed out` errors since startup
+    """
+    return pool_stats()
+
+
+@router.get("/auth/principals")
+def principal_cache_stats(
+    admin=Depends(get_current_admin),
+):
+    """
+    Admin-only: authenticated-user cache size and hit rate (this worker).
+    """
+    return principal_cache.stats()
+
 
-    return {
-        "services": services,
-        "projects": projects,
-        "inquiries": inquiries,
-        "testimonials": testimonials,
-        "subscribers": subscribers,
-    }
 @router.get("/donations/summary")
 def donation_summary(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     admin=Depends(get_current_admin),
 ):
     """
     Admin-only: donation stats for dashboard widgets.
 
     - Total amount donated this calendar month
-    - Number of donors this month (unique donor_email)
+    - Number of donors this month (unique donor_email, estimated)
     - Top campaign by total amount (all-time)
+
+    Read from donation_daily_rollups (confirmed donations only), not the
+    donations table.
     """
-    now = datetime.utcnow()
-    month_start = datetime(year=now.year, month=now.month, day=1)
-
-    # this month totals (confirmed only)
-    month_q = (
-        db.query(
-            func.coalesce(func.sum(Donation.amount), 0).label("total_amount"),
-            func.count(distinct(Donation.donor_email)).label("donors_count"),
-        )
-        .filter(Donation.status == "confirmed")
-        .filter(Donation.created_at >= month_start)
-        .filter(Donation.created_at <= now)
-    ).one()
-
-    month_total = int(month_q.total_amount or 0)
-    donors_count = int(month_q.donors_count or 0)
-
-    # top campaign (all time, confirmed)
-    top_campaign_row = (
-        db.query(
-            Campaign.id,
-            Campaign.name,
-            func.coalesce(func.sum(Donation.amount), 0).label("total_amount"),
-        )
-        .join(Donation, Donation.campaign_id == Campaign.id)
-        .filter(Donation.status == "confirmed")
-        .group_by(Campaign.id, Campaign.name)
-        .order_by(func.sum(Donation.amount).desc())
-        .first()
+    today = datetime.now(timezone.utc).date()
+    month_total, donors_count = donation_rollups.period_totals(
+        db, today.replace(day=1), today
     )
 
-    top_campaign = None
-    if top_campaign_row:
-        top_campaign = {
-            "id": top_campaign_row.id,
-            "name": top_campaign_row.name,
-            "total_amount": int(top_campaign_row.total_amount or 0),
-        }
-
     return {
         "month_total": month_total,
         "donors_count": donors_count,
-        "top_campaign": top_campaign,
-    }
\ No newline at end of file
+        "top_campaign": donation_rollups.top_campaign(db),
+    }
+
+
+# Default range per bucket when `start` is omitted
+DEFAULT_SERIES_DAYS = {"day": 30, "week": 7 * 12, "month": 365}
+
+
+@router.get("/donations/series", response_model=DonationSeriesOut)
+def donation_series_stats(
+    bucket: Bucket = Query("day"),
+    start: date | None = Query(
+        None, description="First day (default: 30 days / 12 weeks / 12 months back)"
+    ),
+    end: date | None = Query(None, description="Last day (default: today, UTC)"),
+    group_by: GroupBy = Query("none"),
+    db: Session = Depends(get_read_db),
+    admin=Depends(get_current_admin),
+):
+    """
+    Admin-only: confirmed donations per day, ISO week or month, optionally
+    split by campaign or payment method (one series per group and currency).
+
+    Served from donation_daily_rollups; each period is cached separately
+    and only recomputed after a donation in it is confirmed or refunded.
+    """
+    end = end or datetime.now(timezone.utc).date()
+    start = start or end - timedelta(days=DEFAULT_SERIES_DAYS[bucket] - 1)
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start must not be after end.",
+        )
+    try:
+        return donation_series.donation_series(
+            db, bucket=bucket, start=start, end=end, group_by=group_by
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
@@ -1,13 +1,21 @@
 # app/api/v1/subscribers.py
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.database import get_db
-from app.dependencies import get_current_admin
+from app.database import get_db, get_read_db
+from app.dependencies import get_current_admin, DBSessionRoute
 from app.models.subscriber import Subscriber
 from app.schemas.subscriber import SubscriberOut, SubscriberCreate
+from app.services import list_queries
+from app.services.export_service import NDJSON_MEDIA_TYPE, stream_ndjson
+from app.utils.cursor import InvalidCursor, decode_cursor, split_page
 
-router = APIRouter(prefix="/subscribers", tags=["Subscribers"])
+router = APIRouter(
+    prefix="/subscribers",
+    tags=["Subscribers"],
+    route_class=DBSessionRoute,
+)
 
 
 @router.post("", response_model=SubscriberOut, status_code=status.HTTP_201_CREATED)
@@ -40,19 +48,55 @@ def create_subscriber(
 
 @router.get("", response_model=list[SubscriberOut])
 def list_subscribers(
-    db: Session = Depends(get_db),
+    response: Response,
+    db: Session = Depends(get_read_db),
     admin=Depends(get_current_admin),
+    cursor: str | None = Query(
+        None,
+        description="Opaque cursor from a previous page's X-Next-Cursor header",
+    ),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
 ):
     """
     Admin-only: list newsletter subscribers (newest first).
+
+    When there are more results, the `X-Next-Cursor` header holds the
+    cursor for the next page.
     """
-    subscribers = (
-        db.query(Subscriber)
-        .order_by(Subscriber.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+        except InvalidCursor:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor.",
+            )
+
+    subscribers = db.scalars(
+        list_queries.subscribers_page(
+            after=after,
+            offset=0 if after else skip,
+            limit=limit + 1,
+        )
+    ).all()
+
+    subscribers, next_cursor = split_page(subscribers, limit)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return subscribers
+
+
+@router.get("/export")
+def export_subscribers(
+    admin=Depends(get_current_admin),
+):
+    """
+    Admin-only: stream all subscribers as NDJSON (one SubscriberOut per
+    line), newest first, in constant memory. Used for newsletter syncs.
+    """
+    return StreamingResponse(
+        stream_ndjson(list_queries.subscribers_page(limit=None), SubscriberOut),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
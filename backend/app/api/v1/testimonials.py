@@ -2,22 +2,36 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.dependencies import get_db, get_current_admin
+from app.database import get_async_db
+from app.dependencies import get_db, get_current_admin, DBSessionRoute
+from app.utils.response_cache import cache_response
 from app.models.testimonial import Testimonial
+from app.services.write_service import (
+    commit_keep_loaded,
+    insert_returning,
+    update_returning,
+)
 from app.schemas.testimonial import (
     TestimonialCreate,
     TestimonialOut,
     TestimonialUpdate,
 )
 
-router = APIRouter(prefix="/testimonials", tags=["Testimonials"])
+router = APIRouter(
+    prefix="/testimonials",
+    tags=["Testimonials"],
+    route_class=DBSessionRoute,
+)
 
 
 @router.get("", response_model=list[TestimonialOut])
-def list_testimonials(
-    db: Session = Depends(get_db),
+@cache_response("testimonials")
+async def list_testimonials(
+    db: AsyncSession = Depends(get_async_db),
     is_active: bool | None = Query(
         True,
         description="If set, filters by active flag. Defaults to only active.",
@@ -39,25 +53,24 @@ def list_testimonials(
     - By default returns only active ones.
     - Can filter by is_featured for homepage highlights.
     """
-    query = db.query(Testimonial)
+    stmt = select(Testimonial)
 
     # Active flag: True → only active, False → only inactive, None → ignore
     if is_active is not None:
-        query = query.filter(Testimonial.is_active == is_active)
+        stmt = stmt.where(Testimonial.is_active == is_active)
 
     # Featured flag filter
     if is_featured is not None:
-        query = query.filter(Testimonial.is_featured == is_featured)
+        stmt = stmt.where(Testimonial.is_featured == is_featured)
 
-    testimonials = (
-        query.order_by(
+    result = await db.scalars(
+        stmt.order_by(
             Testimonial.display_order.asc(),
             Testimonial.created_at.desc(),
         )
         .limit(limit)
-        .all()
     )
-    return testimonials
+    return result.all()
 
 
 @router.post("", response_model=TestimonialOut, status_code=status.HTTP_201_CREATED)
@@ -69,10 +82,8 @@ def create_testimonial(
     """
     Admin: create a new testimonial.
     """
-    testimonial = Testimonial(**testimonial_in.model_dump())
-    db.add(testimonial)
-    db.commit()
-    db.refresh(testimonial)
+    testimonial = insert_returning(db, Testimonial, testimonial_in.model_dump())
+    commit_keep_loaded(db)
     return testimonial
 
 
@@ -86,23 +97,15 @@ def update_testimonial(
     """
     Admin: update testimonial fields.
     """
-    testimonial = (
-        db.query(Testimonial)
-        .filter(Testimonial.id == testimonial_id)
-        .first()
-    )
+    update_data = testimonial_in.model_dump(exclude_unset=True)
+    testimonial = update_returning(db, Testimonial, testimonial_id, update_data)
     if not testimonial:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Testimonial not found.",
         )
 
-    update_data = testimonial_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(testimonial, field, value)
-
-    db.commit()
-    db.refresh(testimonial)
+    commit_keep_loaded(db)
     return testimonial
 
 
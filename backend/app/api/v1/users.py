@@ -4,12 +4,19 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
-from app.database import get_db
-from app.dependencies import get_current_admin, get_current_user
+from app.database import get_db, get_read_db
+from app.dependencies import get_current_admin, get_current_user, DBSessionRoute
 from app.models.user import User, UserRole
 from app.schemas.user import UserOut, UserUpdateRole
+from app.services.auth_service import bump_token_version
+from app.utils.principal_cache import invalidate_user
+from app.utils.token_revocation import remember as remember_token_version
 
-router = APIRouter(prefix="/users", tags=["Users"])
+router = APIRouter(
+    prefix="/users",
+    tags=["Users"],
+    route_class=DBSessionRoute,
+)
 
 
 # =====================================================
@@ -17,7 +24,7 @@ router = APIRouter(prefix="/users", tags=["Users"])
 # =====================================================
 @router.get("", response_model=list[UserOut])
 def list_users(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     admin=Depends(get_current_admin),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=200),
@@ -53,7 +60,7 @@ def list_users(
 @router.get("/{user_id}", response_model=UserOut)
 def get_user(
     user_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     admin=Depends(get_current_admin),
 ):
     """
@@ -106,6 +113,8 @@ def update_user_role(
             detail="User not found.",
         )
 
+    before = (user.role, user.is_superuser, user.is_active)
+
     # ---- ROLE UPDATE ----
     if body.role is not None:
         if isinstance(body.role, UserRole):
@@ -129,6 +138,12 @@ def update_user_role(
     if body.is_active is not None:
         user.is_active = body.is_active
 
+    # Role / flag changes revoke the user's existing tokens
+    if before != (user.role, user.is_superuser, user.is_active):
+        bump_token_version(user)
+
     db.commit()
     db.refresh(user)
+    invalidate_user(user)
+    remember_token_version(user)
     return user
@@ -1,9 +1,10 @@
 # app/config.py
 from functools import lru_cache
-from typing import List  # you can drop this and use built-in list[...] if you want
+from typing import Annotated, List  # you can drop this and use built-in list[...] if you want
 
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 from pydantic import AnyHttpUrl, field_validator
+from sqlalchemy.engine import make_url
 
 from dotenv import load_dotenv 
 load_dotenv() 
@@ -17,10 +18,69 @@ class Settings(BaseSettings):
     database_url_local: str | None = None
     database_url_docker: str | None = None
 
+    # Read replicas (comma-separated). Read-only routes are spread across
+    # these; writes, webhooks and anything after a commit use the primary.
+    database_url_replicas: Annotated[List[str], NoDecode] = []
+
+    # Connection pool (per engine, per worker process)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0  # seconds to wait for a connection
+    db_pool_recycle: int = 1800  # seconds; -1 disables
+    # True  => pessimistic: ping on every checkout (survives DB restarts)
+    # False => optimistic: rely on pool_recycle + invalidation on error
+    db_pool_pre_ping: bool = True
+
+    # Async engine (public read endpoints). NullPool is only meant for tests,
+    # where every TestClient request runs on a fresh event loop.
+    database_async_null_pool: bool = False
+
+    # Response cache for public GET endpoints
+    # memory => per-process LRU, redis => shared (RESPONSE_CACHE_REDIS_URL),
+    # none   => disabled
+    response_cache_backend: str = "memory"
+    response_cache_redis_url: str | None = None
+    response_cache_ttl: int = 300  # seconds
+    response_cache_max_entries: int = 1024
+
     # JWT auth configuration
     jwt_secret_key: str = ""
     jwt_algorithm: str = "HS256"
 
+    # Authenticated user cache (per worker); 0 disables
+    auth_principal_cache_ttl: float = 60.0  # seconds
+    auth_principal_cache_max_entries: int = 10000
+
+    # Password hashing: bcrypt cost and the dedicated hashing pool
+    # (workers ≈ cores you are willing to spend on logins; beyond
+    # workers + max_queue in flight, login answers 503 immediately)
+    bcrypt_rounds: int = 12
+    password_hash_workers: int = 2
+    password_hash_max_queue: int = 16
+
+    # Login admission control (token buckets per client IP and per account)
+    # memory => per worker, redis => shared (LOGIN_RATE_LIMIT_REDIS_URL),
+    # none   => disabled
+    login_rate_limit_backend: str = "memory"
+    login_rate_limit_redis_url: str | None = None
+    login_ip_burst: int = 20
+    login_ip_per_minute: float = 10.0
+    login_account_burst: int = 5
+    login_account_per_minute: float = 5.0
+
+    # Reverse proxies (IPs or CIDRs, comma-separated) whose X-Forwarded-For
+    # is believed when working out a request's client IP (login rate limit
+    # per IP, donation records). Empty: use the socket peer address as is.
+    trusted_proxies: Annotated[List[str], NoDecode] = []
+
+    # Claims mode: admin/role checks trust the signed `role`/`is_superuser`
+    # claims and only compare the token's `ver` with users.token_version
+    # (kept in memory, refreshed from the DB every auth_token_version_ttl).
+    # Revocations reach other workers immediately with the redis response
+    # cache backend; otherwise within auth_token_version_ttl.
+    auth_claims_mode: bool = False
+    auth_token_version_ttl: float = 5.0  # seconds
+
     # CORS settings
     cors_origins: List[AnyHttpUrl] | List[str] = []  # or: list[AnyHttpUrl] | list[str]
 
@@ -62,10 +122,33 @@ class Settings(BaseSettings):
             raise ValueError("DATABASE_URL_LOCAL is not set in the environment.")
         return self.database_url_local
 
+    @property
+    def async_database_url(self) -> str:
+        """
+        Same database as `database_url`, but with an asyncio driver.
+
+        postgresql / postgresql+psycopg2 => postgresql+asyncpg
+        sqlite / sqlite+pysqlite          => sqlite+aiosqlite (test mode)
+        """
+        return self._to_async_url(self.database_url)
+
+    @property
+    def async_database_url_replicas(self) -> list[str]:
+        return [self._to_async_url(u) for u in self.database_url_replicas]
+
+    @staticmethod
+    def _to_async_url(raw: str) -> str:
+        url = make_url(raw)
+        if url.get_backend_name() == "postgresql":
+            url = url.set(drivername="postgresql+asyncpg")
+        elif url.get_backend_name() == "sqlite":
+            url = url.set(drivername="sqlite+aiosqlite")
+        return url.render_as_string(hide_password=False)
+
     # -----------------------------
-    # Fix comma-separated CORS list
+    # Fix comma-separated CORS / replica / proxy lists
     # -----------------------------
-    @field_validator("cors_origins", mode="before")
+    @field_validator("cors_origins", "database_url_replicas", "trusted_proxies", mode="before")
     def assemble_cors_origins(cls, v):
         if isinstance(v, str):
             return [origin.strip() for origin in v.split(",") if origin.strip()]
@@ -1,8 +1,23 @@
 # backend/app/database.py
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import Delete, Insert, Update, create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, DeclarativeBase
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import NullPool, StaticPool
 
 from .config import get_settings
+from .utils.query_stats import record_query
+from .utils.pool_metrics import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    instrument_engine,
+)
 
 settings = get_settings()
 
@@ -12,24 +27,294 @@ class Base(DeclarativeBase):
     pass
 
 
+def _is_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def _pool_kwargs(poolclass, url: str) -> dict:
+    """Pool options shared by every engine (see Settings.db_pool_*)."""
+    if _is_sqlite(url):
+        # Test mode: one shared connection keeps the in-memory database
+        # alive and lets the TestClient threads see the same data.
+        return {
+            "poolclass": StaticPool,
+            "connect_args": {"check_same_thread": False},
+        }
+    return {
+        "poolclass": poolclass,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
 # Sync engine (simple & robust for FastAPI + Postgres)
 engine = create_engine(
     settings.database_url,
     future=True,
-    pool_pre_ping=True,
+    **_pool_kwargs(InstrumentedQueuePool, settings.database_url),
 )
 
+# Optional read replicas (same options as the primary)
+replica_engines = [
+    create_engine(url, future=True, **_pool_kwargs(InstrumentedQueuePool, url))
+    for url in settings.database_url_replicas
+]
+
+instrument_engine("primary", engine)
+for i, replica in enumerate(replica_engines):
+    instrument_engine(f"replica-{i}", replica)
+
+
+# Statement counter / timer for every engine (sync + async): feeds the
+# per-request Server-Timing header and the test query budget guard.
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = conn.info["query_start"].pop()
+    record_query(statement, (time.perf_counter() - start) * 1000)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_cursor_error(exception_context):
+    # Failed statements never reach after_cursor_execute
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start"):
+        conn.info["query_start"].pop()
+
+
+# True while the current request must not read from a replica (see
+# `primary_reads`). Copied into threadpool calls with the rest of the context.
+_primary_reads: ContextVar[bool] = ContextVar("primary_reads", default=False)
+
+
+@contextmanager
+def primary_reads():
+    """
+    Send every read made in this context to the primary. Used while filling
+    a cache entry keyed on a generation that a commit just bumped: a lagging
+    replica would store pre-commit rows under the new key.
+    """
+    token = _primary_reads.set(True)
+    try:
+        yield
+    finally:
+        _primary_reads.reset(token)
+
+
+class RoutingSession(Session):
+    """
+    Session that sends plain reads to a replica and everything else to the
+    primary.
+
+    - Flushes, INSERT/UPDATE/DELETE and SELECT ... FOR UPDATE go to the primary.
+    - Once a session has written, it sticks to the primary for the rest of its
+      life, so a request always reads its own writes.
+    - `info["use_primary"] = True` pins a session to the primary up front, and
+      `primary_reads()` does the same for everything in a context.
+    - With no replicas configured this is just a normal single-engine session.
+    """
+
+    def __init__(self, *, primary, replicas=(), **kw):
+        super().__init__(**kw)
+        self._primary = primary
+        self._replicas = list(replicas)
+        self._replica_cycle = itertools.cycle(self._replicas) if self._replicas else None
+
+    def get_bind(self, mapper=None, *, clause=None, **kw):
+        if not self._replicas or self.info.get("use_primary") or _primary_reads.get():
+            return self._primary
+
+        if (
+            self._flushing
+            or isinstance(clause, (Insert, Update, Delete))
+            or getattr(clause, "_for_update_arg", None) is not None
+        ):
+            self.info["use_primary"] = True
+            return self._primary
+
+        # One replica per session keeps a request's reads consistent
+        if "replica" not in self.info:
+            self.info["replica"] = next(self._replica_cycle)
+        return self.info["replica"]
+
+
+# Default sessions (writes, webhooks, scripts, tests) are pinned to the primary
 SessionLocal = sessionmaker(
+    class_=RoutingSession,
     autocommit=False,
     autoflush=False,
-    bind=engine,
+    primary=engine,
+    replicas=replica_engines,
+    info={"use_primary": True},
+)
+
+# Read-only routes: reads may be served by a replica
+ReadSessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    primary=engine,
+    replicas=replica_engines,
 )
 
 
+# Async engine (asyncpg) for the public read endpoints.
+# Runs side by side with the sync engine: handlers on this path don't hold
+# a threadpool token while waiting on Postgres.
+if _is_sqlite(settings.async_database_url):
+    _async_engine_kwargs = _pool_kwargs(None, settings.async_database_url)
+elif settings.database_async_null_pool:
+    _async_engine_kwargs = {"poolclass": NullPool}
+else:
+    _async_engine_kwargs = _pool_kwargs(
+        InstrumentedAsyncQueuePool, settings.async_database_url
+    )
+
+async_engine = create_async_engine(
+    settings.async_database_url,
+    **_async_engine_kwargs,
+)
+
+async_replica_engines = [
+    create_async_engine(url, **_async_engine_kwargs)
+    for url in settings.async_database_url_replicas
+]
+
+instrument_engine("async-primary", async_engine)
+for i, replica in enumerate(async_replica_engines):
+    instrument_engine(f"async-replica-{i}", replica)
+
+AsyncSessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    autoflush=False,
+    expire_on_commit=False,
+    primary=async_engine.sync_engine,
+    replicas=[e.sync_engine for e in async_replica_engines],
+)
+
+
+# Track un-committed writes so a session is never "released" (committed)
+# behind the handler's back.
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_flushed_writes(session, flush_context):
+    session.info["pending_writes"] = True
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _mark_dml_writes(orm_execute_state):
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info["pending_writes"] = True
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _clear_pending_writes(session, transaction):
+    if transaction.parent is None:
+        session.info.pop("pending_writes", None)
+
+
+def _can_release(db: Session) -> bool:
+    return (
+        db.in_transaction()
+        and not (db.new or db.dirty or db.deleted)
+        and not db.info.get("pending_writes")
+    )
+
+
+def release_session(db: Session) -> None:
+    """
+    Hand the session's connection back to the pool without detaching or
+    expiring the objects it loaded (they still serialize fine). A later
+    lazy load simply checks out a connection again. Sessions with unflushed
+    or uncommitted writes are left alone.
+    """
+    if not _can_release(db):
+        return
+    expire = db.expire_on_commit
+    db.expire_on_commit = False
+    try:
+        db.commit()  # read-only transaction: just returns the connection
+    finally:
+        db.expire_on_commit = expire
+
+
+async def release_async_session(db: AsyncSession) -> None:
+    """Async counterpart of `release_session` (AsyncSessionLocal never expires)."""
+    if _can_release(db.sync_session):
+        await db.commit()
+
+
+class LazySession:
+    """
+    Stands in for a Session until it is first used.
+
+    Requests that are rejected by auth, served from cache, or never query
+    don't construct a Session at all. Every attribute access is forwarded to
+    the real Session, so handlers and services use it like a normal one.
+    """
+
+    __slots__ = ("_factory", "_session")
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._session = None
+
+    @property
+    def started(self) -> bool:
+        return self._session is not None
+
+    def _get(self) -> Session:
+        if self._session is None:
+            self._session = self._factory()
+        return self._session
+
+    @property
+    def session(self) -> Session:
+        """The real Session (built on demand)."""
+        return self._get()
+
+    def __getattr__(self, name):
+        return getattr(self._get(), name)
+
+    def release(self) -> None:
+        if self._session is not None:
+            release_session(self._session)
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+
+
 # FastAPI dependency (we'll use this later in routers/services)
 def get_db():
-    db = SessionLocal()
+    db = LazySession(SessionLocal)
     try:
         yield db
     finally:
         db.close()
+
+
+# FastAPI dependency for read-only routes (public GETs, stats, admin lists)
+def get_read_db():
+    db = LazySession(ReadSessionLocal)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# FastAPI dependency for `async def` read handlers (replica-routed)
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,18 +1,30 @@
 # backend/app/dependencies.py
+import functools
+import inspect
 import uuid
+from dataclasses import dataclass
 
 from fastapi import Depends, HTTPException, status
+from fastapi.routing import APIRoute
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.config import get_settings
+from app.database import LazySession, get_db, release_async_session
 from app.models.user import User, UserRole
 from app.services.auth_service import (
     get_user_by_id,
     get_user_by_email,
 )
 from app.utils.jwt_handler import decode_token
+from app.utils.principal_cache import UserPrincipal, principal_cache, subject_key
+from app.utils.response_cache import cached_route_handler
+from app.utils.token_revocation import REVOKED, shared_generation, token_versions
+
+settings = get_settings()
 
 # NOTE: main includes this router under /api/v1, so final token URL is /api/v1/auth/login
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
@@ -21,7 +33,13 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 def get_current_user(
     db: Session = Depends(get_db),
     token: str = Depends(oauth2_scheme),
-) -> User:
+) -> User | UserPrincipal:
+    """
+    Resolve the token to the current user.
+
+    Returns a cached, read-only `UserPrincipal` (same fields as User) when
+    the subject was seen recently; the DB session is then never opened.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials.",
@@ -33,12 +51,10 @@ def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    user: User | None = None
-
     # 1) Preferred: email-based lookup (matches create_login_token)
     email = payload.get("email")
     if email:
-        user = get_user_by_email(db, email=email)
+        key = subject_key(email=email)
     else:
         # 2) Backwards-compatible fallback: use `sub` as UUID user_id
         sub = payload.get("sub")
@@ -49,20 +65,95 @@ def get_current_user(
             user_id = uuid.UUID(sub)
         except ValueError:
             raise credentials_exception
+        key = subject_key(user_id=user_id)
 
-        user = get_user_by_id(db, user_id=user_id)
+    principal = principal_cache.get(key)
+    if principal is not None:
+        return principal
+
+    user: User | None = (
+        get_user_by_email(db, email=email)
+        if email
+        else get_user_by_id(db, user_id=user_id)
+    )
 
     if user is None or not user.is_active:
         raise credentials_exception
 
-    return user
+    principal = UserPrincipal.from_user(user)
+    principal_cache.put(key, principal)
+    return principal
+
+
+@dataclass(frozen=True)
+class TokenPrincipal:
+    """Who the caller is, taken from verified token claims (claims mode)."""
+    id: uuid.UUID
+    email: str | None
+    role: str
+    is_superuser: bool
+    token_version: int
+
+
+def get_token_principal(
+    db: Session = Depends(get_db),
+    token: str = Depends(oauth2_scheme),
+) -> TokenPrincipal:
+    """
+    Claims-mode principal: role / is_superuser come from the signed token;
+    the only check is that its `ver` is still the user's token_version
+    (in-memory, checked against the shared backend when there is one; see
+    app.utils.token_revocation).
+    """
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials.",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+    try:
+        payload = decode_token(token)
+        user_id = uuid.UUID(payload["sub"])
+    except (JWTError, KeyError, TypeError, ValueError):
+        raise credentials_exception
+
+    # Read before any DB load: a bump racing the load moves it again
+    generation = shared_generation(user_id)
+    current = token_versions.get(user_id, generation)
+    if current is None:
+        row = db.execute(
+            select(User.token_version, User.is_active).where(User.id == user_id)
+        ).first()
+        current = row.token_version if row is not None and row.is_active else REVOKED
+        token_versions.set(user_id, current, generation)
+
+    if current == REVOKED or payload.get("ver", 0) != current:
+        raise credentials_exception
+
+    return TokenPrincipal(
+        id=user_id,
+        email=payload.get("email"),
+        role=str(payload.get("role") or UserRole.STAFF.value),
+        is_superuser=bool(payload.get("is_superuser", False)),
+        token_version=current,
+    )
+
+
+def get_authz_principal(
+    db: Session = Depends(get_db),
+    token: str = Depends(oauth2_scheme),
+) -> User | UserPrincipal | TokenPrincipal:
+    """Principal used for role checks: token claims in claims mode, else the user."""
+    if settings.auth_claims_mode:
+        return get_token_principal(db, token)
+    return get_current_user(db, token)
 
 
 def require_role(allowed_roles: list[UserRole | str]):
     """
     Dependency factory: require user to have one of allowed_roles (or be is_superuser).
     """
-    def _wrapper(current_user: User = Depends(get_current_user)) -> User:
+    def _wrapper(current_user: User = Depends(get_authz_principal)) -> User:
         role_value = (
             current_user.role.value
             if isinstance(current_user.role, UserRole)
@@ -83,7 +174,7 @@ def require_role(allowed_roles: list[UserRole | str]):
 
 
 def get_current_admin(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_authz_principal),
 ) -> User:
     """
     Backwards-compatible admin check: role=admin OR is_superuser.
@@ -100,3 +191,60 @@ def get_current_admin(
             detail="Insufficient permissions.",
         )
     return current_user
+
+
+def _release_db_sessions_after(endpoint):
+    """
+    Wrap an endpoint so the DB sessions it received give their connection
+    back to the pool as soon as it returns.
+    """
+    if getattr(endpoint, "_releases_db_sessions", False):
+        # include_router() re-registers routes with the already-wrapped endpoint
+        return endpoint
+
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            result = await endpoint(*args, **kwargs)
+            for value in kwargs.values():
+                if isinstance(value, LazySession):
+                    value.release()
+                elif isinstance(value, AsyncSession):
+                    await release_async_session(value)
+            return result
+    else:
+        @functools.wraps(endpoint)
+        def wrapper(*args, **kwargs):
+            result = endpoint(*args, **kwargs)
+            for value in kwargs.values():
+                if isinstance(value, LazySession):
+                    value.release()
+            return result
+
+    wrapper._releases_db_sessions = True
+    return wrapper
+
+
+class DBSessionRoute(APIRoute):
+    """
+    Route class for all v1 routers.
+
+    Yield-dependency teardown (session.close) runs only after the response
+    has been sent, so a plain `get_db` holds its pooled connection through
+    response serialization and the network write. This route releases the
+    endpoint's sessions right after it returns, before serialization.
+
+    It also serves endpoints marked with `@cache_response` from the
+    response cache (see app.utils.response_cache).
+    """
+
+    def __init__(self, path, endpoint, **kwargs):
+        super().__init__(path, _release_db_sessions_after(endpoint), **kwargs)
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+        # Endpoints marked with @cache_response are served from the response cache
+        policy = getattr(self.endpoint, "_response_cache", None)
+        if policy is not None:
+            handler = cached_route_handler(handler, policy)
+        return handler
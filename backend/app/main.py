@@ -1,10 +1,15 @@
 # backend/app/main.py
 
+from contextlib import asynccontextmanager
+import logging
+
 from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 import time
 
 from .config import get_settings
+from .utils.query_stats import start_request_stats
 
 # Routers
 from .api.v1.auth import router as auth_router
@@ -17,8 +22,22 @@ from .api.v1 import testimonials
 from .api.v1 import subscribers
 from app.api.v1 import api_v1_router
 from app.api.v1.stats import router as stats_router
+from app.services.search_index import rebuild_search_index
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm the public search index; if the DB isn't reachable yet the
+    # first search builds it instead.
+    try:
+        await run_in_threadpool(rebuild_search_index)
+    except Exception:
+        logger.exception("Search index build at startup failed")
+    yield
+
 
 # -----------------------------------------------------
 # FastAPI Application
@@ -28,6 +47,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # -----------------------------------------------------
@@ -51,6 +71,7 @@ app.add_middleware(
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     start_time = time.time()
+    query_stats = start_request_stats()
 
     response = await call_next(request)
 
@@ -59,7 +80,13 @@ async def log_requests(request: Request, call_next):
     url = request.url.path
     status = response.status_code
 
-    print(f"{method} {url} → {status} [{duration}ms]")
+    # DB statements + time spent in them (visible in browser devtools)
+    response.headers.append("Server-Timing", query_stats.server_timing())
+
+    print(
+        f"{method} {url} → {status} [{duration}ms] "
+        f"[{query_stats.count} queries, {query_stats.total_ms:.2f}ms db]"
+    )
 
     return response
 
@@ -6,6 +6,8 @@ from .media import Media
 
 from .campaign import Campaign, CampaignStatus  
 from .donation import Donation, DonationStatus
+from .donation_rollup import DonationDailyRollup
+from .webhook_event import WebhookEvent
 
 
 __all__ = ["User", "Service", "Project", "Inquiry", "Media"]
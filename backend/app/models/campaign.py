@@ -15,7 +15,7 @@ from sqlalchemy import (
     Text,
     Enum as SAEnum,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from .types import UUID
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -10,12 +10,13 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     Enum as SAEnum,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from .types import UUID
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -30,6 +31,13 @@ class DonationStatus(str, Enum):
 
 class Donation(Base):
     __tablename__ = "donations"
+    __table_args__ = (
+        # Keyset pagination for the admin list: (created_at, id) newest first,
+        # optionally narrowed by status or campaign.
+        Index("ix_donations_created_at_id", "created_at", "id"),
+        Index("ix_donations_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_donations_campaign_created_at_id", "campaign_id", "created_at", "id"),
+    )
 
     id = Column(
         UUID(as_uuid=True),
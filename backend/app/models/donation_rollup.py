@@ -0,0 +1,45 @@
+# app/models/donation_rollup.py
+from __future__ import annotations
+
+from uuid import UUID as PyUUID
+
+from sqlalchemy import BigInteger, Column, Date, Index, Integer, LargeBinary, String
+
+from app.database import Base
+from .types import UUID
+
+# Key parts can't be NULL (they form the primary key): donations without a
+# campaign roll up under this id, and a missing payment method as "".
+GENERAL_FUND_ID = PyUUID(int=0)
+
+
+class DonationDailyRollup(Base):
+    """
+    Confirmed donations per (UTC day of created_at, campaign, currency,
+    payment method). Maintained in the same transaction as every status
+    change into or out of CONFIRMED (app.services.donation_rollups);
+    rebuilt from the donations table with
+    `python -m app.scripts.rebuild_donation_rollups`.
+    """
+
+    __tablename__ = "donation_daily_rollups"
+    __table_args__ = (
+        # Top campaigns (all time)
+        Index("ix_donation_daily_rollups_campaign", "campaign_id"),
+    )
+
+    day = Column(Date, primary_key=True)
+    campaign_id = Column(UUID(as_uuid=True), primary_key=True)
+    currency = Column(String(3), primary_key=True)
+    payment_method = Column(String(50), primary_key=True)
+
+    amount_total = Column(BigInteger, nullable=False, default=0)
+    donation_count = Column(Integer, nullable=False, default=0)
+    # app.utils.hll.HyperLogLog of the donors' e-mails
+    donor_sketch = Column(LargeBinary, nullable=False)
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return (
+            f"<DonationDailyRollup {self.day} {self.campaign_id} "
+            f"{self.amount_total}{self.currency} x{self.donation_count}>"
+        )
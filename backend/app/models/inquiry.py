@@ -12,7 +12,7 @@ from sqlalchemy import (
     func,
     Index,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from .types import UUID, TSVector, search_vector
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..database import Base
@@ -33,6 +33,12 @@ class Inquiry(Base):
         Index("ix_inquiries_status", "status"),
         Index("ix_inquiries_created_at", "created_at"),
         Index("ix_inquiries_assigned_to_id", "assigned_to_id"),
+        # Keyset pagination / export order, optionally narrowed by status
+        Index("ix_inquiries_created_at_id", "created_at", "id"),
+        Index("ix_inquiries_status_created_at_id", "status", "created_at", "id"),
+        # Full-text search. The trigram index on email (partial matches) is
+        # created by migration only, since it needs the pg_trgm extension.
+        Index("ix_inquiries_search_vector", "search_vector", postgresql_using="gin"),
     )
 
 
@@ -114,6 +120,16 @@ class Inquiry(Base):
         nullable=True,
     )
 
+    # Generated by the database; deferred so list queries don't load it
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVector,
+        search_vector(
+            "english",
+            {"full_name": "A", "email": "A", "message": "B", "location": "C"},
+        ),
+        deferred=True,
+    )
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
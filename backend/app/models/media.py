@@ -13,7 +13,7 @@ from sqlalchemy import (
     func,
     Index,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from .types import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..database import Base
@@ -15,9 +15,8 @@ from sqlalchemy import (
     ForeignKey,
     func,
     Index,
-    ARRAY,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from .types import UUID, StringArray
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..database import Base
@@ -78,7 +77,7 @@ class Project(Base):
     # ---------------------------------------------------------
     thumbnail: Mapped[str | None] = mapped_column(String(500), nullable=True)
     type: Mapped[str | None] = mapped_column(String(255), nullable=True)
-    technologies: Mapped[list[str] | None] = mapped_column(ARRAY(String), nullable=True)
+    technologies: Mapped[list[str] | None] = mapped_column(StringArray, nullable=True)
     size: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     # ---------------------------------------------------------
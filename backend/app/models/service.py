@@ -3,7 +3,7 @@ import uuid
 from datetime import datetime
 
 from sqlalchemy import String, Boolean, Integer, Text, DateTime, func, Index
-from sqlalchemy.dialects.postgresql import UUID
+from .types import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..database import Base
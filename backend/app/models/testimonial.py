@@ -11,7 +11,7 @@ from sqlalchemy import (
     func,
     Index,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from .types import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -0,0 +1,84 @@
+# backend/app/models/types.py
+"""
+Portable column types.
+
+Native Postgres types in production, plain equivalents elsewhere (SQLite
+for the fast test mode, see conftest.py):
+
+    UUID        → UUID on Postgres, CHAR(32) elsewhere
+    StringArray → VARCHAR[] on Postgres, JSON list elsewhere
+    TSVector    → TSVECTOR on Postgres, TEXT elsewhere (see search_vector)
+
+`func.now()` server defaults are also compiled for SQLite so they store
+timestamps in the same text format SQLAlchemy binds datetimes with.
+"""
+from sqlalchemy import JSON, Computed, String, Text, Uuid
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import functions
+from sqlalchemy.types import TypeDecorator
+
+
+class UUID(Uuid):
+    """Drop-in for `postgresql.UUID(as_uuid=True)` that also works on SQLite."""
+
+    cache_ok = True
+
+
+class StringArray(TypeDecorator):
+    """List of strings: ARRAY(String) on Postgres, JSON on other dialects."""
+
+    impl = JSON
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(ARRAY(String))
+        return dialect.type_descriptor(JSON())
+
+
+@compiles(functions.now, "sqlite")
+def _sqlite_now(element, compiler, **kw):
+    # CURRENT_TIMESTAMP has no fractional part ("... 10:00:00"), which sorts
+    # before the bound "... 10:00:00.000000" and breaks (created_at, id)
+    # keyset comparisons. Match SQLAlchemy's "%Y-%m-%d %H:%M:%S.%f" instead.
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+class TSVector(TypeDecorator):
+    """Full-text document: TSVECTOR on Postgres, TEXT on other dialects."""
+
+    impl = Text
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(TSVECTOR())
+        return dialect.type_descriptor(Text())
+
+
+def search_vector(config: str, weighted: dict[str, str]) -> Computed:
+    """
+    Generated-column expression for a TSVector column.
+
+    `weighted` maps column name → weight ("A".."D"). On Postgres this is
+    `setweight(to_tsvector(config, coalesce(col, '')), w) || ...`. Other
+    dialects get a lower-cased concatenation of the same columns, which
+    the search code matches with LIKE.
+    """
+    pg = " || ".join(
+        f"setweight(to_tsvector('{config}', coalesce({col}, '')), '{weight}')"
+        for col, weight in weighted.items()
+    )
+    plain = " || ' ' || ".join(f"lower(coalesce({col}, ''))" for col in weighted)
+    computed = Computed(pg, persisted=True)
+    computed.info = {"portable_sqltext": plain}
+    return computed
+
+
+@compiles(Computed, "sqlite")
+def _sqlite_computed(element, compiler, **kw):
+    sqltext = getattr(element, "info", {}).get("portable_sqltext")
+    if sqltext is None:
+        return compiler.visit_computed_column(element, **kw)
+    return f"GENERATED ALWAYS AS ({sqltext}) STORED"
@@ -3,8 +3,8 @@ import uuid
 from datetime import datetime
 from enum import Enum as PyEnum  # 👈 add
 
-from sqlalchemy import String, Boolean, DateTime, func, Enum  # 👈 add Enum
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import String, Boolean, DateTime, Integer, func, Enum  # 👈 add Enum
+from .types import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ..database import Base
@@ -60,6 +60,15 @@ class User(Base):
         nullable=False,
     )
 
+    # Bumped on role change / deactivation; tokens carry it as `ver`, so
+    # claims-mode auth can reject old tokens without loading the user.
+    token_version: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -0,0 +1,42 @@
+# app/models/webhook_event.py
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, String, Text
+
+from app.database import Base
+from .types import UUID
+
+
+class WebhookEvent(Base):
+    """
+    Payment webhook deliveries that were applied, one row per provider
+    event. Written in the same transaction as the donation update, so a
+    retried delivery is answered from `outcome` without touching the
+    donation (see app.services.webhook_events).
+    """
+
+    __tablename__ = "webhook_events"
+
+    # "<provider>:<event id>" ("id-sha256:<hex>" of that when it's longer
+    # than the column), or "sha256:<hex of the raw body>" when the payload
+    # carries no event id
+    event_key = Column(String(200), primary_key=True)
+
+    provider = Column(String(50), nullable=True)
+    event_type = Column(String(100), nullable=True)
+    payload = Column(Text, nullable=False)  # raw body, as signed
+
+    donation_id = Column(UUID(as_uuid=True), nullable=True)
+    # The JSON response returned for this event (replayed for duplicates)
+    outcome = Column(JSON, nullable=False)
+
+    received_at = Column(
+        DateTime(timezone=True),
+        default=datetime.utcnow,
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<WebhookEvent {self.event_key} {self.outcome}>"
@@ -5,7 +5,7 @@ from datetime import datetime, date
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, computed_field
 
 from app.models.campaign import CampaignStatus
 
@@ -54,12 +54,22 @@ class CampaignPublic(CampaignBase):
     id: UUID
     status: CampaignStatus
     is_featured: bool
+    # Confirmed donations in the campaign currency, kept current by the
+    # payment webhook (see app.services.donation_rollups)
     raised_amount: int
     created_at: datetime
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
 
+    @computed_field
+    @property
+    def progress_percent(self) -> Optional[float]:
+        """raised_amount as a percentage of target_amount (may exceed 100)."""
+        if not self.target_amount:
+            return None
+        return round(self.raised_amount * 100 / self.target_amount, 1)
+
 
 class CampaignAdmin(CampaignPublic):
     # Reserved for any admin-only fields later (e.g. internal notes)
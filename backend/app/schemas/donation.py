@@ -1,8 +1,8 @@
 # app/schemas/donation.py
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, EmailStr
@@ -80,3 +80,26 @@ class DonationIntentResponse(BaseModel):
     donation: DonationPublic
     payment_url: Optional[str] = None
     provider_session_id: Optional[str] = None
+
+
+class DonationSeriesPoint(BaseModel):
+    period_start: date
+    amount: int
+    count: int
+    donors: int  # unique donor e-mails, estimated
+
+
+class DonationSeries(BaseModel):
+    key: Optional[str] = None  # campaign id / payment method; None: general fund / unspecified
+    label: str
+    currency: str
+    points: list[DonationSeriesPoint]
+
+
+class DonationSeriesOut(BaseModel):
+    """Confirmed donations per day / ISO week / month, one series per group and currency."""
+    bucket: Literal["day", "week", "month"]
+    group_by: Literal["none", "campaign", "payment_method"]
+    start: date
+    end: date
+    series: list[DonationSeries]
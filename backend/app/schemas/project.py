@@ -136,7 +136,8 @@ class ProjectOut(ProjectBase):
 class ProjectListOut(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
-    total: int
+    total: int | None = None        # None when requested with total=none
+    total_estimated: bool = False   # True for total=estimate (planner stats)
     page: int
     limit: int
     items: list[ProjectBrief]
@@ -0,0 +1,22 @@
+# app/schemas/search.py
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class SearchHitOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    type: Literal["project", "service", "campaign"]
+    id: UUID
+    slug: str
+    title: str
+    snippet: str  # HTML-escaped text, matches wrapped in <mark>
+    score: float
+
+
+class SearchResults(BaseModel):
+    query: str
+    total: int  # all matches; `hits` holds the top `limit`
+    hits: list[SearchHitOut]
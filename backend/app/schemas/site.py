@@ -0,0 +1,18 @@
+# app/schemas/site.py
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from app.schemas.campaign import CampaignPublic
+from app.schemas.project import ProjectBrief
+from app.schemas.service import ServiceOut
+from app.schemas.testimonial import TestimonialOut
+
+
+class HomeBundle(BaseModel):
+    """Everything the public homepage needs, in one response."""
+    services: list[ServiceOut]
+    featured_projects: list[ProjectBrief]
+    featured_testimonials: list[TestimonialOut]
+    featured_campaigns: list[CampaignPublic]
+    generated_at: datetime
@@ -0,0 +1,29 @@
+# app/scripts/rebuild_donation_rollups.py
+"""
+Recompute donation_daily_rollups from the donations table.
+
+Run once after the migration that creates the table (backfill), and any
+time donations were changed outside the webhook / donation service paths:
+
+    python -m app.scripts.rebuild_donation_rollups
+"""
+
+from app.database import SessionLocal
+from app.services.donation_rollups import rebuild_rollups
+
+
+def main():
+    db = SessionLocal()
+    try:
+        rows = rebuild_rollups(db)
+        db.commit()
+        print(f"✅ Rebuilt donation rollups: {rows} day/campaign/currency/method rows.")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
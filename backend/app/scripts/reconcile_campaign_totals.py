@@ -0,0 +1,29 @@
+# app/scripts/reconcile_campaign_totals.py
+"""
+Recompute Campaign.raised_amount from the confirmed donations.
+
+The payment webhook keeps raised_amount current; run this after importing
+or editing donations directly, or to check for drift:
+
+    python -m app.scripts.reconcile_campaign_totals
+"""
+
+from app.database import SessionLocal
+from app.services.donation_rollups import reconcile_raised_amounts
+
+
+def main():
+    db = SessionLocal()
+    try:
+        fixed = reconcile_raised_amounts(db)
+        db.commit()
+        print(f"✅ Reconciled campaign totals: {fixed} campaign(s) corrected.")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,16 @@ from datetime import timedelta
 from typing import Optional
 from uuid import UUID
 
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.models.user import User, UserRole
 from app.schemas.user import UserCreate
-from app.utils.hashing import hash_password, verify_password
+from app.services.write_service import commit_keep_loaded
+from app.utils.hashing import hash_password, verify_and_update_async, verify_password
 from app.utils.jwt_handler import create_access_token
+from app.utils.principal_cache import invalidate_user
+from app.utils.token_revocation import remember as remember_token_version
 
 def get_user_by_email(db: Session, email: str) -> User | None:
     return db.query(User).filter(User.email == email).first()
@@ -44,6 +48,8 @@ def create_user(
         if user_in.full_name is not None:
             existing.full_name = user_in.full_name
 
+        before = (existing.role, existing.is_active, existing.is_superuser)
+
         existing.hashed_password = hash_password(user_in.password)
         existing.is_active = getattr(user_in, "is_active", existing.is_active)
         existing.is_superuser = (
@@ -53,8 +59,13 @@ def create_user(
         )
         existing.role = role
 
+        if before != (existing.role, existing.is_active, existing.is_superuser):
+            bump_token_version(existing)
+
         db.commit()
         db.refresh(existing)
+        invalidate_user(existing)
+        remember_token_version(existing)
         return existing
 
     # CREATE path
@@ -73,8 +84,17 @@ def create_user(
     db.add(user)
     db.commit()
     db.refresh(user)
+    invalidate_user(user)
     return user
 
+def bump_token_version(user: User) -> None:
+    """
+    Invalidate every token issued to `user` (role change, deactivation).
+    Call before commit; call `remember_token_version` after it.
+    """
+    user.token_version = (user.token_version or 0) + 1
+
+
 def authenticate_user(db: Session, email: str, password: str) -> User | None:
     """
     Look up a user by email and verify the password.
@@ -93,6 +113,31 @@ def authenticate_user(db: Session, email: str, password: str) -> User | None:
     return user
 
 
+async def authenticate_user_async(db: Session, email: str, password: str) -> User | None:
+    """
+    `authenticate_user` for async handlers: the lookup runs on the request
+    threadpool, bcrypt on the bounded hashing pool (may raise
+    PasswordHashingBusy). A hash made with outdated settings (e.g. an old
+    bcrypt cost) is replaced on successful login.
+    """
+    user = await run_in_threadpool(get_user_by_email, db, email)
+    if user is None:
+        return None
+
+    verified, new_hash = await verify_and_update_async(password, user.hashed_password)
+    if not verified:
+        return None
+
+    if not user.is_active:
+        return None
+
+    if new_hash is not None:
+        user.hashed_password = new_hash
+        await run_in_threadpool(commit_keep_loaded, db)
+
+    return user
+
+
 def create_login_token(
     user: User,
     expires_delta: Optional[timedelta] = None,
@@ -105,6 +150,7 @@ def create_login_token(
         "email": user.email,
         "role": user.role.value if isinstance(user.role, UserRole) else user.role,
         "is_superuser": user.is_superuser,
+        "ver": user.token_version or 0,
     }
 
     return create_access_token(payload)
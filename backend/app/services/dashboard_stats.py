@@ -0,0 +1,109 @@
+# app/services/dashboard_stats.py
+"""
+Dashboard counters, one round trip per endpoint.
+
+  - `entity_counts`:   row counts of the content tables, as scalar
+                       subqueries of a single SELECT (GET /stats/)
+  - `project_counts`:  total / per-status / featured projects in one scan,
+                       using COUNT(*) FILTER (WHERE ...) (GET /projects/stats)
+  - `inquiry_counts`:  inquiries GROUP BY status; total and "open" are
+                       summed from the groups (GET /inquiries/stats)
+
+The statements are built once at import; they take no parameters, so the
+compiled SQL is reused from the engine's cache on every request.
+"""
+from __future__ import annotations
+
+from sqlalchemy import String, cast, func, select
+from sqlalchemy.orm import Session
+
+from app.models.inquiry import Inquiry, InquiryStatus
+from app.models.project import Project, ProjectStatus
+from app.models.service import Service
+from app.models.subscriber import Subscriber
+from app.models.testimonial import Testimonial
+
+# ---------------------------------------------------------
+# Admin dashboard: content table sizes
+# ---------------------------------------------------------
+_ENTITY_MODELS = {
+    "services": Service,
+    "projects": Project,
+    "inquiries": Inquiry,
+    "testimonials": Testimonial,
+    "subscribers": Subscriber,
+}
+
+_ENTITY_COUNTS = select(
+    *(
+        select(func.count()).select_from(model).scalar_subquery().label(name)
+        for name, model in _ENTITY_MODELS.items()
+    )
+)
+
+
+def entity_counts(db: Session) -> dict[str, int]:
+    return dict(db.execute(_ENTITY_COUNTS).one()._mapping)
+
+
+# ---------------------------------------------------------
+# Projects
+# ---------------------------------------------------------
+_PROJECT_STATUS_KEYS = {
+    "completed": ProjectStatus.COMPLETED,
+    "ongoing": ProjectStatus.ONGOING,
+    "planned": ProjectStatus.PLANNED,
+    "on_hold": ProjectStatus.ON_HOLD,
+}
+
+_PROJECT_COUNTS = select(
+    func.count().label("total"),
+    *(
+        func.count().filter(Project.status == status).label(key)
+        for key, status in _PROJECT_STATUS_KEYS.items()
+    ),
+    func.count().filter(Project.is_featured.is_(True)).label("featured"),
+).select_from(Project)
+
+
+def project_counts(db: Session) -> dict[str, int]:
+    return dict(db.execute(_PROJECT_COUNTS).one()._mapping)
+
+
+# ---------------------------------------------------------
+# Inquiries
+# ---------------------------------------------------------
+# Group on the column itself (index-only scan of ix_inquiries_status) but
+# read each group's label as text: a label the Python enum doesn't know
+# (e.g. added by a migration ahead of this code) is then still counted in
+# the total instead of failing the whole request.
+_INQUIRY_COUNTS = (
+    select(cast(Inquiry.status, String), func.count())
+    .group_by(Inquiry.status)
+)
+
+_STATUS_BY_LABEL = {
+    **{status.value: status for status in InquiryStatus},
+    **{status.name: status for status in InquiryStatus},
+}
+_CLOSED_STATUSES = {InquiryStatus.CLOSED}
+
+
+def inquiry_counts(db: Session) -> dict:
+    by_status = {status.value: 0 for status in InquiryStatus}
+    total = open_count = 0
+    for label, count in db.execute(_INQUIRY_COUNTS):
+        total += count
+        status = _STATUS_BY_LABEL.get(label)
+        if status is None:
+            continue
+        by_status[status.value] += count
+        if status not in _CLOSED_STATUSES:
+            open_count += count
+
+    return {
+        "total": total,
+        "open": open_count,
+        "new": by_status[InquiryStatus.NEW.value],
+        "by_status": by_status,
+    }
@@ -0,0 +1,306 @@
+# app/services/donation_rollups.py
+"""
+Maintenance and reads of the donation aggregates: `donation_daily_rollups`
+and `Campaign.raised_amount`.
+
+Every status change of a donation goes through `record_status_change`
+before the caller commits, so the aggregates move in the same transaction
+as the donation. For the daily rollups:
+
+  - into CONFIRMED: upsert the bucket (amount/count added atomically in
+    the ON CONFLICT clause) and add the donor to its sketch;
+  - out of CONFIRMED (refund, failure after confirmation): subtract, and
+    rebuild that one bucket's sketch from its remaining confirmed
+    donations (sketches can't remove a value), or drop the bucket when it
+    is empty.
+
+The upsert row-locks the bucket until commit, so concurrent confirmations
+for the same bucket serialize on the sketch read-modify-write. Callers
+lock the donation row before reading its old status (see
+`payment_provider_service.apply_webhook_to_donation`), so a duplicate
+webhook can't count a donation twice.
+
+The campaign's `raised_amount` gets `+/- amount` in a single atomic
+UPDATE (only donations in the campaign's own currency count toward it);
+`updated_at` is left as is, since the campaign itself wasn't edited.
+
+`rebuild_rollups` and `reconcile_raised_amounts` recompute both from the
+donations (backfill, or after rows were changed outside these code paths).
+"""
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta, timezone
+
+from sqlalchemy import delete, func, insert, select, text, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.campaign import Campaign
+from app.models.donation import Donation, DonationStatus
+from app.models.donation_rollup import GENERAL_FUND_ID, DonationDailyRollup
+from app.services.donation_series import note_day_changed, note_rebuilt
+from app.utils.hll import HyperLogLog
+from app.utils.response_cache import note_changed
+
+Rollup = DonationDailyRollup
+_DIALECT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+# ---------------------------------------------------------
+# Buckets
+# ---------------------------------------------------------
+def _utc_day(value: datetime) -> date:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.date()
+
+
+def _donor(email: str | None) -> str | None:
+    return email.strip().lower() if email else None
+
+
+def bucket_key(donation: Donation) -> dict:
+    return {
+        "day": _utc_day(donation.created_at),
+        "campaign_id": donation.campaign_id or GENERAL_FUND_ID,
+        "currency": donation.currency,
+        "payment_method": donation.payment_method or "",
+    }
+
+
+def _bucket_where(key: dict) -> tuple:
+    return tuple(getattr(Rollup, column) == value for column, value in key.items())
+
+
+def _bucket_donations(key: dict):
+    """Confirmed donations falling into the bucket `key`."""
+    day_start = datetime.combine(key["day"], time(), tzinfo=timezone.utc)
+    stmt = select(Donation.donor_email).where(
+        Donation.status == DonationStatus.CONFIRMED,
+        Donation.created_at >= day_start,
+        Donation.created_at < day_start + timedelta(days=1),
+        Donation.currency == key["currency"],
+    )
+    if key["campaign_id"] == GENERAL_FUND_ID:
+        stmt = stmt.where(Donation.campaign_id.is_(None))
+    else:
+        stmt = stmt.where(Donation.campaign_id == key["campaign_id"])
+    if key["payment_method"]:
+        stmt = stmt.where(Donation.payment_method == key["payment_method"])
+    else:
+        stmt = stmt.where(
+            (Donation.payment_method.is_(None)) | (Donation.payment_method == "")
+        )
+    return stmt
+
+
+# ---------------------------------------------------------
+# Incremental maintenance (inside the caller's transaction)
+# ---------------------------------------------------------
+def _add(db: Session, donation: Donation) -> None:
+    key = bucket_key(donation)
+    donor = _donor(donation.donor_email)
+    sketch = HyperLogLog.of([donor] if donor else [])
+
+    dialect_insert = _DIALECT_INSERTS[db.get_bind().dialect.name]
+    stmt = dialect_insert(Rollup).values(
+        **key,
+        amount_total=donation.amount,
+        donation_count=1,
+        donor_sketch=sketch.to_bytes(),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(key),
+        set_={
+            "amount_total": Rollup.amount_total + stmt.excluded.amount_total,
+            "donation_count": Rollup.donation_count + 1,
+        },
+    ).returning(Rollup.donation_count, Rollup.donor_sketch)
+    count, stored = db.execute(stmt).one()
+
+    if count > 1 and donor:
+        # Existing bucket: fold the donor into its sketch (the row is locked)
+        sketch = HyperLogLog(stored)
+        if sketch.add(donor):
+            db.execute(
+                update(Rollup).where(*_bucket_where(key)).values(donor_sketch=sketch.to_bytes())
+            )
+
+
+def _remove(db: Session, donation: Donation) -> None:
+    key = bucket_key(donation)
+    count = db.execute(
+        update(Rollup)
+        .where(*_bucket_where(key))
+        .values(
+            amount_total=Rollup.amount_total - donation.amount,
+            donation_count=Rollup.donation_count - 1,
+        )
+        .returning(Rollup.donation_count)
+    ).scalar_one_or_none()
+    if count is None:
+        return  # bucket never recorded (donation predates the rollups)
+
+    if count <= 0:
+        db.execute(delete(Rollup).where(*_bucket_where(key)))
+        return
+
+    # The donation's new status is already flushed, so it's excluded here
+    donors = (_donor(email) for email in db.scalars(_bucket_donations(key)))
+    sketch = HyperLogLog.of(d for d in donors if d)
+    db.execute(
+        update(Rollup).where(*_bucket_where(key)).values(donor_sketch=sketch.to_bytes())
+    )
+
+
+def _adjust_raised_amount(db: Session, donation: Donation, delta: int) -> None:
+    if donation.campaign_id is None:
+        return
+    db.execute(
+        update(Campaign)
+        .where(Campaign.id == donation.campaign_id, Campaign.currency == donation.currency)
+        # A counter, not an edit: leave updated_at (onupdate) alone
+        .values(raised_amount=Campaign.raised_amount + delta, updated_at=Campaign.updated_at)
+        .execution_options(synchronize_session=False, notes_written_rows=True)
+    )
+    # Bump the campaigns generation (cached responses show raised_amount)
+    # without naming the row: nothing indexed for search changed, and the
+    # homepage snapshot is rebuilt by the next request rather than after
+    # every webhook
+    note_changed(db, Campaign.__tablename__)
+
+
+def record_status_change(
+    db: Session,
+    donation: Donation,
+    old_status: DonationStatus | None,
+) -> None:
+    """
+    Apply a donation's status change (already set on `donation`) to the
+    rollups. Call before committing; no-op unless CONFIRMED is entered or left.
+    """
+    was_confirmed = old_status == DonationStatus.CONFIRMED
+    is_confirmed = donation.status == DonationStatus.CONFIRMED
+    if was_confirmed == is_confirmed:
+        return
+    db.flush()  # sessions don't autoflush; the bucket queries must see the change
+    if is_confirmed:
+        _add(db, donation)
+        _adjust_raised_amount(db, donation, donation.amount)
+    else:
+        _remove(db, donation)
+        _adjust_raised_amount(db, donation, -donation.amount)
+    note_day_changed(db, bucket_key(donation)["day"])
+
+
+# ---------------------------------------------------------
+# Backfill
+# ---------------------------------------------------------
+def rebuild_rollups(db: Session, *, batch_size: int = 1000) -> int:
+    """
+    Recompute every rollup row from the confirmed donations, in the
+    caller's transaction (commit afterwards). Returns the number of rows.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        # Webhooks wait on their rollup upsert until this commits, and any
+        # confirmation committed before we got the lock is read below
+        db.execute(text("LOCK TABLE donation_daily_rollups IN EXCLUSIVE MODE"))
+
+    buckets: dict[tuple, list] = {}
+    confirmed = db.execute(
+        select(
+            Donation.created_at,
+            Donation.campaign_id,
+            Donation.currency,
+            Donation.payment_method,
+            Donation.amount,
+            Donation.donor_email,
+        ).where(Donation.status == DonationStatus.CONFIRMED),
+        execution_options={"yield_per": batch_size},
+    )
+    for row in confirmed:
+        key = tuple(bucket_key(row).values())
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = [0, 0, HyperLogLog()]
+        bucket[0] += row.amount
+        bucket[1] += 1
+        if donor := _donor(row.donor_email):
+            bucket[2].add(donor)
+
+    db.execute(delete(Rollup))
+    note_rebuilt(db)
+    if buckets:
+        db.execute(
+            insert(Rollup),
+            [
+                {
+                    "day": day,
+                    "campaign_id": campaign_id,
+                    "currency": currency,
+                    "payment_method": payment_method,
+                    "amount_total": amount,
+                    "donation_count": count,
+                    "donor_sketch": sketch.to_bytes(),
+                }
+                for (day, campaign_id, currency, payment_method), (amount, count, sketch)
+                in buckets.items()
+            ],
+        )
+    return len(buckets)
+
+
+def reconcile_raised_amounts(db: Session) -> int:
+    """
+    Set every campaign's raised_amount to the sum of its confirmed
+    donations in its currency, in the caller's transaction (commit
+    afterwards). Returns the number of campaigns that were off.
+    """
+    confirmed_total = (
+        select(func.coalesce(func.sum(Donation.amount), 0))
+        .where(
+            Donation.campaign_id == Campaign.id,
+            Donation.currency == Campaign.currency,
+            Donation.status == DonationStatus.CONFIRMED,
+        )
+        .scalar_subquery()
+    )
+    result = db.execute(
+        update(Campaign)
+        .where(Campaign.raised_amount != confirmed_total)
+        .values(raised_amount=confirmed_total)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+# ---------------------------------------------------------
+# Reads
+# ---------------------------------------------------------
+def period_totals(db: Session, start: date, end: date) -> tuple[int, int]:
+    """(amount donated, estimated unique donors) for days in [start, end]."""
+    rows = db.execute(
+        select(Rollup.amount_total, Rollup.donor_sketch).where(
+            Rollup.day >= start, Rollup.day <= end
+        )
+    )
+    amount, donors = 0, HyperLogLog()
+    for row_amount, row_sketch in rows:
+        amount += row_amount
+        donors.merge(row_sketch)
+    return amount, donors.count()
+
+
+def top_campaign(db: Session) -> dict | None:
+    """The campaign with the largest confirmed total (all time)."""
+    total = func.sum(Rollup.amount_total)
+    row = db.execute(
+        select(Campaign.id, Campaign.name, total.label("total_amount"))
+        .join(Rollup, Rollup.campaign_id == Campaign.id)
+        .group_by(Campaign.id, Campaign.name)
+        .order_by(total.desc())
+        .limit(1)
+    ).first()
+    if row is None:
+        return None
+    return {"id": row.id, "name": row.name, "total_amount": int(row.total_amount or 0)}
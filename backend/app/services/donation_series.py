@@ -0,0 +1,260 @@
+# app/services/donation_series.py
+"""
+Donation time series for the admin charts (GET /stats/donations/series),
+served from `donation_daily_rollups`.
+
+A series request covers a run of periods (days, ISO weeks or calendar
+months). Each period's aggregate is cached on its own, under a key that
+includes two generations:
+
+  - `donation_rollups:{bucket}:{period start}`, bumped by every commit
+    that changes a rollup day inside that period (see `note_day_changed`,
+    called from `donation_rollups.record_status_change`);
+  - `donation_rollups`, bumped by a full rebuild.
+
+So a closed period stays cached until a refund or late confirmation
+actually changes it, the current period is recomputed only after new
+donations, and a request reads rollup rows only for the periods that
+missed the cache — in one query, on the primary (a lagging replica would
+cache pre-commit rows under the new generation).
+
+The generations only reach other workers through a shared backend
+(Redis). Entries therefore keep the long SERIES_CACHE_TTL only for closed
+periods on a shared backend. The open period, and every period on the
+in-process backend, expire after the response cache TTL: that bounds how
+long another worker's donations can go unseen.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Literal
+from uuid import UUID
+
+import orjson
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.database import primary_reads
+from app.models.campaign import Campaign
+from app.models.donation_rollup import GENERAL_FUND_ID, DonationDailyRollup
+from app.utils.hll import HyperLogLog
+from app.utils.response_cache import get_cache_backend, note_changed
+
+Bucket = Literal["day", "week", "month"]
+GroupBy = Literal["none", "campaign", "payment_method"]
+
+BUCKETS: tuple[Bucket, ...] = ("day", "week", "month")
+REBUILD_GENERATION = "donation_rollups"
+SERIES_CACHE_TTL = 24 * 3600  # seconds; closed periods, shared backend only
+MAX_PERIODS = 400
+
+
+# ---------------------------------------------------------
+# Periods
+# ---------------------------------------------------------
+def period_start(day: date, bucket: Bucket) -> date:
+    if bucket == "week":
+        return day - timedelta(days=day.weekday())  # ISO week, Monday
+    if bucket == "month":
+        return day.replace(day=1)
+    return day
+
+
+def next_period(start: date, bucket: Bucket) -> date:
+    if bucket == "week":
+        return start + timedelta(days=7)
+    if bucket == "month":
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def periods(start: date, end: date, bucket: Bucket) -> list[date]:
+    """Starts of the periods overlapping [start, end] (ValueError past MAX_PERIODS)."""
+    out, current = [], period_start(start, bucket)
+    while current <= end:
+        if len(out) == MAX_PERIODS:
+            raise ValueError(f"Too many {bucket} buckets (max {MAX_PERIODS}); narrow the range.")
+        out.append(current)
+        current = next_period(current, bucket)
+    return out
+
+
+def _generation_name(bucket: Bucket, start: date) -> str:
+    return f"{REBUILD_GENERATION}:{bucket}:{start.isoformat()}"
+
+
+def note_day_changed(db: Session, day: date) -> None:
+    """Invalidate the cached periods (of every bucket size) containing `day`."""
+    for bucket in BUCKETS:
+        note_changed(db, _generation_name(bucket, period_start(day, bucket)))
+
+
+def note_rebuilt(db: Session) -> None:
+    note_changed(db, REBUILD_GENERATION)
+
+
+# ---------------------------------------------------------
+# Aggregation
+# ---------------------------------------------------------
+@dataclass
+class _Cell:
+    amount: int = 0
+    count: int = 0
+    donors: HyperLogLog = field(default_factory=HyperLogLog)
+
+
+def _group_key(row, group_by: GroupBy) -> str:
+    if group_by == "campaign":
+        return "" if row.campaign_id == GENERAL_FUND_ID else str(row.campaign_id)
+    if group_by == "payment_method":
+        return row.payment_method
+    return ""
+
+
+def _aggregate(
+    db: Session,
+    starts: list[date],
+    bucket: Bucket,
+    group_by: GroupBy,
+) -> dict[date, list]:
+    """
+    period start → [[group key, currency, amount, count, donors], ...] for
+    `starts`, from the rollup rows of the days they cover.
+    """
+    cells: dict[date, dict[tuple[str, str], _Cell]] = {start: {} for start in starts}
+    rows = db.execute(
+        select(
+            DonationDailyRollup.day,
+            DonationDailyRollup.campaign_id,
+            DonationDailyRollup.currency,
+            DonationDailyRollup.payment_method,
+            DonationDailyRollup.amount_total,
+            DonationDailyRollup.donation_count,
+            DonationDailyRollup.donor_sketch,
+        ).where(
+            DonationDailyRollup.day >= starts[0],
+            DonationDailyRollup.day < next_period(starts[-1], bucket),
+        )
+    )
+    for row in rows:
+        period = cells.get(period_start(row.day, bucket))
+        if period is None:
+            continue  # between two requested periods that were cached
+        key = (_group_key(row, group_by), row.currency)
+        cell = period.get(key)
+        if cell is None:
+            cell = period[key] = _Cell()
+        cell.amount += row.amount_total
+        cell.count += row.donation_count
+        cell.donors.merge(row.donor_sketch)
+
+    return {
+        start: [
+            [group, currency, cell.amount, cell.count, cell.donors.count()]
+            for (group, currency), cell in sorted(period.items())
+        ]
+        for start, period in cells.items()
+    }
+
+
+def _cached_periods(
+    db: Session,
+    starts: list[date],
+    bucket: Bucket,
+    group_by: GroupBy,
+) -> dict[date, list]:
+    backend = get_cache_backend()
+    if backend is None:
+        return _aggregate(db, starts, bucket, group_by)
+
+    names = (REBUILD_GENERATION, *(_generation_name(bucket, s) for s in starts))
+    rebuilt, *generations = backend.generations(names)
+    keys = {
+        start: f"donation-series:{bucket}:{group_by}:{start.isoformat()}:{rebuilt}:{generation}"
+        for start, generation in zip(starts, generations)
+    }
+
+    result: dict[date, list] = {}
+    missing: list[date] = []
+    for start, key in keys.items():
+        cached = backend.get(key)
+        if cached is None:
+            missing.append(start)
+        else:
+            result[start] = orjson.loads(cached)
+
+    if missing:
+        with primary_reads():
+            filled = _aggregate(db, missing, bucket, group_by)
+        today = datetime.now(timezone.utc).date()
+        short_ttl = get_settings().response_cache_ttl
+        for start, values in filled.items():
+            closed = next_period(start, bucket) <= today
+            ttl = SERIES_CACHE_TTL if closed and backend.shared else short_ttl
+            backend.set(keys[start], orjson.dumps(values), ttl)
+            result[start] = values
+    return result
+
+
+def donation_series(
+    db: Session,
+    *,
+    bucket: Bucket,
+    start: date,
+    end: date,
+    group_by: GroupBy,
+) -> dict:
+    """
+    Confirmed donation totals per period in [start, end], one series per
+    (group, currency), with zero-filled points for every period.
+    """
+    starts = periods(start, end, bucket)
+    by_period = _cached_periods(db, starts, bucket, group_by)
+
+    series: dict[tuple[str, str], list[dict]] = {}
+    for index, period in enumerate(starts):
+        for group, currency, amount, count, donors in by_period[period]:
+            points = series.get((group, currency))
+            if points is None:
+                points = series[(group, currency)] = [
+                    {"period_start": p, "amount": 0, "count": 0, "donors": 0}
+                    for p in starts
+                ]
+            points[index].update(amount=amount, count=count, donors=donors)
+
+    labels = _labels(db, group_by, {group for group, _ in series})
+    return {
+        "bucket": bucket,
+        "group_by": group_by,
+        "start": starts[0],
+        "end": next_period(starts[-1], bucket) - timedelta(days=1),
+        "series": [
+            {
+                "key": group or None,
+                "label": labels.get(group, group),
+                "currency": currency,
+                "points": points,
+            }
+            for (group, currency), points in sorted(series.items())
+        ],
+    }
+
+
+def _labels(db: Session, group_by: GroupBy, groups: set[str]) -> dict[str, str]:
+    if group_by == "none":
+        return {"": "All donations"}
+    if group_by == "payment_method":
+        return {"": "Unspecified"}
+    ids = [UUID(g) for g in groups if g]
+    names = {}
+    if ids:
+        names = {
+            str(campaign_id): name
+            for campaign_id, name in db.execute(
+                select(Campaign.id, Campaign.name).where(Campaign.id.in_(ids))
+            )
+        }
+    names[""] = "General fund"
+    return names
@@ -4,13 +4,16 @@ from __future__ import annotations
 from app.utils.email_sender import send_donation_receipt
 
 from typing import Iterable, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from sqlalchemy.orm import Session
 
 from app.models.campaign import Campaign, CampaignStatus
 from app.models.donation import Donation, DonationStatus
 from app.schemas.donation import DonationCreate
+from app.services.donation_rollups import record_status_change
+from app.services.payment_provider_service import build_payment_session
+from app.services.write_service import commit_keep_loaded, insert_returning
 
 
 def get_campaign_or_none(db: Session, campaign_id: Optional[UUID]) -> Optional[Campaign]:
@@ -19,24 +22,20 @@ def get_campaign_or_none(db: Session, campaign_id: Optional[UUID]) -> Optional[C
     return db.query(Campaign).filter(Campaign.id == campaign_id).first()
 
 
-def create_donation(
-    db: Session,
-    payload: DonationCreate,
-    *,
-    ip_address: str | None = None,
-    user_agent: str | None = None,
-) -> Donation:
-    """
-    Create a Donation in PENDING state.
-    No payment provider call yet – that comes in Phase 3.
-    """
-    campaign = get_campaign_or_none(db, payload.campaign_id)
+def _ensure_campaign_accepts_donations(db: Session, campaign_id: Optional[UUID]) -> None:
+    campaign = get_campaign_or_none(db, campaign_id)
 
     if campaign and campaign.status not in (CampaignStatus.ACTIVE, CampaignStatus.DRAFT):
         # We allow DRAFT in case you want to accept early gifts for new campaigns.
         raise ValueError("Campaign is not accepting donations at this time.")
 
-    donation = Donation(
+
+def _donation_values(
+    payload: DonationCreate,
+    ip_address: str | None,
+    user_agent: str | None,
+) -> dict:
+    return dict(
         amount=payload.amount,
         currency=payload.currency,
         donor_name=payload.donor_name,
@@ -51,12 +50,53 @@ def create_donation(
         user_agent=user_agent,
     )
 
-    db.add(donation)
-    db.commit()
-    db.refresh(donation)
+
+def create_donation(
+    db: Session,
+    payload: DonationCreate,
+    *,
+    ip_address: str | None = None,
+    user_agent: str | None = None,
+) -> Donation:
+    """
+    Create a Donation in PENDING state (no payment session).
+    """
+    _ensure_campaign_accepts_donations(db, payload.campaign_id)
+
+    donation = insert_returning(
+        db, Donation, _donation_values(payload, ip_address, user_agent)
+    )
+    commit_keep_loaded(db)
     return donation
 
 
+def create_donation_with_session(
+    db: Session,
+    payload: DonationCreate,
+    *,
+    ip_address: str | None = None,
+    user_agent: str | None = None,
+) -> tuple[Donation, dict]:
+    """
+    Create a PENDING donation together with its payment session.
+
+    The donation id is generated up front so the provider session can be
+    computed before the INSERT; the row is written with the session fields
+    already set (INSERT ... RETURNING + one COMMIT, no refresh).
+    """
+    _ensure_campaign_accepts_donations(db, payload.campaign_id)
+
+    values = _donation_values(payload, ip_address, user_agent)
+    values["id"] = uuid4()
+
+    session_info = build_payment_session(values["id"], values["payment_method"])
+    values.update(session_info.pop("donation_fields"))
+
+    donation = insert_returning(db, Donation, values)
+    commit_keep_loaded(db)
+    return donation, session_info
+
+
 def list_donations(
     db: Session,
     *,
@@ -96,9 +136,13 @@ def set_donation_status(
     Helper for future payment integration:
     update donation status and provider_status.
     """
+    # Lock the row and re-read the committed status before changing it
+    db.refresh(donation, with_for_update=True)
+    old_status = donation.status
     donation.status = status_
     if provider_status is not None:
         donation.provider_status = provider_status
+    record_status_change(db, donation, old_status)
 
     db.commit()
     db.refresh(donation)
@@ -108,10 +152,12 @@ def mark_donation_confirmed(db: Session, donation: Donation) -> Donation:
     """
     Mark donation as confirmed and trigger side-effects (stats updates, email, etc).
     """
-    from app.models.donation import DonationStatus  # if not already imported
-
-    donation.status = DonationStatus.CONFIRMED
     db.add(donation)
+    # Lock the row and re-read the committed status before changing it
+    db.refresh(donation, with_for_update=True)
+    old_status = donation.status
+    donation.status = DonationStatus.CONFIRMED
+    record_status_change(db, donation, old_status)
     db.commit()
     db.refresh(donation)
 
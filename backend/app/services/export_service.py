@@ -0,0 +1,36 @@
+# app/services/export_service.py
+"""
+NDJSON exports of whole admin tables (inquiries, subscribers).
+
+The rows are read with `yield_per`, which on Postgres runs the SELECT on a
+server-side cursor and fetches `batch_size` rows at a time, so memory stays
+flat however large the table is. Each row is written out as one JSON line
+as soon as its batch arrives.
+
+The generator opens its own read session: the request's session has
+already been released by the time the response body is streamed.
+"""
+from __future__ import annotations
+
+from typing import Iterator
+
+import orjson
+from pydantic import BaseModel
+from sqlalchemy.sql import Executable
+
+from app.database import ReadSessionLocal
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def stream_ndjson(
+    stmt: Executable,
+    schema: type[BaseModel],
+    *,
+    batch_size: int = 500,
+) -> Iterator[bytes]:
+    with ReadSessionLocal() as db:
+        rows = db.scalars(stmt, execution_options={"yield_per": batch_size})
+        for row in rows:
+            # The identity map holds rows weakly, so written-out rows are freed
+            yield orjson.dumps(schema.model_validate(row).model_dump(mode="json")) + b"\n"
@@ -0,0 +1,318 @@
+# app/services/list_queries.py
+"""
+Cached, parameterized statements for the hot list endpoints.
+
+Each builder returns a `lambda_stmt`: SQLAlchemy keys the statement on the
+code location of the lambdas (not on the built expression tree), so after
+the first request for a given shape (which filters are set, which sort)
+the SELECT is neither rebuilt nor re-traversed for its cache key, and the
+compiled SQL comes straight from the engine's compiled cache. Filter
+values, offset and limit are picked up from the closures as bound
+parameters.
+
+Rules for editing these:
+  - every optional filter gets its own `stmt += lambda s: ...` line,
+    so each combination is a distinct, cacheable shape;
+  - closures may only capture plain values (ids, enums, ints, datetimes),
+    never other SQL expressions built at request time.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import TextClause, func, lambda_stmt, select, text, tuple_
+from sqlalchemy.sql import StatementLambdaElement
+
+from app.models.campaign import Campaign, CampaignStatus
+from app.models.donation import Donation, DonationStatus
+from app.models.inquiry import Inquiry, InquiryStatus
+from app.models.project import Project, ProjectStatus
+from app.models.service import Service
+from app.models.subscriber import Subscriber
+
+
+# ---------------------------------------------------------
+# Projects
+# ---------------------------------------------------------
+def _filter_projects(
+    stmt: StatementLambdaElement,
+    status: ProjectStatus | None,
+    is_featured: bool | None,
+    service_slug: str | None,
+) -> StatementLambdaElement:
+    if status is not None:
+        stmt += lambda s: s.where(Project.status == status)
+
+    if is_featured is not None:
+        stmt += lambda s: s.where(Project.is_featured == is_featured)
+
+    if service_slug:
+        stmt += lambda s: s.join(Service, Project.service_id == Service.id).where(
+            Service.slug == service_slug
+        )
+
+    return stmt
+
+
+def projects_page(
+    *,
+    status: ProjectStatus | None = None,
+    is_featured: bool | None = None,
+    service_slug: str | None = None,
+    sort: str | None = None,
+    offset: int = 0,
+    limit: int = 10,
+    with_total: bool = False,
+) -> StatementLambdaElement:
+    """
+    with_total=True selects (Project, total) rows, where total is
+    `count(*) OVER ()` — the filtered row count computed by the same query
+    before OFFSET/LIMIT, so no separate COUNT round trip is needed.
+    """
+    if with_total:
+        base = lambda_stmt(lambda: select(Project, func.count().over()))
+    else:
+        base = lambda_stmt(lambda: select(Project))
+    stmt = _filter_projects(base, status, is_featured, service_slug)
+
+    if sort == "oldest":
+        stmt += lambda s: s.order_by(Project.created_at.asc())
+    elif sort == "featured":
+        stmt += lambda s: s.order_by(
+            Project.is_featured.desc(),
+            Project.created_at.desc(),
+        )
+    else:
+        # "newest" and default
+        stmt += lambda s: s.order_by(Project.created_at.desc())
+
+    stmt += lambda s: s.offset(offset).limit(limit)
+    return stmt
+
+
+def projects_count(
+    *,
+    status: ProjectStatus | None = None,
+    is_featured: bool | None = None,
+    service_slug: str | None = None,
+) -> StatementLambdaElement:
+    return _filter_projects(
+        lambda_stmt(lambda: select(func.count(Project.id))),
+        status,
+        is_featured,
+        service_slug,
+    )
+
+
+def estimated_row_count(table_name: str) -> TextClause:
+    """
+    Postgres planner estimate of a table's row count (pg_class.reltuples,
+    refreshed by VACUUM/ANALYZE). Returns -1 for never-analyzed tables.
+    """
+    return text(
+        "SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:name AS regclass)"
+    ).bindparams(name=table_name)
+
+
+# ---------------------------------------------------------
+# Services
+# ---------------------------------------------------------
+def services_page(
+    *,
+    is_active: bool = True,
+    offset: int = 0,
+    limit: int = 50,
+) -> StatementLambdaElement:
+    return lambda_stmt(
+        lambda: select(Service)
+        .where(Service.is_active == is_active)
+        .order_by(Service.display_order.asc(), Service.name.asc())
+        .offset(offset)
+        .limit(limit)
+    )
+
+
+# ---------------------------------------------------------
+# Campaigns
+# ---------------------------------------------------------
+def campaigns_page(
+    *,
+    status: CampaignStatus | None = None,
+    is_featured: bool | None = None,
+    offset: int = 0,
+    limit: int = 50,
+) -> StatementLambdaElement:
+    stmt = lambda_stmt(lambda: select(Campaign))
+
+    if status is not None:
+        stmt += lambda s: s.where(Campaign.status == status)
+
+    if is_featured is not None:
+        stmt += lambda s: s.where(Campaign.is_featured == is_featured)
+
+    stmt += lambda s: s.order_by(
+        Campaign.sort_order, Campaign.created_at.desc()
+    ).offset(offset).limit(limit)
+    return stmt
+
+
+# ---------------------------------------------------------
+# Donations (admin)
+# ---------------------------------------------------------
+def admin_donations_page(
+    *,
+    campaign_id: UUID | None = None,
+    status: DonationStatus | None = None,
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+    min_amount: int | None = None,
+    max_amount: int | None = None,
+    after: tuple[datetime, UUID] | None = None,
+    offset: int = 0,
+    limit: int = 100,
+) -> StatementLambdaElement:
+    """
+    Newest first, ordered by (created_at, id) so that `after` (the last
+    row's key from the previous page) can seek instead of offsetting. The
+    composite indexes on donations cover this order with and without the
+    campaign/status filters.
+    """
+    stmt = lambda_stmt(lambda: select(Donation))
+
+    if campaign_id is not None:
+        stmt += lambda s: s.where(Donation.campaign_id == campaign_id)
+
+    if status is not None:
+        stmt += lambda s: s.where(Donation.status == status)
+
+    if date_from is not None:
+        stmt += lambda s: s.where(Donation.created_at >= date_from)
+
+    if date_to is not None:
+        stmt += lambda s: s.where(Donation.created_at <= date_to)
+
+    if min_amount is not None:
+        stmt += lambda s: s.where(Donation.amount >= min_amount)
+
+    if max_amount is not None:
+        stmt += lambda s: s.where(Donation.amount <= max_amount)
+
+    if after is not None:
+        after_created_at, after_id = after
+        stmt += lambda s: s.where(
+            tuple_(Donation.created_at, Donation.id)
+            < tuple_(after_created_at, after_id)
+        )
+
+    stmt += lambda s: s.order_by(
+        Donation.created_at.desc(), Donation.id.desc()
+    ).offset(offset).limit(limit)
+    return stmt
+
+
+# ---------------------------------------------------------
+# Inquiries (admin)
+# ---------------------------------------------------------
+# Relevance ranking looks at this many of the newest matches
+RANK_CANDIDATES = 1000
+
+
+def inquiries_page(
+    *,
+    status: InquiryStatus | None = None,
+    source: str | None = None,
+    search: str | None = None,
+    full_text: bool = True,
+    ranked: bool = False,
+    after: tuple[datetime, UUID] | None = None,
+    offset: int = 0,
+    limit: int | None = 50,
+) -> StatementLambdaElement:
+    """
+    Newest first by (created_at, id); `after` seeks past a cursor.
+    limit=None returns every match (used by the NDJSON export).
+
+    full_text=True (Postgres): `search` matches the generated search_vector
+    with websearch_to_tsquery (GIN index), OR-ed with an ILIKE on email for
+    partial addresses (trigram index). With ranked=True the newest
+    RANK_CANDIDATES matches are ordered by ts_rank and `after` is not used:
+    ts_rank scores every row it sorts, and a common term matches most of
+    the table. Otherwise `search` is a LIKE on the plain-text search_vector.
+    """
+    stmt = lambda_stmt(lambda: select(Inquiry))
+
+    if status is not None:
+        stmt += lambda s: s.where(Inquiry.status == status)
+
+    if source:
+        stmt += lambda s: s.where(Inquiry.source == source)
+
+    ranked = bool(search) and full_text and ranked
+
+    if search and full_text:
+        like = f"%{search}%"
+        stmt += lambda s: s.where(
+            Inquiry.search_vector.op("@@")(func.websearch_to_tsquery("english", search))
+            | Inquiry.email.ilike(like)
+        )
+    elif search:
+        like = f"%{search.lower()}%"
+        stmt += lambda s: s.where(Inquiry.search_vector.like(like))
+
+    if ranked:
+        stmt += lambda s: (
+            select(Inquiry)
+            .where(
+                Inquiry.id.in_(
+                    s.with_only_columns(Inquiry.id)
+                    .order_by(Inquiry.created_at.desc(), Inquiry.id.desc())
+                    .limit(RANK_CANDIDATES)
+                )
+            )
+            .order_by(
+                func.ts_rank(
+                    Inquiry.search_vector, func.websearch_to_tsquery("english", search)
+                ).desc()
+            )
+        )
+    elif after is not None:
+        after_created_at, after_id = after
+        stmt += lambda s: s.where(
+            tuple_(Inquiry.created_at, Inquiry.id)
+            < tuple_(after_created_at, after_id)
+        )
+
+    stmt += lambda s: s.order_by(Inquiry.created_at.desc(), Inquiry.id.desc())
+
+    if limit is not None:
+        stmt += lambda s: s.offset(offset).limit(limit)
+    return stmt
+
+
+# ---------------------------------------------------------
+# Subscribers (admin)
+# ---------------------------------------------------------
+def subscribers_page(
+    *,
+    after: tuple[datetime, UUID] | None = None,
+    offset: int = 0,
+    limit: int | None = 100,
+) -> StatementLambdaElement:
+    """Same ordering and cursor rules as `inquiries_page`."""
+    stmt = lambda_stmt(lambda: select(Subscriber))
+
+    if after is not None:
+        after_created_at, after_id = after
+        stmt += lambda s: s.where(
+            tuple_(Subscriber.created_at, Subscriber.id)
+            < tuple_(after_created_at, after_id)
+        )
+
+    stmt += lambda s: s.order_by(
+        Subscriber.created_at.desc(), Subscriber.id.desc()
+    )
+
+    if limit is not None:
+        stmt += lambda s: s.offset(offset).limit(limit)
+    return stmt
@@ -5,11 +5,14 @@ import hashlib
 import hmac
 import json
 from typing import Tuple
+from uuid import UUID
 
 from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.models.donation import Donation, DonationStatus
+from app.services.donation_rollups import record_status_change
+from app.services.write_service import commit_keep_loaded
 
 
 class WebhookSignatureError(Exception):
@@ -19,28 +22,24 @@ class WebhookSignatureError(Exception):
 ALLOWED_PAYMENT_METHODS = {"card", "mtn_momo", "airtel_momo"}
 
 
-def create_payment_session(db: Session, donation: Donation) -> dict:
+def build_payment_session(donation_id: UUID, payment_method: str | None) -> dict:
     """
-    Create a checkout/payment session for the donation.
+    Compute the checkout/payment session for a donation without touching
+    the database.
 
-    Multi-channel dummy implementation:
-      - Uses payment_method: "card" | "mtn_momo" | "airtel_momo"
-      - Returns a fake payment_url based on the channel.
-      - Stores provider_session_id/provider_payment_id on the donation.
-
-    Later you can swap this to Stripe/Flutterwave/etc. while keeping
-    the same interface and tests.
+    Returns the public session info plus `donation_fields`: the column
+    values to store on the donation. This lets the donation row be inserted
+    with its session already attached (one INSERT, one COMMIT).
     """
-    method = (donation.payment_method or "card").lower()
+    method = (payment_method or "card").lower()
     if method not in ALLOWED_PAYMENT_METHODS:
         # Normalise unknown → card, or you can raise
         method = "card"
-        donation.payment_method = method
 
     provider_name = settings.payment_provider_name or "dummy"
 
     # Make the session_id include method for easier debugging
-    session_id = f"{provider_name}_{method}_session_{donation.id}"
+    session_id = f"{provider_name}_{method}_session_{donation_id}"
 
     # Very simple base URL; in real life this would be Stripe/Flutterwave checkout URL
     base_url = "https://payments.example.local"
@@ -53,22 +52,43 @@ def create_payment_session(db: Session, donation: Donation) -> dict:
 
     payment_url = f"{base_url}{path}"
 
-    donation.payment_provider = provider_name
-    donation.provider_session_id = session_id
-    donation.provider_payment_id = session_id
-    donation.provider_status = "created"
-
-    db.commit()
-    db.refresh(donation)
-
     return {
         "provider": provider_name,
         "session_id": session_id,
         "payment_url": payment_url,
         "payment_method": method,
+        "donation_fields": {
+            "payment_method": method,
+            "payment_provider": provider_name,
+            "provider_session_id": session_id,
+            "provider_payment_id": session_id,
+            "provider_status": "created",
+        },
     }
 
 
+def create_payment_session(db: Session, donation: Donation) -> dict:
+    """
+    Create a checkout/payment session for an existing donation.
+
+    Multi-channel dummy implementation:
+      - Uses payment_method: "card" | "mtn_momo" | "airtel_momo"
+      - Returns a fake payment_url based on the channel.
+      - Stores provider_session_id/provider_payment_id on the donation.
+
+    Later you can swap this to Stripe/Flutterwave/etc. while keeping
+    the same interface and tests. New donations go through
+    `donation_service.create_donation_with_session`, which folds this into the
+    donation INSERT.
+    """
+    info = build_payment_session(donation.id, donation.payment_method)
+    for field, value in info.pop("donation_fields").items():
+        setattr(donation, field, value)
+
+    commit_keep_loaded(db)
+    return info
+
+
 def _compute_signature(secret: str, body: bytes) -> str:
     return hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
 
@@ -136,25 +156,42 @@ def map_provider_status_to_donation_status(provider_status: str) -> DonationStat
     return DonationStatus.PENDING
 
 
-def apply_webhook_to_donation(db: Session, event: dict) -> Tuple[Donation, DonationStatus]:
+def apply_webhook_to_donation(
+    db: Session,
+    event: dict,
+    *,
+    commit: bool = True,
+) -> Tuple[Donation, DonationStatus]:
     """
     Given a provider event (already validated & parsed),
     find the corresponding donation and update its status.
+
+    With commit=False the changes are only flushed, so the caller can
+    commit them together with its own writes (see webhook_events).
     """
     session_id = event["session_id"]
     provider_status = event["status"]
 
+    # Row lock: a retried/duplicate webhook waits here, then sees our status
     donation = (
         db.query(Donation)
         .filter(Donation.provider_session_id == session_id)
+        .with_for_update()
+        .populate_existing()
         .first()
     )
     if not donation:
         raise ValueError("Donation matching this session_id not found.")
 
+    old_status = donation.status
     new_status = map_provider_status_to_donation_status(provider_status)
     donation.status = new_status
     donation.provider_status = provider_status
+    record_status_change(db, donation, old_status)
+
+    if not commit:
+        db.flush()
+        return donation, new_status
 
     db.commit()
     db.refresh(donation)
@@ -0,0 +1,577 @@
+# app/services/search_index.py
+"""
+In-memory inverted index behind GET /api/v1/search.
+
+Projects, active services and non-draft campaigns are tokenized into
+`term → {doc: weighted term frequency}` postings, so a query is a few dict
+lookups and never touches the database. The index is built at startup (or
+on the first search) and kept current incrementally:
+
+  - commits in this process report the rows they wrote (see
+    `response_cache.add_row_listener`), and only those rows are re-read and
+    re-indexed (bulk statements with unknown rows reload that one kind;
+    generation-only bumps such as a campaign's raised_amount re-read none);
+  - other workers' writes show up as table generation changes when the
+    generations are shared (Redis cache backend); the affected kinds are
+    reloaded on the next search. With the in-process backend (or none)
+    they can't be seen, so each kind is also reloaded once its last full
+    load is older than the response cache TTL.
+
+Each kind lives in its own shard. A full reload builds a new shard without
+holding the index lock and swaps it in, so queries (answered on the event
+loop) never wait for one.
+
+Scoring is BM25-like: each query term contributes idf × saturated weighted
+tf, where title hits weigh more than description hits. Every query term
+must match; the last one also matches as a prefix (search-as-you-type).
+Postings are also kept grouped by tf, and a query visits documents in that
+order and stops once no unseen one can enter the top hits (max-score
+pruning), so common words don't mean scoring every document.
+"""
+from __future__ import annotations
+
+import bisect
+import heapq
+import html
+import itertools
+import logging
+import math
+import operator
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.campaign import Campaign, CampaignStatus
+from app.models.project import Project
+from app.models.service import Service
+from app.utils.response_cache import add_row_listener, get_cache_backend
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+")
+MAX_PREFIX_EXPANSIONS = 50
+SNIPPET_CHARS = 160
+
+
+def tokenize(text: str | None) -> list[str]:
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+# ---------------------------------------------------------
+# What gets indexed
+# ---------------------------------------------------------
+@dataclass(frozen=True)
+class _Kind:
+    name: str  # hit "type"
+    model: type
+    # (field label, weight, text getter)
+    fields: tuple[tuple[str, float, Callable[[object], str | None]], ...]
+
+    @property
+    def table(self) -> str:
+        return self.model.__tablename__
+
+    def visible(self, obj) -> bool:
+        if self.model is Service:
+            return bool(obj.is_active)
+        if self.model is Campaign:
+            return obj.status != CampaignStatus.DRAFT
+        return True
+
+
+KINDS = (
+    _Kind(
+        "project",
+        Project,
+        (
+            ("name", 3.0, lambda p: p.name),
+            ("technologies", 2.0, lambda p: " ".join(p.technologies or ())),
+            ("location", 1.5, lambda p: p.location),
+            ("short_description", 1.0, lambda p: p.short_description),
+            ("description", 1.0, lambda p: p.description),
+        ),
+    ),
+    _Kind(
+        "service",
+        Service,
+        (
+            ("name", 3.0, lambda s: s.name),
+            ("tagline", 2.0, lambda s: s.tagline),
+            (
+                "highlights",
+                1.5,
+                lambda s: " · ".join(
+                    h for h in (s.highlight_1, s.highlight_2, s.highlight_3) if h
+                ),
+            ),
+        ),
+    ),
+    _Kind(
+        "campaign",
+        Campaign,
+        (
+            ("name", 3.0, lambda c: c.name),
+            ("short_description", 1.5, lambda c: c.short_description),
+            ("description", 1.0, lambda c: c.description),
+        ),
+    ),
+)
+KINDS_BY_TABLE = {kind.table: kind for kind in KINDS}
+SEARCH_TABLES = tuple(KINDS_BY_TABLE)
+
+
+@dataclass(frozen=True)
+class _Doc:
+    kind: str
+    id: object
+    slug: str
+    title: str
+    fields: tuple[tuple[str, float, str], ...]  # (label, weight, text), non-empty only
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    type: str
+    id: object
+    slug: str
+    title: str
+    snippet: str
+    score: float
+
+
+def _make_doc(kind: _Kind, obj) -> _Doc:
+    fields = tuple(
+        (label, weight, text)
+        for label, weight, get in kind.fields
+        if (text := get(obj))
+    )
+    return _Doc(kind.name, obj.id, obj.slug, obj.name, fields)
+
+
+# ---------------------------------------------------------
+# Snippets
+# ---------------------------------------------------------
+def _highlight_pattern(terms: set[str]) -> re.Pattern:
+    return re.compile(
+        r"\b(?:" + "|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True)) + r")\w*",
+        re.IGNORECASE,
+    )
+
+
+def _snippet(doc: _Doc, pattern: re.Pattern) -> str:
+    """
+    HTML-safe excerpt with matches wrapped in <mark>. Taken from the
+    highest-weighted non-title field that contains a match (the title is
+    returned separately), else from the first such field, else the title.
+    """
+    body = sorted(
+        (f for f in doc.fields if f[0] != "name"),
+        key=lambda f: -f[1],
+    )
+    text, match = body[0][2] if body else doc.title, None
+    for _label, _weight, candidate in body:
+        match = pattern.search(candidate)
+        if match:
+            text = candidate
+            break
+
+    start = 0
+    if match and match.start() > SNIPPET_CHARS // 3:
+        start = text.rfind(" ", 0, match.start() - SNIPPET_CHARS // 3) + 1
+    end = min(len(text), start + SNIPPET_CHARS)
+    if end < len(text) and " " in text[start:end]:
+        end = text.rfind(" ", start, end)
+    window = text[start:end]
+
+    out = ["…" if start > 0 else ""]
+    pos = 0
+    for m in pattern.finditer(window):
+        out.append(html.escape(window[pos:m.start()]))
+        out.append(f"<mark>{html.escape(m.group())}</mark>")
+        pos = m.end()
+    out.append(html.escape(window[pos:]))
+    if end < len(text):
+        out.append("…")
+    return "".join(out)
+
+
+# ---------------------------------------------------------
+# Index
+# ---------------------------------------------------------
+K1 = 1.2
+
+
+def _term_weights(doc: _Doc) -> dict[str, float]:
+    """term → saturated weighted tf (stored saturated, so a query only multiplies by idf)."""
+    weights: Counter[str] = Counter()
+    for _label, weight, text in doc.fields:
+        for term in tokenize(text):
+            weights[term] += weight
+    return {term: w * (K1 + 1) / (w + K1) for term, w in weights.items()}
+
+
+class _Shard:
+    """
+    One kind's documents and postings. A full reload builds a new shard
+    without holding the index lock, then swaps it in.
+    """
+
+    def __init__(self):
+        self.slots: dict[object, int] = {}  # doc id → slot
+        self.docs: dict[int, _Doc] = {}
+        # term → {slot: saturated weighted tf}
+        self.postings: dict[str, dict[int, float]] = {}
+        # term → {tf: slots}: the same postings grouped by impact, so a query
+        # can visit documents best-first and stop early
+        self.impacts: dict[str, dict[float, set[int]]] = {}
+        self.doc_terms: dict[int, tuple[str, ...]] = {}
+        self.vocabulary: list[str] = []  # sorted, for prefix lookups
+
+    def remove(self, doc_id) -> None:
+        slot = self.slots.pop(doc_id, None)
+        if slot is None:
+            return
+        del self.docs[slot]
+        for term in self.doc_terms.pop(slot):
+            postings = self.postings[term]
+            impacts = self.impacts[term]
+            tf = postings.pop(slot)
+            impacts[tf].discard(slot)
+            if not impacts[tf]:
+                del impacts[tf]
+            if not postings:
+                del self.postings[term]
+                del self.impacts[term]
+                i = bisect.bisect_left(self.vocabulary, term)
+                del self.vocabulary[i]
+
+    def add(self, doc: _Doc, weights: dict[str, float], slot: int, *, sort: bool = True) -> None:
+        """Index `doc`; with sort=False the caller re-sorts the vocabulary afterwards."""
+        self.slots[doc.id] = slot
+        self.docs[slot] = doc
+        self.doc_terms[slot] = tuple(weights)
+        for term, tf in weights.items():
+            postings = self.postings.get(term)
+            if postings is None:
+                postings = self.postings[term] = {}
+                self.impacts[term] = {}
+                if sort:
+                    bisect.insort(self.vocabulary, term)
+            postings[slot] = tf
+            self.impacts[term].setdefault(tf, set()).add(slot)
+
+
+# A token's scoring inputs in one shard: slot → value, the factor turning a
+# value into score, and its documents grouped by score, best first
+_Scorer = tuple[dict[int, float], float, list[tuple[float, set[int]]]]
+
+
+def _scorer(shard: _Shard, terms: dict[str, float]) -> _Scorer | None:
+    """How one query token (its matching terms → factor × idf) scores in `shard`."""
+    present = [(term, w) for term, w in terms.items() if term in shard.postings]
+    if not present:
+        return None
+    if len(present) == 1:
+        [(term, w)] = present
+        tiers = sorted(shard.impacts[term].items(), key=operator.itemgetter(0), reverse=True)
+        return shard.postings[term], w, [(w * tf, slots) for tf, slots in tiers]
+
+    # Several terms (prefix expansion): a document scores its best one.
+    # Visiting all their tiers best-first, the first score seen is that one.
+    ranked = sorted(
+        ((w * tf, slots) for term, w in present for tf, slots in shard.impacts[term].items()),
+        key=operator.itemgetter(0),
+        reverse=True,
+    )
+    best: dict[int, float] = {}
+    tiers = []
+    for score, slots in ranked:
+        new = slots.difference(best)
+        if new:
+            best.update(dict.fromkeys(new, score))
+            tiers.append((score, new))
+    return best, 1.0, tiers
+
+
+def _merge_top(top: list, scores: list[float], slots: list[int], kind: str, limit: int) -> None:
+    """Fold scored slots into `top` [(-score, slot, kind)], best first, at most `limit`."""
+    if len(scores) > limit:
+        # heapq on bare floats is cheap; on tuples the comparisons would
+        # dominate the query
+        threshold = heapq.nlargest(limit, scores)[-1]
+        keep = list(map(threshold.__le__, scores))
+        slots = list(itertools.compress(slots, keep))
+        scores = list(itertools.compress(scores, keep))
+    # Ties go to the earlier-indexed document
+    top.extend(zip(map(operator.neg, scores), slots, itertools.repeat(kind)))
+    top.sort()
+    del top[limit:]
+
+
+def _search_shard(
+    shard: _Shard,
+    kind: str,
+    weighted: list[dict[str, float]],
+    limit: int,
+    top: list,
+) -> int:
+    """Fold the shard's best matches into `top`; returns how many documents matched."""
+    scorers = []
+    for terms in weighted:
+        scorer = _scorer(shard, terms)
+        if scorer is None:
+            return 0
+        scorers.append(scorer)
+
+    # Every token must match: intersect the key sets, rarest first (set
+    # operations run in C)
+    scorers.sort(key=lambda scorer: len(scorer[0]))
+    candidates = None
+    if len(scorers) > 1:
+        candidates = scorers[0][0].keys() & scorers[1][0].keys()
+        for lookup, _w, _tiers in scorers[2:]:
+            candidates &= lookup.keys()
+    total = len(scorers[0][0]) if candidates is None else len(candidates)
+
+    # Max-score pruning: walk the token with the most to contribute tier
+    # by tier, best first, scoring only the candidates in each tier. Once
+    # the last of `limit` hits beats anything an unseen document could
+    # still reach (the next tier plus the other tokens' best), stop.
+    driver = max(range(len(scorers)), key=lambda i: scorers[i][2][0][0])
+    others = sum(tiers[0][0] for i, (_l, _w, tiers) in enumerate(scorers) if i != driver)
+    tiers = scorers[driver][2]
+    for i, (_score, tier) in enumerate(tiers):
+        slots = list(tier if candidates is None else tier & candidates)
+        if slots:
+            scores = None
+            for lookup, w, _tiers in scorers:
+                values = map(lookup.__getitem__, slots)
+                if w != 1.0:
+                    values = map(operator.mul, values, itertools.repeat(w))
+                scores = values if scores is None else map(operator.add, scores, values)
+            _merge_top(top, list(scores), slots, kind, limit)
+        if len(top) == limit and i + 1 < len(tiers):
+            bound = tiers[i + 1][0] + others
+            if -top[-1][0] > bound * (1 + 1e-9):  # slack for float rounding
+                break
+    return total
+
+
+class SearchIndex:
+    def __init__(self):
+        # Postings are keyed by an int slot per document: hashing UUIDs is
+        # what a query would otherwise spend most of its time on. Slots only
+        # grow, so they also order documents by when they were indexed.
+        self._next_slot = itertools.count()
+        self._shards: dict[str, _Shard] = {kind.name: _Shard() for kind in KINDS}
+        # Held by queries and in-place updates. A full reload only takes it
+        # to swap its shard in, so a query never waits on a rebuild.
+        self._lock = threading.RLock()
+        # Table generations the index reflects, per table (None: not built)
+        self.generations: dict[str, int] | None = None
+        # table → time.monotonic() of its last full load
+        self.loaded_at: dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return sum(len(shard.docs) for shard in self._shards.values())
+
+    # ----- mutation -----
+    def upsert(self, kind: _Kind, objs: Iterable, *, ids: Iterable = ()) -> None:
+        """Re-index `objs` and drop `ids` that were not returned (deleted/hidden)."""
+        objs = list(objs)
+        # Tokenize before taking the lock
+        docs = [_make_doc(kind, obj) for obj in objs if kind.visible(obj)]
+        weights = [_term_weights(doc) for doc in docs]
+        with self._lock:
+            shard = self._shards[kind.name]
+            for pk in ids:
+                shard.remove(pk)
+            for obj in objs:
+                shard.remove(obj.id)
+            for doc, doc_weights in zip(docs, weights):
+                shard.add(doc, doc_weights, next(self._next_slot))
+
+    def replace_kind(self, kind: _Kind, objs: Iterable) -> None:
+        shard = _Shard()
+        for obj in objs:
+            if kind.visible(obj):
+                doc = _make_doc(kind, obj)
+                shard.add(doc, _term_weights(doc), next(self._next_slot), sort=False)
+        shard.vocabulary = sorted(shard.postings)
+        with self._lock:
+            # Freeing the old postings takes a while: do it after unlocking
+            replaced = self._shards[kind.name]
+            self._shards[kind.name] = shard
+        del replaced
+
+    # ----- queries -----
+    def _expand(self, token: str, prefix: bool) -> dict[str, float]:
+        """Index terms matching `token` → score factor (exact 1.0, prefix 0.8)."""
+        shards = self._shards.values()
+        matches = {token: 1.0} if any(token in s.postings for s in shards) else {}
+        if prefix:
+            found = set()
+            for shard in shards:
+                vocabulary = shard.vocabulary
+                i = bisect.bisect_left(vocabulary, token)
+                for term in vocabulary[i:i + MAX_PREFIX_EXPANSIONS]:
+                    if not term.startswith(token):
+                        break
+                    found.add(term)
+            for term in sorted(found)[:MAX_PREFIX_EXPANSIONS]:
+                matches.setdefault(term, 0.8)
+        return matches
+
+    def _idf(self, term: str, n_docs: int) -> float:
+        df = sum(len(shard.postings.get(term, ())) for shard in self._shards.values())
+        return math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+
+    def search(
+        self,
+        query: str,
+        *,
+        kinds: set[str] | None = None,
+        limit: int = 20,
+    ) -> tuple[int, list[SearchHit]]:
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return 0, []
+
+        with self._lock:
+            n_docs = len(self) or 1
+            # Per token: its matching terms → factor × idf
+            weighted: list[dict[str, float]] = []
+            all_terms: set[str] = set()
+            for i, token in enumerate(tokens):
+                terms = self._expand(token, prefix=i == len(tokens) - 1)
+                if not terms:
+                    return 0, []
+                all_terms.update(terms)
+                weighted.append(
+                    {term: factor * self._idf(term, n_docs) for term, factor in terms.items()}
+                )
+
+            total = 0
+            top: list[tuple[float, int, str]] = []
+            for kind, shard in self._shards.items():
+                if kinds is None or kind in kinds:
+                    total += _search_shard(shard, kind, weighted, limit, top)
+            docs = [(score, self._shards[kind].docs[slot]) for score, slot, kind in top]
+
+        # Docs are immutable: no need to hold the lock for the snippets
+        pattern = _highlight_pattern(all_terms)
+        return total, [
+            SearchHit(
+                type=doc.kind,
+                id=doc.id,
+                slug=doc.slug,
+                title=doc.title,
+                snippet=_snippet(doc, pattern),
+                score=round(-score, 4),
+            )
+            for score, doc in docs
+        ]
+
+
+# ---------------------------------------------------------
+# Process-wide index + syncing with the database
+# ---------------------------------------------------------
+search_index = SearchIndex()
+_build_lock = threading.Lock()
+
+
+def _current_generations() -> dict[str, int] | None:
+    backend = get_cache_backend()
+    if backend is None:
+        return None
+    return dict(zip(SEARCH_TABLES, backend.generations(SEARCH_TABLES)))
+
+
+def _load_kind(db: Session, kind: _Kind) -> None:
+    search_index.replace_kind(kind, db.scalars(select(kind.model)).all())
+
+
+def rebuild_search_index(tables: Iterable[str] = SEARCH_TABLES, *, if_stale: bool = False) -> None:
+    """
+    (Re)load the given tables (all by default) from the database. With
+    `if_stale`, skip the ones another caller reloaded while we waited for
+    the build lock (searches that all saw the same stale table).
+    """
+    with _build_lock:
+        if if_stale:
+            still_stale = stale_tables()
+            tables = [t for t in tables if t in still_stale]
+            if not tables:
+                return
+        # Read generations first: a write racing the load bumps them again
+        generations = _current_generations()
+        started = time.monotonic()
+        db = SessionLocal()
+        try:
+            for table in tables:
+                _load_kind(db, KINDS_BY_TABLE[table])
+                search_index.loaded_at[table] = started
+        finally:
+            db.close()
+        if search_index.generations is None or generations is None:
+            search_index.generations = generations or {}
+        else:
+            for table in tables:
+                search_index.generations[table] = generations[table]
+
+
+def stale_tables() -> tuple[str, ...]:
+    """Tables to reload before serving a search (all of them if never built)."""
+    if search_index.generations is None:
+        return SEARCH_TABLES
+    stale = set()
+    backend = get_cache_backend()
+    if backend is None or not backend.shared:
+        # Other workers' commits are invisible here: bound how long they can be missed
+        loaded_before = time.monotonic() - get_settings().response_cache_ttl
+        stale.update(
+            t for t in SEARCH_TABLES if search_index.loaded_at.get(t, 0.0) <= loaded_before
+        )
+    current = _current_generations()
+    if current is not None:
+        stale.update(t for t in SEARCH_TABLES if search_index.generations.get(t) != current[t])
+    return tuple(t for t in SEARCH_TABLES if t in stale)
+
+
+def _apply_committed_writes(writes: dict[str, set | None]) -> None:
+    tables = [t for t in writes if t in KINDS_BY_TABLE]
+    if not tables or search_index.generations is None:
+        return  # not built yet: the first search loads everything
+    try:
+        current = _current_generations()
+        db = SessionLocal()
+        try:
+            for table in tables:
+                kind = KINDS_BY_TABLE[table]
+                ids = writes[table]
+                if ids is None:
+                    _load_kind(db, kind)
+                elif ids:
+                    rows = db.scalars(select(kind.model).where(kind.model.id.in_(ids))).all()
+                    search_index.upsert(kind, rows, ids=ids)
+                # Only our own bump happened since the last sync: we're current.
+                # Otherwise another worker wrote too; the next search reloads.
+                if current is not None and current[table] == search_index.generations.get(table, 0) + 1:
+                    search_index.generations[table] = current[table]
+        finally:
+            db.close()
+    except Exception:
+        # Never fail the writer's commit; the next search rebuilds everything
+        logger.exception("Search index update failed")
+        search_index.generations = None
+
+
+add_row_listener(_apply_committed_writes)
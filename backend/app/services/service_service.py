@@ -3,6 +3,11 @@ from sqlalchemy.orm import Session
 from uuid import UUID
 from app.models.service import Service
 from app.schemas.service import ServiceCreate, ServiceUpdate
+from app.services.write_service import (
+    commit_keep_loaded,
+    insert_returning,
+    update_returning,
+)
 
 
 def list_services(db: Session):
@@ -21,10 +26,8 @@ def create_service(db: Session, service_in: ServiceCreate):
     # Do NOT check slug here — router already checks slug uniqueness.
     # Tests expect create_service to always succeed when router allows it.
 
-    service = Service(**service_in.model_dump())
-    db.add(service)
-    db.commit()
-    db.refresh(service)
+    service = insert_returning(db, Service, service_in.model_dump())
+    commit_keep_loaded(db)
     return service
 
 
@@ -32,18 +35,14 @@ def create_service(db: Session, service_in: ServiceCreate):
 # Update
 # ---------------------------------------------------------
 def update_service(db: Session, service_id: UUID, service_in: ServiceUpdate):
-    service = db.query(Service).filter(Service.id == service_id).first()
-    if not service:
-        raise ValueError("Service not found")
-
     update_data = service_in.model_dump(exclude_unset=True)
 
-    # Apply updates safely
-    for field, value in update_data.items():
-        setattr(service, field, value)
+    # UPDATE ... RETURNING: no pre-SELECT, no refresh
+    service = update_returning(db, Service, service_id, update_data)
+    if not service:
+        raise ValueError("Service not found")
 
-    db.commit()
-    db.refresh(service)
+    commit_keep_loaded(db)
     return service
 
 
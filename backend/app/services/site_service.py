@@ -0,0 +1,168 @@
+# app/services/site_service.py
+"""
+Precomputed homepage bundle.
+
+The snapshot is the fully serialized (orjson) body of GET /site/home plus
+its ETag. It is rebuilt right after any commit that writes rows of
+HOME_TABLES (admin handlers, scripts — see `response_cache.add_row_listener`),
+so homepage requests are served from memory. Commits that only bump a
+table's generation (a donation webhook moving a campaign's raised_amount)
+just drop it: the next request rebuilds it, once for all requests waiting
+on the rebuild, instead of every webhook paying for one.
+
+Other workers' writes are picked up through the response cache table
+generations when they are shared (Redis backend): if they moved since the
+snapshot was built, the next request rebuilds it. The in-process backend
+(or no cache at all) only sees this worker's commits, so there the
+snapshot is also rebuilt once it is older than the response cache TTL —
+the same staleness bound as the other cached public endpoints.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+
+import orjson
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.campaign import Campaign, CampaignStatus
+from app.models.project import Project
+from app.models.service import Service
+from app.models.testimonial import Testimonial
+from app.schemas.site import HomeBundle
+from app.utils.response_cache import (
+    add_row_listener,
+    get_cache_backend,
+    make_etag,
+)
+
+logger = logging.getLogger(__name__)
+
+HOME_TABLES = ("projects", "services", "testimonials", "campaigns")
+
+FEATURED_PROJECTS_LIMIT = 6
+FEATURED_TESTIMONIALS_LIMIT = 6
+FEATURED_CAMPAIGNS_LIMIT = 3
+
+
+class HomeSnapshot:
+    __slots__ = ("body", "etag", "generations", "built_at")
+
+    def __init__(self, body: bytes, generations: list[int] | None):
+        self.body = body
+        self.etag = make_etag(body)
+        self.generations = generations
+        self.built_at = time.monotonic()
+
+
+_snapshot: HomeSnapshot | None = None
+_lock = threading.Lock()
+
+
+def _current_generations() -> list[int] | None:
+    backend = get_cache_backend()
+    return backend.generations(HOME_TABLES) if backend is not None else None
+
+
+def build_home_bundle(db: Session) -> bytes:
+    services = db.scalars(
+        select(Service)
+        .where(Service.is_active == True)  # noqa: E712
+        .order_by(Service.display_order.asc(), Service.name.asc())
+    ).all()
+
+    projects = db.scalars(
+        select(Project)
+        .where(Project.is_featured == True)  # noqa: E712
+        .order_by(Project.created_at.desc())
+        .limit(FEATURED_PROJECTS_LIMIT)
+    ).all()
+
+    testimonials = db.scalars(
+        select(Testimonial)
+        .where(Testimonial.is_active == True, Testimonial.is_featured == True)  # noqa: E712
+        .order_by(Testimonial.display_order.asc(), Testimonial.created_at.desc())
+        .limit(FEATURED_TESTIMONIALS_LIMIT)
+    ).all()
+
+    campaigns = db.scalars(
+        select(Campaign)
+        .where(Campaign.is_featured == True, Campaign.status == CampaignStatus.ACTIVE)  # noqa: E712
+        .order_by(Campaign.sort_order, Campaign.created_at.desc())
+        .limit(FEATURED_CAMPAIGNS_LIMIT)
+    ).all()
+
+    bundle = HomeBundle(
+        services=services,
+        featured_projects=projects,
+        featured_testimonials=testimonials,
+        featured_campaigns=campaigns,
+        generated_at=datetime.now(timezone.utc),
+    )
+    return orjson.dumps(bundle.model_dump(mode="json"))
+
+
+def rebuild_home_snapshot(*, unless_built_since: float | None = None) -> HomeSnapshot:
+    """
+    Build and install a new snapshot. With `unless_built_since` (a
+    time.monotonic() value), return the installed one instead if it was
+    built after then, e.g. by a request that held the lock before us.
+    """
+    global _snapshot
+    with _lock:
+        snapshot = _snapshot
+        if (
+            unless_built_since is not None
+            and snapshot is not None
+            and snapshot.built_at > unless_built_since
+        ):
+            return snapshot
+        # Read generations first: a write racing the build bumps them again
+        generations = _current_generations()
+        db = SessionLocal()
+        try:
+            snapshot = HomeSnapshot(build_home_bundle(db), generations)
+        finally:
+            db.close()
+        _snapshot = snapshot
+        return snapshot
+
+
+def current_home_snapshot() -> HomeSnapshot | None:
+    """The snapshot if it is still current, else None (caller rebuilds)."""
+    snapshot = _snapshot
+    if snapshot is None:
+        return None
+    backend = get_cache_backend()
+    if backend is None or not backend.shared:
+        age = time.monotonic() - snapshot.built_at
+        if age >= get_settings().response_cache_ttl:
+            return None
+    if snapshot.generations != _current_generations():
+        return None
+    return snapshot
+
+
+def _rebuild_after_commit(writes: dict[str, set | None]) -> None:
+    global _snapshot
+    home = [writes[table] for table in HOME_TABLES if table in writes]
+    if not home:
+        return
+    if not any(rows is None or rows for rows in home):
+        # Generation bumps only (see response_cache.note_changed)
+        _snapshot = None
+        return
+    try:
+        rebuild_home_snapshot()
+    except Exception:
+        # Never fail the writer's commit; the next request rebuilds instead
+        logger.exception("Homepage snapshot rebuild failed")
+        _snapshot = None
+
+
+add_row_listener(_rebuild_after_commit)
@@ -0,0 +1,101 @@
+# app/services/webhook_events.py
+"""
+Idempotent processing of payment webhooks.
+
+Providers retry deliveries (timeouts, 5xx, or just at-least-once
+semantics). Each event is identified by `event_key` — the provider's event
+id when the payload has one (hashed if it doesn't fit the column), else a
+SHA-256 of the raw body — and the first successful application is
+recorded in `webhook_events` together with the response it produced, in
+the same transaction as the donation update. A duplicate is then answered with that stored response and never
+touches the donation:
+
+  1. recent-events LRU in this process (no database access at all);
+  2. primary-key lookup in `webhook_events`;
+  3. otherwise apply the event. If a concurrent delivery of the same event
+     committed first, our INSERT hits the primary key; we roll back (our
+     donation change included) and return the stored response.
+
+Rejected events (unknown session, bad payload) are not recorded, so a
+retry is evaluated again.
+"""
+from __future__ import annotations
+
+import hashlib
+
+import orjson
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.webhook_event import WebhookEvent
+from app.services.payment_provider_service import apply_webhook_to_donation
+from app.utils.response_cache import LRUCacheBackend
+
+RECENT_EVENTS = 2048
+RECENT_EVENTS_TTL = 3600  # seconds
+EVENT_KEY_LENGTH = WebhookEvent.__table__.c.event_key.type.length
+
+# event_key → JSON outcome of events applied or seen by this process
+_recent = LRUCacheBackend(max_entries=RECENT_EVENTS)
+
+
+def event_key(event: dict, raw_body: bytes) -> str:
+    event_id = event.get("id") or event.get("event_id")
+    if event_id:
+        key = f"{event.get('provider') or 'unknown'}:{event_id}"
+        if len(key) <= EVENT_KEY_LENGTH:
+            return key
+        # Truncating would make ids that share a long prefix collide
+        return "id-sha256:" + hashlib.sha256(key.encode()).hexdigest()
+    return "sha256:" + hashlib.sha256(raw_body).hexdigest()
+
+
+def _stored_outcome(db: Session, key: str) -> dict | None:
+    return db.scalar(select(WebhookEvent.outcome).where(WebhookEvent.event_key == key))
+
+
+def process_webhook_event(db: Session, raw_body: bytes, event: dict) -> tuple[dict, bool]:
+    """
+    Apply a verified, parsed webhook once. Returns (response, duplicate).
+    Raises ValueError for events that can't be applied.
+    """
+    key = event_key(event, raw_body)
+
+    cached = _recent.get(key)
+    if cached is not None:
+        return orjson.loads(cached), True
+
+    outcome = _stored_outcome(db, key)
+    if outcome is None:
+        donation, new_status = apply_webhook_to_donation(db, event, commit=False)
+        outcome = {"ok": True, "donation_id": str(donation.id), "status": new_status.value}
+        db.add(
+            WebhookEvent(
+                event_key=key,
+                provider=event.get("provider"),
+                event_type=event.get("event_type"),
+                payload=raw_body.decode("utf-8"),
+                donation_id=donation.id,
+                outcome=outcome,
+            )
+        )
+        try:
+            db.commit()
+            duplicate = False
+        except IntegrityError:
+            db.rollback()
+            outcome = _stored_outcome(db, key)
+            if outcome is None:
+                raise
+            duplicate = True
+    else:
+        duplicate = True
+
+    _recent.set(key, orjson.dumps(outcome), RECENT_EVENTS_TTL)
+    return outcome, duplicate
+
+
+def forget_recent_events() -> None:
+    """Empty this process's recent-events filter (tests)."""
+    _recent.clear()
@@ -0,0 +1,79 @@
+# app/services/write_service.py
+"""
+Single-round-trip write helpers.
+
+The usual `db.add(obj); db.commit(); db.refresh(obj)` costs an INSERT, a
+COMMIT and then a SELECT to reload server defaults (id, created_at, ...).
+These helpers use INSERT/UPDATE ... RETURNING so the row comes back from the
+write statement itself, and commit without expiring it, so the response
+serializes from what RETURNING gave us.
+"""
+from __future__ import annotations
+
+from typing import Any, TypeVar
+from uuid import UUID
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+
+from app.database import LazySession
+from app.utils.response_cache import note_written_row
+
+ModelT = TypeVar("ModelT")
+
+
+def _real_session(db: Session | LazySession) -> Session:
+    return db.session if isinstance(db, LazySession) else db
+
+
+def insert_returning(db: Session, model: type[ModelT], values: dict[str, Any]) -> ModelT:
+    """INSERT one row and return it as a fully loaded ORM instance (no refresh)."""
+    stmt = insert(model).returning(model).execution_options(notes_written_rows=True)
+    obj = db.scalars(stmt, [values]).one()
+    note_written_row(db, model.__table__.name, obj.id)
+    return obj
+
+
+def update_returning(
+    db: Session,
+    model: type[ModelT],
+    pk: UUID,
+    values: dict[str, Any],
+) -> ModelT | None:
+    """
+    UPDATE one row by primary key and return the updated ORM instance,
+    or None if no row matched. An instance already in the session is
+    refreshed in place from RETURNING.
+    """
+    if not values:
+        return db.scalars(select(model).where(model.id == pk)).first()
+
+    stmt = (
+        update(model)
+        .where(model.id == pk)
+        .values(**values)
+        .returning(model)
+        .execution_options(
+            synchronize_session=False,
+            populate_existing=True,
+            notes_written_rows=True,
+        )
+    )
+    obj = db.scalars(stmt).first()
+    if obj is not None:
+        note_written_row(db, model.__table__.name, pk)
+    return obj
+
+
+def commit_keep_loaded(db: Session) -> None:
+    """
+    Commit without expiring loaded instances, so reading them afterwards
+    (e.g. response serialization) doesn't issue a reload SELECT.
+    """
+    session = _real_session(db)
+    expire = session.expire_on_commit
+    session.expire_on_commit = False
+    try:
+        session.commit()
+    finally:
+        session.expire_on_commit = expire
@@ -0,0 +1,55 @@
+# backend/app/utils/client_ip.py
+"""
+Client IP of a request, as seen through the reverse proxies in
+TRUSTED_PROXIES.
+
+Each proxy appends the address it received the request from to
+X-Forwarded-For, so the header is only trustworthy from the right: walk
+it right to left from the socket peer, skipping trusted proxies, and the
+first address that isn't one is the client. Entries further left were
+sent by the client itself and are ignored. A request whose peer isn't a
+trusted proxy is taken at face value, header or not.
+"""
+from __future__ import annotations
+
+import ipaddress
+from functools import lru_cache
+
+from fastapi import Request
+
+from app.config import get_settings
+
+
+IPNetwork = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+
+@lru_cache(maxsize=8)
+def _networks(proxies: tuple[str, ...]) -> tuple[IPNetwork, ...]:
+    return tuple(ipaddress.ip_network(p, strict=False) for p in proxies)
+
+
+def _trusted(address: str, networks: tuple[IPNetwork, ...]) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in networks)
+
+
+def client_ip(request: Request) -> str | None:
+    peer = request.client.host if request.client else None
+    networks = _networks(tuple(get_settings().trusted_proxies))
+    if peer is None or not networks or not _trusted(peer, networks):
+        return peer
+
+    client = peer
+    for header in reversed(request.headers.getlist("x-forwarded-for")):
+        for hop in reversed(header.split(",")):
+            hop = hop.strip()
+            if not hop:
+                continue
+            client = hop
+            if not _trusted(hop, networks):
+                return client
+    # Every hop was a proxy: the leftmost one is as close as we get
+    return client
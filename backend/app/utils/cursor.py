@@ -0,0 +1,53 @@
+# backend/app/utils/cursor.py
+"""
+Opaque keyset-pagination cursors.
+
+A cursor is the sort key of the last row on a page (created_at + id),
+JSON-encoded and base64url'd. Clients treat it as an opaque string and pass
+it back as `?cursor=` to get the next page; the server turns it into a
+`WHERE (created_at, id) < (:c, :id)` seek, which an index on the same
+columns answers in constant time however deep the page is.
+"""
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+from typing import Sequence, TypeVar
+from uuid import UUID
+
+T = TypeVar("T")
+
+
+class InvalidCursor(ValueError):
+    """The cursor string is malformed or was not issued by this API."""
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    payload = json.dumps(
+        [created_at.isoformat(), str(row_id)],
+        separators=(",", ":"),
+    ).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Returns the (created_at, id) key the cursor points after."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursor("Invalid cursor.") from exc
+
+
+def split_page(rows: Sequence[T], limit: int) -> tuple[Sequence[T], str | None]:
+    """
+    `rows` is the result of a `limit + 1` query. Returns the page and the
+    cursor for the next one (None on the last page).
+    """
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    last = page[-1]
+    return page, encode_cursor(last.created_at, last.id)
@@ -1,7 +1,41 @@
 # backend/app/utils/hashing.py
+"""
+Password hashing (bcrypt via passlib).
+
+bcrypt is deliberately slow (~250ms at cost 12), so the async variants run
+it on a small dedicated thread pool instead of the request threadpool or
+the event loop. bcrypt releases the GIL, so PASSWORD_HASH_WORKERS threads
+give that many cores of hashing. At most PASSWORD_HASH_WORKERS +
+PASSWORD_HASH_MAX_QUEUE jobs may be in flight. Beyond that,
+`PasswordHashingBusy` is raised immediately instead of queueing without
+bound.
+
+Cost is BCRYPT_ROUNDS. Hashes made with a different cost are flagged by
+`verify_and_update`, and login re-hashes them on success. That lets the
+cost change without a migration.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from passlib.context import CryptContext
 
-_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.config import get_settings
+
+settings = get_settings()
+
+_pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.bcrypt_rounds,
+    # Anything else is "outdated" and gets re-hashed on the next login
+    bcrypt__min_rounds=settings.bcrypt_rounds,
+    bcrypt__max_rounds=settings.bcrypt_rounds,
+)
+
+
+class PasswordHashingBusy(RuntimeError):
+    """The hashing pool and its queue are full; caller should retry later."""
 
 
 def hash_password(password: str) -> str:
@@ -12,3 +46,49 @@ def hash_password(password: str) -> str:
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password."""
     return _pwd_context.verify(plain_password, hashed_password)
+
+
+def verify_and_update(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """
+    Verify, and if the stored hash uses outdated settings return a fresh
+    hash to store: (verified, new_hash_or_None).
+    """
+    return _pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+# ---------------------------------------------------------
+# Bounded executor
+# ---------------------------------------------------------
+_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers,
+    thread_name_prefix="bcrypt",
+)
+_slots = threading.BoundedSemaphore(
+    settings.password_hash_workers + settings.password_hash_max_queue
+)
+
+
+async def _run_bounded(fn, *args):
+    slots = _slots
+    if not slots.acquire(blocking=False):
+        raise PasswordHashingBusy("Password hashing queue is full.")
+    try:
+        future = _executor.submit(fn, *args)
+    except BaseException:
+        slots.release()
+        raise
+    # Released when the job finishes, not when the caller stops waiting: a
+    # cancelled request (client disconnect) leaves its job queued or running
+    future.add_done_callback(lambda _: slots.release())
+    return await asyncio.wrap_future(future)
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_bounded(hash_password, password)
+
+
+async def verify_and_update_async(
+    plain_password: str,
+    hashed_password: str,
+) -> tuple[bool, str | None]:
+    return await _run_bounded(verify_and_update, plain_password, hashed_password)
@@ -0,0 +1,69 @@
+# app/utils/hll.py
+"""
+HyperLogLog distinct-count sketch, stored as plain bytes.
+
+Used for "unique donors" over donation rollups: each rollup row keeps a
+sketch of its donors' e-mails, and sketches merge (register-wise max), so
+the donors of a month are estimated from that month's rows without
+reading the donations.
+
+2^10 one-byte registers: 1 KiB per sketch, ~3% standard error, and
+near-exact for the small counts a single day/campaign bucket usually has
+(linear counting below 2.5 × registers).
+"""
+from __future__ import annotations
+
+import hashlib
+import math
+from typing import Iterable
+
+PRECISION = 10
+REGISTERS = 1 << PRECISION
+_VALUE_BITS = 64 - PRECISION
+_ALPHA = 0.7213 / (1 + 1.079 / REGISTERS)
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class HyperLogLog:
+    __slots__ = ("registers",)
+
+    def __init__(self, data: bytes | None = None):
+        self.registers = bytearray(data) if data else bytearray(REGISTERS)
+        if len(self.registers) != REGISTERS:
+            raise ValueError(f"Expected a {REGISTERS}-byte sketch, got {len(self.registers)}.")
+
+    @classmethod
+    def of(cls, values: Iterable[str]) -> "HyperLogLog":
+        sketch = cls()
+        for value in values:
+            sketch.add(value)
+        return sketch
+
+    def add(self, value: str) -> bool:
+        """Add a value; True if the sketch changed (and needs saving)."""
+        h = _hash(value)
+        index = h >> _VALUE_BITS
+        rank = _VALUE_BITS - (h & ((1 << _VALUE_BITS) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+            return True
+        return False
+
+    def merge(self, other: "HyperLogLog | bytes") -> None:
+        theirs = other.registers if isinstance(other, HyperLogLog) else other
+        self.registers = bytearray(map(max, self.registers, theirs))
+
+    def count(self) -> int:
+        zeros = self.registers.count(0)
+        if zeros == REGISTERS:
+            return 0
+        estimate = _ALPHA * REGISTERS * REGISTERS / sum(2.0 ** -r for r in self.registers)
+        if estimate <= 2.5 * REGISTERS and zeros:
+            estimate = REGISTERS * math.log(REGISTERS / zeros)
+        return round(estimate)
+
+    def to_bytes(self) -> bytes:
+        return bytes(self.registers)
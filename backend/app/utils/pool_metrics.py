@@ -0,0 +1,177 @@
+# backend/app/utils/pool_metrics.py
+"""
+Connection pool instrumentation.
+
+Counters and gauges are fed by SQLAlchemy pool events (connect / checkout /
+checkin / invalidate). Pool events don't say how long a caller waited for a
+connection, so the pool classes below time `_do_get` themselves; that is
+where a caller blocks when the pool is exhausted and where `QueuePool limit`
+timeouts are raised.
+"""
+import threading
+import time
+from bisect import bisect_left
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Upper bounds (ms) of the checkout wait histogram; the last bucket is +Inf
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class PoolMetrics:
+    """Thread-safe counters for one engine's pool."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pool = None
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.connects = 0
+            self.checkouts = 0
+            self.checkins = 0
+            self.invalidations = 0
+            self.timeouts = 0
+            self.checked_out = 0
+            self.peak_checked_out = 0
+            self.wait_count = 0
+            self.wait_total_ms = 0.0
+            self.wait_max_ms = 0.0
+            self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def observe_wait(self, wait_ms: float) -> None:
+        with self._lock:
+            self.wait_count += 1
+            self.wait_total_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+            self.wait_buckets[bisect_left(WAIT_BUCKETS_MS, wait_ms)] += 1
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    # ---- pool event handlers ----
+    def on_connect(self, *_args) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def on_checkout(self, *_args) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def on_checkin(self, *_args) -> None:
+        with self._lock:
+            self.checkins += 1
+            self.checked_out = max(self.checked_out - 1, 0)
+
+    def on_invalidate(self, *_args) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self) -> dict:
+        pool = self.pool
+        with self._lock:
+            histogram = {
+                f"le_{bound}ms": count
+                for bound, count in zip(WAIT_BUCKETS_MS, self.wait_buckets)
+            }
+            histogram["le_inf"] = self.wait_buckets[-1]
+            data = {
+                "pool_class": type(pool).__name__ if pool is not None else None,
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "checkout_wait": {
+                    "count": self.wait_count,
+                    "avg_ms": round(self.wait_total_ms / self.wait_count, 3)
+                    if self.wait_count
+                    else 0.0,
+                    "max_ms": round(self.wait_max_ms, 3),
+                    "histogram": histogram,
+                },
+            }
+
+        # Live numbers straight from the pool (QueuePool family only)
+        if isinstance(pool, QueuePool):
+            data.update(
+                size=pool.size(),
+                checked_in=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+                pool_checked_out=pool.checkedout(),
+                timeout_s=pool.timeout(),
+            )
+        return data
+
+
+class _TimedCheckoutMixin:
+    """Times the (possibly blocking) wait for a pooled connection."""
+
+    _metrics: PoolMetrics | None = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            if self._metrics is not None:
+                self._metrics.record_timeout()
+            raise
+        finally:
+            if self._metrics is not None:
+                self._metrics.observe_wait((time.perf_counter() - start) * 1000)
+
+    def recreate(self):
+        # Pool.recreate() (used by engine.dispose) must keep the metrics hook
+        new_pool = super().recreate()
+        new_pool._metrics = self._metrics
+        if self._metrics is not None:
+            self._metrics.pool = new_pool
+        return new_pool
+
+
+class InstrumentedQueuePool(_TimedCheckoutMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+_registry: dict[str, PoolMetrics] = {}
+
+
+def instrument_engine(name: str, engine) -> PoolMetrics:
+    """
+    Attach metrics to an Engine / AsyncEngine pool and register them under
+    `name` (e.g. "primary", "replica-0", "async-primary").
+    """
+    sync_engine = getattr(engine, "sync_engine", engine)
+    pool = sync_engine.pool
+
+    metrics = PoolMetrics(name)
+    metrics.pool = pool
+    if isinstance(pool, _TimedCheckoutMixin):
+        pool._metrics = metrics
+
+    event.listen(sync_engine, "connect", metrics.on_connect)
+    event.listen(sync_engine, "checkout", metrics.on_checkout)
+    event.listen(sync_engine, "checkin", metrics.on_checkin)
+    event.listen(sync_engine, "invalidate", metrics.on_invalidate)
+
+    _registry[name] = metrics
+    return metrics
+
+
+def pool_stats() -> dict[str, dict]:
+    """Snapshot of every instrumented pool, keyed by engine name."""
+    return {name: m.snapshot() for name, m in _registry.items()}
@@ -0,0 +1,130 @@
+# backend/app/utils/principal_cache.py
+"""
+Bounded TTL cache of authenticated user principals.
+
+`get_current_user` looks the token subject up here before going to the
+database, so an authenticated request normally costs one dict lookup.
+Entries are immutable `UserPrincipal` snapshots (never live ORM objects,
+which would be shared across threads and sessions).
+
+Anything that changes a user (`auth_service.create_user`,
+`users.update_user_role`) calls `invalidate_user`. Changes made by another
+worker process are picked up when the entry expires (AUTH_PRINCIPAL_CACHE_TTL).
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from app.config import get_settings
+from app.models.user import User, UserRole
+
+
+@dataclass(frozen=True)
+class UserPrincipal:
+    """Read-only view of a User: everything auth checks and UserOut need."""
+    id: UUID
+    email: str
+    full_name: str | None
+    role: UserRole
+    is_active: bool
+    is_superuser: bool
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserPrincipal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            role=user.role,
+            is_active=user.is_active,
+            is_superuser=user.is_superuser,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+
+class PrincipalCache:
+    """LRU + TTL map of token subject → UserPrincipal, with hit/miss counters."""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, UserPrincipal]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl > 0
+
+    def get(self, subject: str) -> UserPrincipal | None:
+        with self._lock:
+            entry = self._entries.get(subject)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[subject]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(subject)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, subject: str, principal: UserPrincipal) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[subject] = (time.monotonic() + self.ttl, principal)
+            self._entries.move_to_end(subject)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: UUID | None, email: str | None) -> None:
+        """Drop every entry for this user (subjects are email or id)."""
+        keys = {subject_key(email=email), subject_key(user_id=user_id)}
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_s": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def subject_key(*, email: str | None = None, user_id: UUID | str | None = None) -> str:
+    """Cache key for a token subject (tokens carry `email`, older ones only `sub`)."""
+    if email:
+        return f"email:{email}"
+    return f"id:{user_id}"
+
+
+_settings = get_settings()
+principal_cache = PrincipalCache(
+    max_entries=_settings.auth_principal_cache_max_entries,
+    ttl=_settings.auth_principal_cache_ttl,
+)
+
+
+def invalidate_user(user: User) -> None:
+    principal_cache.invalidate_user(user.id, user.email)
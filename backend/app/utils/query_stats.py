@@ -0,0 +1,103 @@
+# backend/app/utils/query_stats.py
+"""
+Per-request SQL statement counting and timing.
+
+`app.database` feeds every cursor execution into `record_query`. The request
+middleware opens a `QueryStats` for each request (stored in a ContextVar, which
+is copied into the threadpool / child tasks, so sync and async handlers both
+report into the same object) and turns it into a `Server-Timing` header.
+
+`query_budget` is the test-mode guard: it counts statements across all
+threads while active and fails when a block runs more than it declared.
+"""
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class QueryStats:
+    """Statement count + DB time for one request."""
+
+    __slots__ = ("count", "total_ms", "_lock")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, duration_ms: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total_ms += duration_ms
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.total_ms:.2f};desc="{self.count} queries"'
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def start_request_stats() -> QueryStats:
+    """Begin collecting for the current request (call from middleware)."""
+    stats = QueryStats()
+    _current.set(stats)
+    return stats
+
+
+def current_stats() -> QueryStats | None:
+    return _current.get()
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised by `query_budget` when a block runs too many statements."""
+
+
+class _Budget:
+    def __init__(self, max_queries: int):
+        self.max_queries = max_queries
+        self.statements: list[str] = []
+
+
+_budgets: list[_Budget] = []
+_budgets_lock = threading.Lock()
+
+
+@contextmanager
+def query_budget(max_queries: int):
+    """
+    Fail if the wrapped block executes more than `max_queries` statements.
+
+        with query_budget(2):
+            client.get("/api/v1/projects/some-slug")
+
+    Yields the budget so tests can also assert on `.statements`.
+    """
+    budget = _Budget(max_queries)
+    with _budgets_lock:
+        _budgets.append(budget)
+    try:
+        yield budget
+    finally:
+        with _budgets_lock:
+            _budgets.remove(budget)
+
+    if len(budget.statements) > max_queries:
+        listing = "\n".join(
+            f"  {i}. {sql}" for i, sql in enumerate(budget.statements, 1)
+        )
+        raise QueryBudgetExceeded(
+            f"Expected at most {max_queries} queries, "
+            f"got {len(budget.statements)}:\n{listing}"
+        )
+
+
+def record_query(statement: str, duration_ms: float) -> None:
+    """Called once per executed statement (see app.database)."""
+    stats = _current.get()
+    if stats is not None:
+        stats.add(duration_ms)
+
+    if _budgets:
+        with _budgets_lock:
+            for budget in _budgets:
+                budget.statements.append(" ".join(statement.split())[:200])
@@ -0,0 +1,198 @@
+# backend/app/utils/rate_limit.py
+"""
+Token-bucket rate limiting (used for login admission control).
+
+A bucket holds up to `capacity` tokens and refills at `rate` tokens per
+second; each attempt takes one token, and an empty bucket means "429, retry
+in N seconds".
+
+Backends:
+  - InMemoryRateLimiter: per-process dict (LRU-bounded). Limits are per
+                         worker.
+  - RedisRateLimiter:    one Redis hash per bucket, updated atomically by a
+                         Lua script using the Redis clock, so limits hold
+                         across workers and hosts. Its calls block; async
+                         handlers go through `check_login_allowed_async`.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from starlette.concurrency import run_in_threadpool
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    retry_after: int = 0  # whole seconds, for the Retry-After header
+
+
+def take_token(
+    tokens: float,
+    updated_at: float,
+    now: float,
+    capacity: float,
+    rate: float,
+) -> tuple[bool, float, float]:
+    """
+    One bucket step: refill for the elapsed time, then try to take a token.
+    Returns (allowed, tokens_left, seconds_until_next_token).
+    """
+    tokens = min(capacity, tokens + max(0.0, now - updated_at) * rate)
+    if tokens >= 1:
+        return True, tokens - 1, 0.0
+    return False, tokens, (1 - tokens) / rate
+
+
+class InMemoryRateLimiter:
+    blocking = False  # calls never wait on I/O
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, capacity: float, rate: float) -> RateLimitResult:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (capacity, now))
+            allowed, tokens, wait = take_token(tokens, updated_at, now, capacity, rate)
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return RateLimitResult(allowed, math.ceil(wait))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+# KEYS[1] = bucket; ARGV = capacity, rate (tokens/s)
+# Returns {allowed (0/1), wait_ms}. Same math as take_token().
+_TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local wait_ms = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+  allowed = 1
+else
+  wait_ms = math.ceil((1 - tokens) / rate * 1000)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, wait_ms}
+"""
+
+
+class RedisRateLimiter:
+    """
+    Shared limiter. If Redis is unreachable we fail open (allow) and log:
+    the limiter protects CPU, it must not lock everyone out.
+    """
+
+    blocking = True  # every call is a network round trip
+
+    def __init__(self, client, prefix: str = "ratelimit:"):
+        self.client = client
+        self.prefix = prefix
+        self._script = client.register_script(_TOKEN_BUCKET_LUA)
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisRateLimiter":
+        import redis  # imported on demand: only this backend uses it
+
+        return cls(redis.Redis.from_url(url))
+
+    def hit(self, key: str, capacity: float, rate: float) -> RateLimitResult:
+        try:
+            allowed, wait_ms = self._script(keys=[self.prefix + key], args=[capacity, rate])
+        except Exception:
+            logger.warning("Rate limiter unavailable, allowing request", exc_info=True)
+            return RateLimitResult(True)
+        return RateLimitResult(bool(int(allowed)), math.ceil(int(wait_ms) / 1000))
+
+
+# ---------------------------------------------------------
+# Login limiter
+# ---------------------------------------------------------
+_login_limiter: InMemoryRateLimiter | RedisRateLimiter | None = None
+_login_limiter_ready = False
+
+
+def get_login_limiter():
+    """The configured login limiter (built on first use), or None if disabled."""
+    global _login_limiter, _login_limiter_ready
+    if not _login_limiter_ready:
+        settings = get_settings()
+        kind = (settings.login_rate_limit_backend or "none").lower()
+        if kind == "memory":
+            _login_limiter = InMemoryRateLimiter()
+        elif kind == "redis":
+            if not settings.login_rate_limit_redis_url:
+                raise ValueError("LOGIN_RATE_LIMIT_REDIS_URL is not set in the environment.")
+            _login_limiter = RedisRateLimiter.from_url(settings.login_rate_limit_redis_url)
+        else:
+            _login_limiter = None
+        _login_limiter_ready = True
+    return _login_limiter
+
+
+def set_login_limiter(limiter) -> None:
+    """Swap the login limiter (tests, or None to disable)."""
+    global _login_limiter, _login_limiter_ready
+    _login_limiter = limiter
+    _login_limiter_ready = True
+
+
+def check_login_allowed(ip: str | None, account: str) -> RateLimitResult:
+    """
+    Take one token from the caller's IP bucket and one from the account's
+    bucket. Denied if either is empty.
+    """
+    limiter = get_login_limiter()
+    if limiter is None:
+        return RateLimitResult(True)
+
+    settings = get_settings()
+    ip_result = limiter.hit(
+        f"login:ip:{ip or 'unknown'}",
+        settings.login_ip_burst,
+        settings.login_ip_per_minute / 60,
+    )
+    if not ip_result.allowed:
+        return ip_result
+
+    return limiter.hit(
+        f"login:account:{account.strip().lower()}",
+        settings.login_account_burst,
+        settings.login_account_per_minute / 60,
+    )
+
+
+async def check_login_allowed_async(ip: str | None, account: str) -> RateLimitResult:
+    """`check_login_allowed` for async handlers: Redis calls run in the threadpool."""
+    limiter = get_login_limiter()
+    if limiter is not None and limiter.blocking:
+        return await run_in_threadpool(check_login_allowed, ip, account)
+    return check_login_allowed(ip, account)
@@ -0,0 +1,363 @@
+# backend/app/utils/response_cache.py
+"""
+Response cache for public GET endpoints.
+
+Endpoints opt in with `@cache_response("projects", "services")`, naming the
+tables their response is built from. `DBSessionRoute` then serves repeat
+requests from the cache without resolving dependencies or touching the
+database.
+
+Keys are `route path + sorted query params + table generations`. Every
+committed session that wrote to a table bumps that table's generation, so
+old entries simply stop being looked up (and age out via TTL / LRU) — no
+key scanning, and it works the same for admin handlers, webhooks and
+scripts.
+
+Cached endpoints also get a strong ETag (hash of the body, stored with
+the cache entry). `If-None-Match` is answered with 304 straight from the
+cache entry, without running or serializing anything. Because the ETag is
+content-based it is stable across workers and restarts.
+
+Backends:
+  - LRUCacheBackend:   per-process OrderedDict (default)
+  - RedisCacheBackend: anything speaking the Redis protocol; generations
+                       live in Redis too, so all workers invalidate together.
+                       Its calls block, so handlers make them in the
+                       threadpool, never on the event loop.
+
+A miss is filled with reads pinned to the primary: the miss is usually
+caused by a generation bump, and a replica that hasn't replayed that
+commit yet would otherwise be cached under the new key for the full TTL.
+"""
+from __future__ import annotations
+
+import hashlib
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_mapper
+from starlette.concurrency import run_in_threadpool
+
+from app.config import get_settings
+from app.database import primary_reads
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------
+# Backends
+# ---------------------------------------------------------
+class LRUCacheBackend:
+    """In-process LRU with per-entry TTL."""
+
+    blocking = False  # calls never wait on I/O
+    shared = False  # generations only see this process's commits
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def generations(self, tables: tuple[str, ...]) -> list[int]:
+        with self._lock:
+            return [self._generations.get(t, 0) for t in tables]
+
+    def bump(self, table: str) -> None:
+        with self._lock:
+            self._generations[table] = self._generations.get(table, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisCacheBackend:
+    """
+    Redis-protocol backend. `client` is a redis-py style client (or a fake
+    with get/set/mget/incr). Errors are logged and treated as cache misses,
+    so a Redis outage degrades to uncached responses.
+    """
+
+    blocking = True  # every call is a network round trip
+    shared = True  # generations are bumped by every worker
+
+    def __init__(self, client, prefix: str = "respcache:"):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisCacheBackend":
+        import redis  # imported on demand: only this backend uses it
+
+        return cls(redis.Redis.from_url(url))
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            return self.client.get(self.prefix + key)
+        except Exception:
+            logger.warning("Response cache GET failed", exc_info=True)
+            return None
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        try:
+            self.client.set(self.prefix + key, value, ex=ttl)
+        except Exception:
+            logger.warning("Response cache SET failed", exc_info=True)
+
+    def generations(self, tables: tuple[str, ...]) -> list[int]:
+        try:
+            values = self.client.mget([f"{self.prefix}gen:{t}" for t in tables])
+        except Exception:
+            logger.warning("Response cache MGET failed", exc_info=True)
+            values = [None] * len(tables)
+        return [int(v) if v is not None else 0 for v in values]
+
+    def bump(self, table: str) -> None:
+        try:
+            self.client.incr(f"{self.prefix}gen:{table}")
+        except Exception:
+            logger.warning("Response cache invalidation failed for %s", table, exc_info=True)
+
+
+_backend: LRUCacheBackend | RedisCacheBackend | None = None
+_backend_ready = False
+
+
+def get_cache_backend():
+    """The configured backend (built on first use), or None if disabled."""
+    global _backend, _backend_ready
+    if not _backend_ready:
+        settings = get_settings()
+        kind = (settings.response_cache_backend or "none").lower()
+        if kind == "memory":
+            _backend = LRUCacheBackend(settings.response_cache_max_entries)
+        elif kind == "redis":
+            if not settings.response_cache_redis_url:
+                raise ValueError("RESPONSE_CACHE_REDIS_URL is not set in the environment.")
+            _backend = RedisCacheBackend.from_url(settings.response_cache_redis_url)
+        else:
+            _backend = None
+        _backend_ready = True
+    return _backend
+
+
+def set_cache_backend(backend) -> None:
+    """Swap the backend (tests, or None to disable)."""
+    global _backend, _backend_ready
+    _backend = backend
+    _backend_ready = True
+
+
+# ---------------------------------------------------------
+# Endpoint opt-in + route handler wrapper
+# ---------------------------------------------------------
+@dataclass(frozen=True)
+class CachePolicy:
+    tables: tuple[str, ...]
+    ttl: int | None = None
+
+
+def cache_response(*tables: str, ttl: int | None = None):
+    """Mark a GET endpoint as cacheable; `tables` drive invalidation."""
+    def decorator(endpoint):
+        endpoint._response_cache = CachePolicy(tuple(tables), ttl)
+        return endpoint
+    return decorator
+
+
+def cache_key(request: Request, policy: CachePolicy, backend) -> str:
+    query = urlencode(sorted(request.query_params.multi_items()))
+    generations = backend.generations(policy.tables)
+    versions = ",".join(f"{t}:{g}" for t, g in zip(policy.tables, generations))
+    return f"{request.url.path}?{query}|{versions}"
+
+
+def _lookup(request: Request, policy: CachePolicy, backend) -> tuple[str, bytes | None]:
+    key = cache_key(request, policy, backend)
+    return key, backend.get(key)
+
+
+async def _call(backend, fn, *args):
+    """Run a backend call, in the threadpool if it blocks (Redis)."""
+    if backend.blocking:
+        return await run_in_threadpool(fn, *args)
+    return fn(*args)
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match check (weak comparison, as RFC 9110 asks for)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = (c.strip() for c in header.split(","))
+    return etag in (c[2:] if c.startswith("W/") else c for c in candidates)
+
+
+def _cached_response(request: Request, etag: str, body: bytes, cache_status: str) -> Response:
+    headers = {"ETag": etag, "X-Cache": cache_status}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def cached_route_handler(
+    handler: Callable[[Request], Awaitable[Response]],
+    policy: CachePolicy,
+) -> Callable[[Request], Awaitable[Response]]:
+    async def cached_handler(request: Request) -> Response:
+        if request.method != "GET":
+            return await handler(request)
+
+        backend = get_cache_backend()
+        if backend is None:
+            response = await handler(request)
+            if response.status_code != 200 or not hasattr(response, "body"):
+                return response
+            # Cache disabled: still honour conditional requests
+            etag = make_etag(response.body)
+            response.headers["ETag"] = etag
+            if etag_matches(request, etag):
+                return Response(status_code=304, headers={"ETag": etag})
+            return response
+
+        # Entries are stored as b'<etag>\n<body>'
+        key, entry = await _call(backend, _lookup, request, policy, backend)
+        if entry is not None:
+            etag, _, body = entry.partition(b"\n")
+            return _cached_response(request, etag.decode(), body, "HIT")
+
+        with primary_reads():
+            response = await handler(request)
+        if response.status_code != 200 or not hasattr(response, "body"):
+            return response
+
+        etag = make_etag(response.body)
+        ttl = policy.ttl or get_settings().response_cache_ttl
+        await _call(backend, backend.set, key, etag.encode() + b"\n" + response.body, ttl)
+        return _cached_response(request, etag, response.body, "MISS")
+
+    return cached_handler
+
+
+# ---------------------------------------------------------
+# Invalidation: bump table generations when a session commits writes
+# ---------------------------------------------------------
+# session.info["cache_writes"]: table name → primary keys written in this
+# transaction, or None when a bulk statement touched rows we can't name.
+def _writes(session: Session) -> dict[str, set | None]:
+    return session.info.setdefault("cache_writes", {})
+
+
+def note_written_row(session: Session, table: str, pk) -> None:
+    """Record one written row (used by write helpers that bypass the flush)."""
+    writes = _writes(session)
+    if table in writes and writes[table] is None:
+        return
+    writes.setdefault(table, set()).add(pk)
+
+
+def note_changed(session: Session, name: str) -> None:
+    """
+    Bump generation `name` when the session commits, for caches keyed on
+    something finer than a whole table (e.g. one period of a report). For a
+    table, this invalidates its cached responses without naming rows, so
+    row listeners have nothing to re-read (e.g. a counter column moved).
+    """
+    _writes(session).setdefault(name, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_rows(session, flush_context):
+    for obj in itertools.chain(session.new, session.dirty, session.deleted):
+        mapper = object_mapper(obj)
+        pk = mapper.primary_key_from_instance(obj)
+        pk = pk[0] if len(pk) == 1 else tuple(pk)
+        for table in mapper.tables:
+            note_written_row(session, table.name, pk)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_dml_tables(orm_execute_state):
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        # The write_service helpers report their row themselves
+        if orm_execute_state.execution_options.get("notes_written_rows"):
+            return
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None:
+            _writes(orm_execute_state.session)[table.name] = None
+
+
+_invalidation_listeners: list[Callable[[set[str]], None]] = []
+_row_listeners: list[Callable[[dict[str, set | None]], None]] = []
+
+
+def add_invalidation_listener(listener: Callable[[set[str]], None]) -> None:
+    """Call `listener(tables)` after every commit that wrote to `tables`."""
+    _invalidation_listeners.append(listener)
+
+
+def add_row_listener(listener: Callable[[dict[str, set | None]], None]) -> None:
+    """
+    Call `listener(writes)` after every commit that wrote rows, with
+    table → written primary keys (None: unknown rows, reload the table).
+    """
+    _row_listeners.append(listener)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_written_tables(session):
+    writes = session.info.pop("cache_writes", None)
+    if not writes:
+        return
+    tables = set(writes)
+    backend = get_cache_backend()
+    if backend is not None:
+        for table in tables:
+            backend.bump(table)
+    for listener in _invalidation_listeners:
+        listener(tables)
+    for listener in _row_listeners:
+        listener(writes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_written_tables(session):
+    session.info.pop("cache_writes", None)
@@ -0,0 +1,95 @@
+# backend/app/utils/token_revocation.py
+"""
+In-memory revocation check for claims-mode auth (AUTH_CLAIMS_MODE).
+
+Tokens carry the user's `token_version` as the `ver` claim. A token is
+valid only while `ver` equals the user's current version, and the version
+is bumped on role change or deactivation. This module keeps
+`user_id → current version` in memory, so the check is a dict lookup.
+
+  - Bumps made in this process are recorded right away (`remember`).
+  - Unknown users are loaded from the DB once, then trusted for
+    AUTH_TOKEN_VERSION_TTL seconds.
+  - With a shared response cache backend (Redis), `remember` also bumps
+    the generation `token_version:<user id>` there, and every check
+    compares it with the generation the entry was loaded under. A bump
+    made by another worker therefore takes effect on the next request.
+  - Without one, the TTL is the revocation window: another worker may
+    accept a revoked token for up to AUTH_TOKEN_VERSION_TTL seconds.
+  - Inactive users are recorded as REVOKED, which matches no token.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from uuid import UUID
+
+from app.config import get_settings
+from app.models.user import User
+from app.utils.response_cache import get_cache_backend
+
+REVOKED = -1
+
+
+class TokenVersionCache:
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # user id → (expires at, version, shared generation it was loaded under)
+        self._entries: OrderedDict[UUID, tuple[float, int, int | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: UUID, generation: int | None = None) -> int | None:
+        """Current version, REVOKED, or None if unknown / expired / bumped elsewhere."""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic() or entry[2] != generation:
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return entry[1]
+
+    def set(self, user_id: UUID, version: int, generation: int | None = None) -> None:
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.ttl, version, generation)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_settings = get_settings()
+token_versions = TokenVersionCache(
+    max_entries=_settings.auth_principal_cache_max_entries,
+    ttl=_settings.auth_token_version_ttl,
+)
+
+
+def _generation_name(user_id: UUID) -> str:
+    return f"token_version:{user_id}"
+
+
+def shared_generation(user_id: UUID) -> int | None:
+    """The user's generation in the shared backend, or None without one."""
+    backend = get_cache_backend()
+    if backend is None or not backend.shared:
+        return None
+    return backend.generations((_generation_name(user_id),))[0]
+
+
+def effective_version(user: User) -> int:
+    return user.token_version if user.is_active else REVOKED
+
+
+def remember(user: User) -> None:
+    """Record a user's version after a committed change (and tell other workers)."""
+    backend = get_cache_backend()
+    if backend is not None and backend.shared:
+        backend.bump(_generation_name(user.id))
+    token_versions.set(user.id, effective_version(user), shared_generation(user.id))
@@ -0,0 +1,190 @@
+# backend/benchmarks/bench_dashboard_stats.py
+"""
+Admin dashboard counters on a large synthetic dataset.
+
+  before: the count() queries the stats endpoints used to run one by one
+          (GET /stats/: 5, GET /projects/stats: 6, GET /inquiries/stats: 6)
+  after:  app.services.dashboard_stats, one statement per endpoint
+          (scalar subqueries, COUNT(*) FILTER, GROUP BY status)
+
+Rows are generated in a scratch schema (`bench_stats`, copies of the
+counted tables with their indexes) and the statements run against it
+through schema_translate_map. The schema is dropped afterwards unless
+--keep is given; --reuse skips seeding.
+
+Run from backend/ against a Postgres DATABASE_URL_LOCAL (migrated to head):
+
+    python -m benchmarks.bench_dashboard_stats [--rows 1000000] [--repeat 5]
+
+--rows is the inquiry count; there are half as many subscribers, a tenth
+as many projects, 1000 testimonials and 50 services.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from app.database import engine
+from app.models.inquiry import Inquiry, InquiryStatus
+from app.models.project import Project, ProjectStatus
+from app.models.service import Service
+from app.models.subscriber import Subscriber
+from app.models.testimonial import Testimonial
+from app.services import dashboard_stats
+
+SCHEMA = "bench_stats"
+TABLES = ("inquiries", "projects", "services", "subscribers", "testimonials")
+
+
+def _labels(enum) -> str:
+    # Enum columns store the member names
+    return "ARRAY[" + ", ".join(f"'{member.name}'" for member in enum) + "]"
+
+
+_SEED_SQL = {
+    "inquiries": f"""
+        INSERT INTO {SCHEMA}.inquiries (id, full_name, email, message, status, source)
+        SELECT gen_random_uuid(), 'Client ' || i, 'client' || i || '@example.com',
+               'Need a quote', ({_labels(InquiryStatus)})[1 + i % 4]::inquiry_status,
+               'website'
+        FROM generate_series(1, :rows) AS i
+    """,
+    "projects": f"""
+        INSERT INTO {SCHEMA}.projects (id, name, slug, status, is_featured)
+        SELECT gen_random_uuid(), 'Project ' || i, 'project-' || i,
+               ({_labels(ProjectStatus)})[1 + i % 4]::project_status, i % 10 = 0
+        FROM generate_series(1, :rows / 10) AS i
+    """,
+    "services": f"""
+        INSERT INTO {SCHEMA}.services (id, name, slug, is_active, display_order)
+        SELECT gen_random_uuid(), 'Service ' || i, 'service-' || i, true, i
+        FROM generate_series(1, 50) AS i
+    """,
+    "subscribers": f"""
+        INSERT INTO {SCHEMA}.subscribers (id, email)
+        SELECT gen_random_uuid(), 'subscriber' || i || '@example.com'
+        FROM generate_series(1, :rows / 2) AS i
+    """,
+    "testimonials": f"""
+        INSERT INTO {SCHEMA}.testimonials
+            (id, name, quote, is_featured, is_active, display_order)
+        SELECT gen_random_uuid(), 'Client ' || i, 'Great work', false, true, i
+        FROM generate_series(1, 1000) AS i
+    """,
+}
+
+
+def legacy_statements() -> list[tuple[str, object]]:
+    """(endpoint, statement) for every query the old handlers ran."""
+    count = lambda model, *where: (  # noqa: E731
+        select(func.count()).select_from(model).where(*where)
+    )
+    statements = [
+        ("/stats/", count(model))
+        for model in (Service, Project, Inquiry, Testimonial, Subscriber)
+    ]
+    statements.append(("/projects/stats", count(Project)))
+    statements += [
+        ("/projects/stats", count(Project, Project.status == status))
+        for status in (
+            ProjectStatus.COMPLETED,
+            ProjectStatus.ONGOING,
+            ProjectStatus.PLANNED,
+            ProjectStatus.ON_HOLD,
+        )
+    ]
+    statements.append(("/projects/stats", count(Project, Project.is_featured.is_(True))))
+    statements.append(("/inquiries/stats", count(Inquiry)))
+    statements += [
+        ("/inquiries/stats", count(Inquiry, Inquiry.status == status))
+        for status in InquiryStatus
+    ]
+    statements.append(
+        (
+            "/inquiries/stats",
+            count(Inquiry, Inquiry.status.in_(
+                [s for s in InquiryStatus if s != InquiryStatus.CLOSED]
+            )),
+        )
+    )
+    return statements
+
+
+AGGREGATES = {
+    "/stats/": dashboard_stats.entity_counts,
+    "/projects/stats": dashboard_stats.project_counts,
+    "/inquiries/stats": dashboard_stats.inquiry_counts,
+}
+
+
+def _seed(conn, rows: int):
+    conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    start = time.perf_counter()
+    for table in TABLES:
+        conn.execute(
+            text(f"CREATE TABLE {SCHEMA}.{table} (LIKE public.{table} INCLUDING ALL)")
+        )
+        conn.execute(text(_SEED_SQL[table]), {"rows": rows})
+        conn.execute(text(f"ANALYZE {SCHEMA}.{table}"))
+    print(f"seeded {rows} inquiries (+ related tables) in {time.perf_counter() - start:.1f}s")
+
+
+def _timed(fn, repeat: int) -> float:
+    fn()  # warm the buffer cache
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--reuse", action="store_true", help="skip seeding")
+    parser.add_argument("--keep", action="store_true", help="keep the scratch schema")
+    args = parser.parse_args()
+
+    if engine.dialect.name != "postgresql":
+        raise SystemExit("This benchmark needs Postgres.")
+
+    with engine.begin() as conn:
+        if not args.reuse:
+            _seed(conn, args.rows)
+
+    try:
+        with engine.connect().execution_options(
+            schema_translate_map={None: SCHEMA}
+        ) as conn, Session(bind=conn) as db:
+            legacy = legacy_statements()
+            print(f"{'endpoint':<18} {'before':>18} {'after':>18}")
+            totals = [0.0, 0.0]
+            for endpoint, aggregate in AGGREGATES.items():
+                statements = [stmt for e, stmt in legacy if e == endpoint]
+                before = _timed(lambda: [db.scalar(s) for s in statements], args.repeat)
+                after = _timed(lambda: aggregate(db), args.repeat)
+                totals[0] += before
+                totals[1] += after
+                print(
+                    f"{endpoint:<18} {before:9.1f} ms ({len(statements):>2}q)"
+                    f" {after:9.1f} ms ( 1q)"
+                )
+            print(
+                f"{'dashboard home':<18} {totals[0]:9.1f} ms ({len(legacy):>2}q)"
+                f" {totals[1]:9.1f} ms ({len(AGGREGATES):>2}q)"
+            )
+    finally:
+        if not args.keep:
+            with engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+
+if __name__ == "__main__":
+    main()
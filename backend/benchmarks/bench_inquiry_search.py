@@ -0,0 +1,216 @@
+# backend/benchmarks/bench_inquiry_search.py
+"""
+Admin inquiry search on a large synthetic table.
+
+  before: full_name/email/message ILIKE '%term%' (the old list_inquiries),
+          newest first, LIMIT 50
+  after:  app.services.list_queries.inquiries_page(search=..., full_text=True):
+          search_vector @@ websearch_to_tsquery OR email ILIKE (GIN + trigram),
+          LIMIT 50, newest first (the default) or the newest
+          RANK_CANDIDATES matches ranked by ts_rank (order=relevance)
+
+Without pg_trgm the email ILIKE branch can't use an index, so the
+benchmark then also times both orders with the tsvector predicate alone,
+which is what the planner is left with once the trigram index serves the
+email branch.
+
+Rows are generated in a scratch schema (`bench_search`, a copy of the
+inquiries table with its generated column and indexes), and the real
+statements run against it through schema_translate_map. The schema is
+dropped afterwards unless --keep is given; --reuse skips seeding.
+
+Run from backend/ against a Postgres DATABASE_URL_LOCAL (migrated to head,
+so the search column and indexes exist):
+
+    python -m benchmarks.bench_inquiry_search [--rows 1000000] [--repeat 5]
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+from sqlalchemy import bindparam, func, select, text
+from sqlalchemy.orm import Session
+
+from app.database import engine
+from app.models.inquiry import Inquiry, InquiryStatus
+from app.services import list_queries
+
+SCHEMA = "bench_search"
+
+# ~30 words per message: half from a small vocabulary of everyday words
+# (each in roughly half the rows), half from a long tail of 20k rarer
+# terms, plus an occasional "rareNNNN" token.
+_SEED_SQL = f"""
+INSERT INTO {SCHEMA}.inquiries
+    (id, full_name, email, phone, location, message, status, source, created_at, updated_at)
+SELECT
+    gen_random_uuid(),
+    'Client ' || i,
+    'client' || i || '@' || (ARRAY['gmail.com', 'yahoo.com', 'farm.co.ug'])[1 + i % 3],
+    '+2567' || lpad((i % 100000000)::text, 8, '0'),
+    (ARRAY['Kampala', 'Gulu', 'Mbarara', 'Jinja', 'Mbale'])[1 + i % 5],
+    (
+        SELECT string_agg(
+            CASE
+                WHEN random() < 0.5 THEN
+                    (ARRAY['need', 'quote', 'for', 'a', 'the', 'biogas', 'digester',
+                           'borehole', 'roof', 'house', 'school', 'clinic', 'farm',
+                           'road', 'water', 'tank', 'solar', 'fence', 'church', 'bridge'])
+                        [1 + floor(random() * 20)::int]
+                WHEN random() < 0.01 THEN 'rare' || ((i + w) % 5000)
+                ELSE 'item' || floor(random() * 20000)::int
+            END,
+            ' '
+        )
+        FROM generate_series(1, 30) AS w
+    ),
+    :status,
+    'website',
+    now() - (i || ' minutes')::interval,
+    now()
+FROM generate_series(1, :rows) AS i
+"""
+
+TERMS = [
+    ("common word", "biogas"),
+    ("uncommon word", "item4242"),
+    ("rare word", "rare4242"),
+    ("two words", "solar item123"),
+    ("partial email", "client1234"),
+]
+
+
+def legacy_search(term: str, limit: int = 50):
+    like = f"%{term.lower()}%"
+    return (
+        select(Inquiry)
+        .where(
+            Inquiry.full_name.ilike(like)
+            | Inquiry.email.ilike(like)
+            | Inquiry.message.ilike(like)
+        )
+        .order_by(Inquiry.created_at.desc())
+        .limit(limit)
+    )
+
+
+def tsvector_only(term: str, ranked: bool, limit: int = 50):
+    """inquiries_page's statement without the email ILIKE branch."""
+    query = func.websearch_to_tsquery("english", term)
+    stmt = select(Inquiry).where(Inquiry.search_vector.op("@@")(query))
+    if ranked:
+        candidates = (
+            stmt.with_only_columns(Inquiry.id)
+            .order_by(Inquiry.created_at.desc(), Inquiry.id.desc())
+            .limit(list_queries.RANK_CANDIDATES)
+        )
+        stmt = (
+            select(Inquiry)
+            .where(Inquiry.id.in_(candidates))
+            .order_by(func.ts_rank(Inquiry.search_vector, query).desc())
+        )
+    return stmt.order_by(Inquiry.created_at.desc(), Inquiry.id.desc()).limit(limit)
+
+
+def _seed(conn, rows: int):
+    conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    conn.execute(
+        text(f"CREATE TABLE {SCHEMA}.inquiries (LIKE public.inquiries INCLUDING ALL)")
+    )
+    start = time.perf_counter()
+    seed = text(_SEED_SQL).bindparams(
+        bindparam("status", InquiryStatus.NEW, type_=Inquiry.__table__.c.status.type),
+    )
+    conn.execute(seed, {"rows": rows})
+    # Same planner statistics as the migrated table
+    target = conn.scalar(
+        text(
+            "SELECT attstattarget FROM pg_attribute "
+            "WHERE attrelid = 'public.inquiries'::regclass AND attname = 'search_vector'"
+        )
+    )
+    if target is not None and target > 0:
+        conn.execute(
+            text(
+                f"ALTER TABLE {SCHEMA}.inquiries "
+                f"ALTER COLUMN search_vector SET STATISTICS {int(target)}"
+            )
+        )
+    conn.execute(text(f"ANALYZE {SCHEMA}.inquiries"))
+    print(f"seeded {rows} rows in {time.perf_counter() - start:.1f}s")
+
+
+def _median_ms(db: Session, stmt, repeat: int) -> tuple[float, int]:
+    db.scalars(stmt).all()  # warm the buffer cache
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        found = len(db.scalars(stmt).all())
+        db.expunge_all()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--reuse", action="store_true", help="skip seeding")
+    parser.add_argument("--keep", action="store_true", help="keep the scratch schema")
+    args = parser.parse_args()
+
+    if engine.dialect.name != "postgresql":
+        raise SystemExit("This benchmark needs Postgres.")
+
+    with engine.begin() as conn:
+        if not args.reuse:
+            _seed(conn, args.rows)
+
+    try:
+        with engine.connect().execution_options(
+            schema_translate_map={None: SCHEMA}
+        ) as conn, Session(bind=conn) as db:
+            has_trigram = db.scalar(
+                text(
+                    "SELECT count(*) FROM pg_indexes "
+                    "WHERE schemaname = :schema AND indexdef LIKE '%gin_trgm_ops%'"
+                ),
+                {"schema": SCHEMA},
+            )
+            if not has_trigram:
+                print("note: no email trigram index (pg_trgm), the email ILIKE branch scans")
+            header = f"{'search':<16} {'before (ILIKE)':>16} {'FTS newest':>13} {'FTS relevance':>16}"
+            if not has_trigram:
+                header += f" {'tsv newest':>13} {'tsv relevance':>16}"
+            print(header + "   rows")
+            for label, term in TERMS:
+                before, found = _median_ms(db, legacy_search(term), args.repeat)
+                timings = [before]
+                for ranked in (False, True):
+                    ms, found_fts = _median_ms(
+                        db,
+                        list_queries.inquiries_page(
+                            search=term, full_text=True, ranked=ranked, limit=50
+                        ),
+                        args.repeat,
+                    )
+                    timings.append(ms)
+                if not has_trigram:
+                    for ranked in (False, True):
+                        ms, _ = _median_ms(db, tsvector_only(term, ranked), args.repeat)
+                        timings.append(ms)
+                line = f"{label:<16} {timings[0]:13.1f} ms {timings[1]:10.1f} ms {timings[2]:13.1f} ms"
+                if not has_trigram:
+                    line += f" {timings[3]:10.1f} ms {timings[4]:13.1f} ms"
+                print(f"{line}   {found}/{found_fts}")
+    finally:
+        if not args.keep:
+            with engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+# backend/benchmarks/bench_list_statements.py
+"""
+Per-request Python overhead of the hot list queries: building the statement
+and producing its cache key (what SQLAlchemy does on every execute before
+it can reuse compiled SQL from the engine's cache).
+
+  before: a fresh select()/Query chain per request (the old handlers)
+  after:  app.services.list_queries lambda statements
+
+Run from backend/:
+
+    python -m benchmarks.bench_list_statements [--rounds 20000]
+
+No database connection is needed, but DATABASE_URL_LOCAL must be set since
+the app settings are loaded when the models are imported.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Query
+
+from app.models.campaign import Campaign, CampaignStatus
+from app.models.donation import Donation, DonationStatus
+from app.models.project import Project, ProjectStatus
+from app.models.service import Service
+from app.services import list_queries
+
+
+# ---------------------------------------------------------
+# "before": the statements as the handlers used to build them
+# ---------------------------------------------------------
+def legacy_projects(status, is_featured, service_slug, offset, limit):
+    stmt = select(Project)
+    if status is not None:
+        stmt = stmt.where(Project.status == status)
+    if is_featured is not None:
+        stmt = stmt.where(Project.is_featured == is_featured)
+    if service_slug:
+        stmt = stmt.join(Service, Project.service_id == Service.id).where(
+            Service.slug == service_slug
+        )
+    count = select(func.count()).select_from(stmt.subquery())
+    page = stmt.order_by(Project.created_at.desc()).offset(offset).limit(limit)
+    return count, page
+
+
+def legacy_services(is_active, offset, limit):
+    return (
+        select(Service)
+        .where(Service.is_active == is_active)
+        .order_by(Service.display_order.asc(), Service.name.asc())
+        .offset(offset)
+        .limit(limit)
+    )
+
+
+def legacy_campaigns(status, is_featured, offset, limit):
+    stmt = select(Campaign)
+    if status is not None:
+        stmt = stmt.where(Campaign.status == status)
+    if is_featured is not None:
+        stmt = stmt.where(Campaign.is_featured == is_featured)
+    return (
+        stmt.order_by(Campaign.sort_order, Campaign.created_at.desc())
+        .offset(offset)
+        .limit(limit)
+    )
+
+
+def legacy_donations(campaign_id, status, date_from, date_to, offset, limit):
+    query = Query(Donation)
+    if campaign_id is not None:
+        query = query.filter(Donation.campaign_id == campaign_id)
+    if status is not None:
+        query = query.filter(Donation.status == status)
+    if date_from is not None:
+        query = query.filter(Donation.created_at >= date_from)
+    if date_to is not None:
+        query = query.filter(Donation.created_at <= date_to)
+    return (
+        query.order_by(Donation.created_at.desc())
+        .offset(offset)
+        .limit(limit)
+        ._statement_20()
+    )
+
+
+# ---------------------------------------------------------
+# Workloads (same request mix for both sides)
+# ---------------------------------------------------------
+def _requests(rounds):
+    now = datetime.utcnow()
+    campaign_id = uuid4()
+    for i in range(rounds):
+        yield dict(
+            status=ProjectStatus.ONGOING if i % 2 else None,
+            is_featured=True if i % 3 == 0 else None,
+            service_slug="roads" if i % 5 == 0 else None,
+            campaign_status=CampaignStatus.ACTIVE if i % 2 else None,
+            donation_status=DonationStatus.CONFIRMED,
+            campaign_id=campaign_id if i % 4 == 0 else None,
+            date_from=now - timedelta(days=i % 30),
+            offset=(i % 7) * 10,
+            limit=10 + i % 3,
+        )
+
+
+def run_legacy(rounds):
+    for r in _requests(rounds):
+        for stmt in (
+            *legacy_projects(
+                r["status"], r["is_featured"], r["service_slug"], r["offset"], r["limit"]
+            ),
+            legacy_services(True, r["offset"], r["limit"]),
+            legacy_campaigns(r["campaign_status"], r["is_featured"], r["offset"], r["limit"]),
+            legacy_donations(
+                r["campaign_id"], r["donation_status"], r["date_from"], None,
+                r["offset"], r["limit"],
+            ),
+        ):
+            stmt._generate_cache_key()
+
+
+def run_cached(rounds):
+    for r in _requests(rounds):
+        filters = dict(
+            status=r["status"],
+            is_featured=r["is_featured"],
+            service_slug=r["service_slug"],
+        )
+        for stmt in (
+            list_queries.projects_count(**filters),
+            list_queries.projects_page(**filters, offset=r["offset"], limit=r["limit"]),
+            list_queries.services_page(offset=r["offset"], limit=r["limit"]),
+            list_queries.campaigns_page(
+                status=r["campaign_status"],
+                is_featured=r["is_featured"],
+                offset=r["offset"],
+                limit=r["limit"],
+            ),
+            list_queries.admin_donations_page(
+                campaign_id=r["campaign_id"],
+                status=r["donation_status"],
+                date_from=r["date_from"],
+                offset=r["offset"],
+                limit=r["limit"],
+            ),
+        ):
+            stmt._generate_cache_key()
+
+
+def _time(fn, rounds):
+    fn(min(rounds, 200))  # warm up caches
+    start = time.perf_counter()
+    fn(rounds)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=20000)
+    args = parser.parse_args()
+
+    legacy = _time(run_legacy, args.rounds)
+    cached = _time(run_cached, args.rounds)
+
+    # Each round is one request to each of the four endpoints
+    per_legacy = legacy / (args.rounds * 4) * 1e6
+    per_cached = cached / (args.rounds * 4) * 1e6
+
+    print(f"rounds: {args.rounds} (x4 endpoints)")
+    print(f"before (select/Query chain): {per_legacy:8.1f} µs/request")
+    print(f"after  (lambda statements):  {per_cached:8.1f} µs/request")
+    print(f"speedup: {per_legacy / per_cached:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
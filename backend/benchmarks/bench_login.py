@@ -0,0 +1,94 @@
+# backend/benchmarks/bench_login.py
+"""
+Login throughput and catalog latency during a login burst.
+
+  before: bcrypt verify inline in a sync handler (request threadpool,
+          40 threads by default), as the old `login` did
+  after:  app.utils.hashing.verify_and_update_async (bounded bcrypt pool)
+
+While the burst runs, a steady stream of "catalog requests" (trivial
+threadpool jobs, like a sync GET handler) is timed. The old path parks
+every threadpool thread in bcrypt, so those requests stall.
+
+Run from backend/:
+
+    python -m benchmarks.bench_login [--logins 80] [--rounds 12] [--workers 2]
+
+No database is needed.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=80)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--queue", type=int, default=1000)
+    return parser.parse_args()
+
+
+async def _catalog_probe(stop: asyncio.Event, latencies: list[float]):
+    from fastapi.concurrency import run_in_threadpool
+
+    while not stop.is_set():
+        start = time.perf_counter()
+        await run_in_threadpool(lambda: None)
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(0.005)
+
+
+async def _run(login_one, logins: int):
+    stop = asyncio.Event()
+    latencies: list[float] = []
+    probe = asyncio.create_task(_catalog_probe(stop, latencies))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(login_one() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await probe
+    return elapsed, latencies
+
+
+def _report(label: str, logins: int, elapsed: float, latencies: list[float]):
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1] if latencies else 0.0
+    print(
+        f"{label:<28} {logins / elapsed:7.1f} logins/s   "
+        f"catalog p50 {statistics.median(latencies):8.2f} ms   p99 {p99:8.2f} ms"
+    )
+
+
+def main():
+    args = _parse_args()
+    os.environ["BCRYPT_ROUNDS"] = str(args.rounds)
+    os.environ["PASSWORD_HASH_WORKERS"] = str(args.workers)
+    os.environ["PASSWORD_HASH_MAX_QUEUE"] = str(args.queue)
+
+    from fastapi.concurrency import run_in_threadpool
+
+    from app.utils import hashing
+
+    stored = hashing.hash_password("benchmark-password")
+
+    async def inline_login():
+        await run_in_threadpool(hashing.verify_password, "benchmark-password", stored)
+
+    async def pooled_login():
+        await hashing.verify_and_update_async("benchmark-password", stored)
+
+    print(f"{args.logins} concurrent logins, bcrypt cost {args.rounds}, {args.workers} hashing workers")
+    _report("before (inline threadpool)", args.logins, *asyncio.run(_run(inline_login, args.logins)))
+    _report("after  (bounded pool)", args.logins, *asyncio.run(_run(pooled_login, args.logins)))
+
+
+if __name__ == "__main__":
+    main()
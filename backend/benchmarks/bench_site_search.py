@@ -0,0 +1,165 @@
+# backend/benchmarks/bench_site_search.py
+"""
+Public site search latency on the in-memory index.
+
+Builds app.services.search_index.SearchIndex from synthetic (unsaved)
+projects, services and campaigns, then times a mix of one-word, two-word
+and prefix queries, single-row incremental updates (what an admin write
+costs the index), and searches served while a full reload runs in another
+thread. Text is drawn from a Zipf-weighted vocabulary
+whose first 45 words are construction terms common enough to occur in
+nearly every document; queries made only of those are timed separately
+as the worst case.
+
+Run from backend/:
+
+    python -m benchmarks.bench_site_search [--projects 5000] [--queries 5000]
+
+No database connection is needed, but DATABASE_URL_LOCAL must be set since
+the app settings are loaded when the models are imported.
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import random
+import threading
+import time
+from uuid import uuid4
+
+from app.models.campaign import Campaign, CampaignStatus
+from app.models.project import Project
+from app.models.service import Service
+from app.services.search_index import KINDS_BY_TABLE, SearchIndex
+
+COMMON = (
+    "biogas digester borehole solar water tank school clinic roof road bridge "
+    "church fence farm irrigation drainage latrine classroom dormitory kitchen "
+    "renovation construction concrete steel timber brick plumbing electrical "
+    "community district village kampala gulu mbarara jinja mbale lira soroti "
+    "rainwater harvesting pump pipeline reservoir footbridge culvert"
+).split()
+_SYLLABLES = [c + v for c in "bklmnrt" for v in "aeiou"]
+
+
+def _vocabulary(rng: random.Random, size: int) -> tuple[list[str], list[float]]:
+    """The common words followed by a long tail, Zipf-weighted by rank (cumulative weights)."""
+    words = list(COMMON)
+    seen = set(words)
+    while len(words) < size:
+        word = "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4)))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words, list(itertools.accumulate(1 / rank for rank in range(1, size + 1)))
+
+
+WORDS, WEIGHTS = _vocabulary(random.Random(0), 20_000)
+
+
+def _text(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choices(WORDS, cum_weights=WEIGHTS, k=n))
+
+
+def _docs(rng: random.Random, projects: int):
+    for i in range(projects):
+        yield "projects", Project(
+            id=uuid4(),
+            name=f"{_text(rng, 3).title()} {i}",
+            slug=f"project-{i}",
+            location=rng.choice(["Kampala", "Gulu", "Mbarara", "Jinja"]),
+            technologies=[rng.choice(COMMON) for _ in range(3)],
+            short_description=_text(rng, 20),
+            description=_text(rng, 120),
+        )
+    for i in range(max(10, projects // 100)):
+        yield "services", Service(
+            id=uuid4(),
+            name=_text(rng, 2).title(),
+            slug=f"service-{i}",
+            tagline=_text(rng, 8),
+            highlight_1=_text(rng, 6),
+            highlight_2=_text(rng, 6),
+            is_active=True,
+        )
+    for i in range(max(10, projects // 20)):
+        yield "campaigns", Campaign(
+            id=uuid4(),
+            name=_text(rng, 3).title(),
+            slug=f"campaign-{i}",
+            status=CampaignStatus.ACTIVE,
+            short_description=_text(rng, 20),
+            description=_text(rng, 80),
+        )
+
+
+def _percentiles(samples: list[float]) -> str:
+    samples.sort()
+    pick = lambda q: samples[min(len(samples) - 1, int(len(samples) * q))]  # noqa: E731
+    return f"p50 {pick(0.5):7.3f} ms   p99 {pick(0.99):7.3f} ms   max {samples[-1]:7.3f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--projects", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=5000)
+    args = parser.parse_args()
+    rng = random.Random(42)
+
+    index = SearchIndex()
+    docs = list(_docs(rng, args.projects))
+    start = time.perf_counter()
+    for table, obj in docs:
+        index.upsert(KINDS_BY_TABLE[table], [obj])
+    print(f"indexed {len(index)} docs in {time.perf_counter() - start:.2f}s")
+
+    def query(pick) -> str:
+        shape = rng.random()
+        if shape < 0.4:
+            return pick()
+        if shape < 0.8:
+            return f"{pick()} {pick()}"
+        return pick()[:3]
+
+    # Words drawn like the text itself, and the worst case: only the words
+    # that occur in nearly every document
+    typical = [
+        query(lambda: rng.choices(WORDS, cum_weights=WEIGHTS)[0])
+        for _ in range(args.queries)
+    ]
+    common = [query(lambda: rng.choice(COMMON)) for _ in range(args.queries)]
+    for label, queries in (("typical", typical), ("common words", common)):
+        latencies = []
+        for q in queries:
+            start = time.perf_counter()
+            index.search(q, limit=20)
+            latencies.append((time.perf_counter() - start) * 1000)
+        print(f"search, {label:<13} {_percentiles(latencies)}")
+
+    updates = []
+    projects = KINDS_BY_TABLE["projects"]
+    for table, obj in rng.sample([d for d in docs if d[0] == "projects"], 500):
+        obj.description = _text(rng, 120)
+        start = time.perf_counter()
+        index.upsert(projects, [obj])
+        updates.append((time.perf_counter() - start) * 1000)
+    print(f"incremental update (500 rows) {_percentiles(updates)}")
+
+    # A full reload (what a TTL expiry triggers) builds the new shard off the
+    # index lock, so searches keep being answered while it runs
+    project_rows = [obj for table, obj in docs if table == "projects"]
+    reload = threading.Thread(target=index.replace_kind, args=(projects, project_rows))
+    latencies = []
+    start = time.perf_counter()
+    reload.start()
+    while reload.is_alive():
+        query_start = time.perf_counter()
+        index.search(rng.choice(common), limit=20)
+        latencies.append((time.perf_counter() - query_start) * 1000)
+    reload.join()
+    print(f"full reload of {len(project_rows)} projects in {time.perf_counter() - start:.2f}s")
+    print(f"search during the reload    {_percentiles(latencies)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,11 +5,37 @@ import sys
 import pytest
 from fastapi.testclient import TestClient
 
+# TestClient runs each request on a fresh event loop, so pooled asyncpg
+# connections can't be reused between requests. Must be set before app import.
+os.environ.setdefault("DATABASE_ASYNC_NULL_POOL", "true")
+
+# Minimum bcrypt cost and no login throttling: the suite logs in hundreds
+# of times from the same client (test_login_rate_limit enables it)
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+os.environ.setdefault("LOGIN_RATE_LIMIT_BACKEND", "none")
+
+# Fast mode: `TEST_DB_BACKEND=sqlite pytest` runs the suite against an
+# in-memory SQLite database instead of Postgres (no database to provision,
+# one private database per process, so it also works with pytest -n).
+# The sync and async engines share it through SQLite's shared cache.
+SQLITE_TEST_URL = "sqlite:///file:construction_test?mode=memory&cache=shared&uri=true"
+USE_SQLITE = os.environ.get("TEST_DB_BACKEND", "").lower() == "sqlite"
+
+if USE_SQLITE:
+    os.environ["APP_ENV"] = "test"
+    os.environ["DATABASE_URL_LOCAL"] = SQLITE_TEST_URL
+    os.environ["DATABASE_URL_REPLICAS"] = ""
+
 from app.main import app
-from app.database import SessionLocal
+from app.database import Base, SessionLocal, engine
+from app import models  # noqa: F401  register every table on Base.metadata
 from app.models.user import User, UserRole
 from app.utils.hashing import hash_password  # ✅ use the real helper
 
+if USE_SQLITE:
+    # A fresh in-memory database has no schema (Postgres is migrated ahead)
+    Base.metadata.create_all(bind=engine)
+
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # Ensure the backend root (this directory) is on sys.path
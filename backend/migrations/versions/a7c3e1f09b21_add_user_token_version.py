@@ -0,0 +1,35 @@
+"""add users.token_version
+
+Revision ID: a7c3e1f09b21
+Revises: 4d0b4935f14e
+Create Date: 2026-10-18 11:02:14.512033
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c3e1f09b21"
+down_revision: Union[str, Sequence[str], None] = "4d0b4935f14e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "users",
+        sa.Column(
+            "token_version",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("users", "token_version")
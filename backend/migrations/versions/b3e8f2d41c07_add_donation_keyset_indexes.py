@@ -0,0 +1,42 @@
+"""add composite indexes for donation keyset pagination
+
+Revision ID: b3e8f2d41c07
+Revises: a7c3e1f09b21
+Create Date: 2026-10-18 13:40:52.208114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3e8f2d41c07"
+down_revision: Union[str, Sequence[str], None] = "a7c3e1f09b21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_donations_created_at_id",
+        "donations",
+        ["created_at", "id"],
+    )
+    op.create_index(
+        "ix_donations_status_created_at_id",
+        "donations",
+        ["status", "created_at", "id"],
+    )
+    op.create_index(
+        "ix_donations_campaign_created_at_id",
+        "donations",
+        ["campaign_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_donations_campaign_created_at_id", table_name="donations")
+    op.drop_index("ix_donations_status_created_at_id", table_name="donations")
+    op.drop_index("ix_donations_created_at_id", table_name="donations")
@@ -0,0 +1,42 @@
+"""add composite indexes for inquiry and subscriber keyset pagination
+
+Revision ID: c9a4d7e2b5f3
+Revises: b3e8f2d41c07
+Create Date: 2026-10-18 14:21:07.663410
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c9a4d7e2b5f3"
+down_revision: Union[str, Sequence[str], None] = "b3e8f2d41c07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_inquiries_created_at_id",
+        "inquiries",
+        ["created_at", "id"],
+    )
+    op.create_index(
+        "ix_inquiries_status_created_at_id",
+        "inquiries",
+        ["status", "created_at", "id"],
+    )
+    op.create_index(
+        "ix_subscribers_created_at_id",
+        "subscribers",
+        ["created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_subscribers_created_at_id", table_name="subscribers")
+    op.drop_index("ix_inquiries_status_created_at_id", table_name="inquiries")
+    op.drop_index("ix_inquiries_created_at_id", table_name="inquiries")
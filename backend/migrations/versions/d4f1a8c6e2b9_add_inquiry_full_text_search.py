@@ -0,0 +1,63 @@
+"""add full-text search to inquiries (tsvector + GIN, email trigram)
+
+Revision ID: d4f1a8c6e2b9
+Revises: c9a4d7e2b5f3
+Create Date: 2026-10-18 15:05:33.918270
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "d4f1a8c6e2b9"
+down_revision: Union[str, Sequence[str], None] = "c9a4d7e2b5f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match Inquiry.search_vector (app/models/inquiry.py)
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(full_name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(email, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(message, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(location, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rewrites the table once to compute the column for existing rows
+    op.add_column(
+        "inquiries",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_SQL, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_inquiries_search_vector",
+        "inquiries",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+    # Partial email matches (ILIKE '%foo%') via trigrams
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_inquiries_email_trgm",
+        "inquiries",
+        ["email"],
+        postgresql_using="gin",
+        postgresql_ops={"email": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_inquiries_email_trgm", table_name="inquiries")
+    op.drop_index("ix_inquiries_search_vector", table_name="inquiries")
+    op.drop_column("inquiries", "search_vector")
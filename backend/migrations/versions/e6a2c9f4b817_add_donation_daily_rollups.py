@@ -0,0 +1,47 @@
+"""add donation_daily_rollups
+
+Revision ID: e6a2c9f4b817
+Revises: d4f1a8c6e2b9
+Create Date: 2026-10-18 17:12:40.381552
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e6a2c9f4b817"
+down_revision: Union[str, Sequence[str], None] = "d4f1a8c6e2b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    The table starts empty: backfill it with
+    `python -m app.scripts.rebuild_donation_rollups`.
+    """
+    op.create_table(
+        "donation_daily_rollups",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("campaign_id", sa.UUID(), nullable=False),
+        sa.Column("currency", sa.String(length=3), nullable=False),
+        sa.Column("payment_method", sa.String(length=50), nullable=False),
+        sa.Column("amount_total", sa.BigInteger(), nullable=False),
+        sa.Column("donation_count", sa.Integer(), nullable=False),
+        sa.Column("donor_sketch", sa.LargeBinary(), nullable=False),
+        sa.PrimaryKeyConstraint("day", "campaign_id", "currency", "payment_method"),
+    )
+    op.create_index(
+        "ix_donation_daily_rollups_campaign",
+        "donation_daily_rollups",
+        ["campaign_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_donation_daily_rollups_campaign", table_name="donation_daily_rollups")
+    op.drop_table("donation_daily_rollups")
@@ -0,0 +1,37 @@
+"""add webhook_events (payment webhook idempotency)
+
+Revision ID: f3d8b1e7a925
+Revises: e6a2c9f4b817
+Create Date: 2026-10-18 19:02:11.564093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "f3d8b1e7a925"
+down_revision: Union[str, Sequence[str], None] = "e6a2c9f4b817"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "webhook_events",
+        sa.Column("event_key", sa.String(length=200), nullable=False),
+        sa.Column("provider", sa.String(length=50), nullable=True),
+        sa.Column("event_type", sa.String(length=100), nullable=True),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("donation_id", sa.UUID(), nullable=True),
+        sa.Column("outcome", sa.JSON(), nullable=False),
+        sa.Column("received_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("event_key"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("webhook_events")
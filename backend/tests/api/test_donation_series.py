@@ -0,0 +1,168 @@
+# tests/api/test_donation_series.py
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+from app import database
+from app.config import settings
+from app.database import SessionLocal
+from app.models.campaign import Campaign
+from app.models.donation import Donation, DonationStatus
+from app.services import donation_series
+from app.services.payment_provider_service import apply_webhook_to_donation
+from app.utils.query_stats import query_budget
+from app.utils.response_cache import LRUCacheBackend, get_cache_backend, set_cache_backend
+
+SERIES = "/api/v1/stats/donations/series"
+
+
+def _confirmed_donation(db, campaign_id, amount, day, *, method="mtn_momo", email=None):
+    donation = Donation(
+        amount=amount,
+        currency="UGX",
+        donor_email=email,
+        payment_method=method,
+        campaign_id=campaign_id,
+        provider_session_id=f"sess-{uuid4().hex}",
+        status=DonationStatus.PENDING,
+        created_at=datetime(2026, 1, day, 12, tzinfo=timezone.utc),
+    )
+    db.add(donation)
+    db.commit()
+    apply_webhook_to_donation(
+        db, {"session_id": donation.provider_session_id, "status": "success"}
+    )
+    return donation
+
+
+def _campaign_points(client, headers, campaign_id, **params):
+    resp = client.get(SERIES, params={"group_by": "campaign", **params}, headers=headers)
+    assert resp.status_code == 200, resp.text
+    series = [s for s in resp.json()["series"] if s["key"] == str(campaign_id)]
+    return series[0] if series else None
+
+
+def test_series_buckets_and_groups(client, admin_token_headers):
+    db = SessionLocal()
+    try:
+        campaign = Campaign(name="Series", slug=f"series-{uuid4().hex[:8]}", currency="UGX")
+        db.add(campaign)
+        db.commit()
+        campaign_id = campaign.id
+        # Mon 5 Jan and Tue 20 Jan 2026: two ISO weeks, one month
+        _confirmed_donation(db, campaign_id, 10_000, 5, email="a@example.com")
+        _confirmed_donation(db, campaign_id, 5_000, 5, method="card", email="b@example.com")
+        _confirmed_donation(db, campaign_id, 20_000, 20, email="a@example.com")
+    finally:
+        db.close()
+
+    weekly = _campaign_points(
+        client, admin_token_headers, campaign_id,
+        bucket="week", start="2026-01-01", end="2026-01-31",
+    )
+    assert weekly["label"] == "Series"
+    assert weekly["currency"] == "UGX"
+    points = {p["period_start"]: p for p in weekly["points"]}
+    assert list(points)[0] == "2025-12-29"  # ranges widen to whole weeks
+    assert (points["2026-01-05"]["amount"], points["2026-01-05"]["count"]) == (15_000, 2)
+    assert (points["2026-01-19"]["amount"], points["2026-01-19"]["donors"]) == (20_000, 1)
+    assert points["2026-01-12"]["amount"] == 0
+
+    monthly = _campaign_points(
+        client, admin_token_headers, campaign_id,
+        bucket="month", start="2026-01-01", end="2026-01-31",
+    )
+    assert [(p["amount"], p["count"], p["donors"]) for p in monthly["points"]] == [(35_000, 3, 2)]
+
+    resp = client.get(
+        SERIES,
+        params={
+            "bucket": "day",
+            "start": "2026-01-05",
+            "end": "2026-01-05",
+            "group_by": "payment_method",
+        },
+        headers=admin_token_headers,
+    )
+    methods = {s["key"] for s in resp.json()["series"]}
+    assert {"mtn_momo", "card"} <= methods
+
+
+def test_series_periods_are_cached_until_they_change(client, admin_token_headers):
+    db = SessionLocal()
+    try:
+        campaign = Campaign(name="Cached", slug=f"cached-{uuid4().hex[:8]}", currency="UGX")
+        db.add(campaign)
+        db.commit()
+        donation = _confirmed_donation(db, campaign.id, 1_000, 7)
+        params = {"bucket": "week", "start": "2026-01-01", "end": "2026-01-31"}
+
+        assert _campaign_points(client, admin_token_headers, campaign.id, **params)
+        # Every week is cached now: only auth + campaign labels, no rollup scan
+        with query_budget(2) as budget:
+            _campaign_points(client, admin_token_headers, campaign.id, **params)
+        assert not any("FROM donation_daily_rollups" in s for s in budget.statements)
+
+        # A refund in a closed week invalidates just that week
+        apply_webhook_to_donation(
+            db, {"session_id": donation.provider_session_id, "status": "refunded"}
+        )
+        assert _campaign_points(client, admin_token_headers, campaign.id, **params) is None
+    finally:
+        db.close()
+
+
+def test_series_keeps_closed_periods_long_only_on_a_shared_backend(
+    client, admin_token_headers, monkeypatch
+):
+    primary_fills = []
+    aggregate = donation_series._aggregate
+
+    def recording_aggregate(*args):
+        primary_fills.append(database._primary_reads.get())
+        return aggregate(*args)
+
+    monkeypatch.setattr(donation_series, "_aggregate", recording_aggregate)
+    today = datetime.now(timezone.utc).date()
+    params = {"bucket": "month", "start": (today - timedelta(days=40)).isoformat()}
+
+    def fill_ttls(shared: bool) -> dict[date, int]:
+        backend = LRUCacheBackend()
+        backend.shared = shared
+        ttls = {}
+        store = backend.set
+
+        def recording_set(key, value, ttl):
+            ttls[date.fromisoformat(key.split(":")[3])] = ttl
+            return store(key, value, ttl)
+
+        backend.set = recording_set
+        set_cache_backend(backend)
+        resp = client.get(SERIES, params=params, headers=admin_token_headers)
+        assert resp.status_code == 200, resp.text
+        return ttls
+
+    previous = get_cache_backend()
+    try:
+        # Per-process generations: another worker's donations would never
+        # invalidate these, so nothing outlives the response cache TTL
+        ttls = fill_ttls(shared=False)
+        assert set(ttls.values()) == {settings.response_cache_ttl}
+
+        ttls = fill_ttls(shared=True)
+        current = donation_series.period_start(today, "month")
+        assert ttls.pop(current) == settings.response_cache_ttl
+        assert ttls and set(ttls.values()) == {donation_series.SERIES_CACHE_TTL}
+    finally:
+        set_cache_backend(previous)
+
+    # Misses are filled from the primary, never a lagging replica
+    assert primary_fills == [True, True]
+
+
+def test_series_rejects_bad_ranges(client, admin_token_headers):
+    for params in (
+        {"start": "2026-02-01", "end": "2026-01-01"},
+        {"bucket": "day", "start": "2020-01-01", "end": "2026-01-01"},  # too many buckets
+    ):
+        resp = client.get(SERIES, params=params, headers=admin_token_headers)
+        assert resp.status_code == 400
@@ -136,3 +136,48 @@ def test_list_donations_filter_by_date_range(client, admin_token_headers):
     ids = {item["id"] for item in data}
     assert recent_id in ids
     assert old_id not in ids
+
+
+def test_list_donations_cursor_pages_through_filtered_results(client, admin_token_headers):
+    db = SessionLocal()
+    try:
+        c = create_campaign(db)
+        other = create_campaign(db)
+        now = datetime.now(timezone.utc)
+        # Two donations share a timestamp so the id tie-breaker is exercised
+        stamps = [now - timedelta(minutes=m) for m in (1, 2, 2, 3, 4)]
+        expected = [
+            str(create_donation(db, campaign_id=c.id, created_at=ts).id)
+            for ts in stamps
+        ]
+        create_donation(db, campaign_id=other.id, created_at=now)
+        campaign_id = str(c.id)
+    finally:
+        db.close()
+
+    seen = []
+    cursor = None
+    for _ in range(5):
+        url = f"/api/v1/donations?campaign_id={campaign_id}&limit=2"
+        if cursor:
+            url += f"&cursor={cursor}"
+        resp = client.get(url, headers=admin_token_headers)
+        assert resp.status_code == 200
+        seen.extend(item["id"] for item in resp.json())
+        cursor = resp.headers.get("x-next-cursor")
+        if cursor is None:
+            break
+
+    assert len(seen) == len(expected)
+    assert set(seen) == set(expected)
+    # Newest first; ties come back in a stable order
+    assert seen[0] == expected[0]
+    assert seen[-1] == expected[-1]
+
+
+def test_list_donations_invalid_cursor(client, admin_token_headers):
+    resp = client.get(
+        "/api/v1/donations?cursor=not-a-cursor",
+        headers=admin_token_headers,
+    )
+    assert resp.status_code == 400
@@ -1,11 +1,18 @@
 # tests/api/test_donations_webhook.py
 
 import json
+import threading
+from uuid import uuid4
+
 import pytest
 
 from app.config import settings
+from app.database import SessionLocal
 from app.models.donation import DonationStatus
+from app.models.webhook_event import WebhookEvent
 from app.services.payment_provider_service import _compute_signature
+from app.services.webhook_events import event_key, forget_recent_events, process_webhook_event
+from app.utils.query_stats import query_budget
 
 
 def _create_test_campaign(client, admin_token_headers, slug: str):
@@ -158,3 +165,144 @@ def test_donation_webhook_invalid_signature_does_not_change_state(
     updated = resp_get.json()
     assert updated["status"] == DonationStatus.PENDING.value
 
+
+
+def test_donation_webhook_duplicate_delivery_is_answered_once(
+    client, admin_token_headers, monkeypatch
+):
+    campaign = _create_test_campaign(client, admin_token_headers, slug="webhook-replay")
+
+    monkeypatch.setattr(settings, "payment_provider_name", "dummy")
+    monkeypatch.setattr(settings, "payment_webhook_secret", "testsecret")
+
+    resp_intent = client.post(
+        "/api/v1/donations",
+        json={
+            "amount": 45_000,
+            "currency": "UGX",
+            "campaign_id": campaign["id"],
+            "payment_method": "mtn_momo",
+        },
+    )
+    assert resp_intent.status_code == 201, resp_intent.text
+    provider_session_id = resp_intent.json()["provider_session_id"]
+
+    event = {
+        "id": f"evt-{uuid4().hex}",
+        "provider": "dummy",
+        "event_type": "payment.success",
+        "session_id": provider_session_id,
+        "status": "success",
+    }
+    body = json.dumps(event).encode("utf-8")
+    headers = {"X-Payment-Signature": _compute_signature("testsecret", body)}
+
+    first = client.post("/api/v1/donations/webhook", data=body, headers=headers)
+    assert first.status_code == 200, first.text
+    assert first.json()["status"] == DonationStatus.CONFIRMED.value
+
+    # Same process: answered from the recent-events filter
+    with query_budget(0):
+        again = client.post("/api/v1/donations/webhook", data=body, headers=headers)
+    assert again.json() == first.json()
+
+    # Another process: one lookup in webhook_events, the donation isn't touched
+    forget_recent_events()
+    with query_budget(1) as budget:
+        again = client.post("/api/v1/donations/webhook", data=body, headers=headers)
+    assert again.json() == first.json()
+    assert "webhook_events" in budget.statements[0]
+
+    key = event_key(event, body)
+    assert key == f"dummy:{event['id']}"
+    assert event_key({}, body).startswith("sha256:")
+    # Over-long ids are hashed whole, so a shared prefix can't collide
+    long_ids = [{"provider": "dummy", "id": "x" * 250 + suffix} for suffix in "ab"]
+    long_keys = {event_key(e, body) for e in long_ids}
+    assert len(long_keys) == 2
+    assert all(k.startswith("id-sha256:") and len(k) <= 200 for k in long_keys)
+    db = SessionLocal()
+    try:
+        stored = db.get(WebhookEvent, key)
+        assert stored.outcome == first.json()
+        assert str(stored.donation_id) == first.json()["donation_id"]
+    finally:
+        db.close()
+
+
+def test_confirming_webhook_leaves_homepage_and_search_to_the_next_request(
+    client, monkeypatch
+):
+    from app.api.v1 import donations as donations_api
+    from app.models.campaign import Campaign, CampaignStatus
+    from app.models.donation import Donation
+    from app.services import site_service
+
+    monkeypatch.setattr(settings, "payment_provider_name", "dummy")
+    monkeypatch.setattr(settings, "payment_webhook_secret", "testsecret")
+
+    db = SessionLocal()
+    try:
+        campaign = Campaign(
+            name="Featured webhook campaign",
+            slug=f"featured-{uuid4().hex[:8]}",
+            currency="UGX",
+            status=CampaignStatus.ACTIVE,
+            is_featured=True,
+            sort_order=-1000,
+        )
+        db.add(campaign)
+        db.flush()
+        donation = Donation(
+            amount=75_000,
+            currency="UGX",
+            campaign_id=campaign.id,
+            provider_session_id=f"sess-{uuid4().hex}",
+            status=DonationStatus.PENDING,
+        )
+        db.add(donation)
+        db.commit()
+        campaign_id, updated_at = campaign.id, campaign.updated_at
+        session_id = donation.provider_session_id
+    finally:
+        db.close()
+    client.get("/api/v1/site/home")
+    assert site_service._snapshot is not None
+
+    threads = []
+
+    def process(*args):
+        threads.append(threading.current_thread().name)
+        return process_webhook_event(*args)
+
+    monkeypatch.setattr(donations_api, "process_webhook_event", process)
+    body = json.dumps(
+        {"provider": "dummy", "session_id": session_id, "status": "success"}
+    ).encode("utf-8")
+    # Webhook lookup, donation lock, its update, rollup, raised_amount, event
+    with query_budget(6) as budget:
+        resp = client.post(
+            "/api/v1/donations/webhook",
+            data=body,
+            headers={"X-Payment-Signature": _compute_signature("testsecret", body)},
+        )
+    assert resp.status_code == 200, resp.text
+    assert threads and threads[0].startswith("AnyIO worker thread")
+
+    # The raised_amount bump neither rebuilt the homepage nor re-read the
+    # campaign for the search index after the commit...
+    assert site_service._snapshot is None
+    for sql in budget.statements:
+        assert "FROM testimonials" not in sql and "FROM services" not in sql
+        assert not sql.lstrip().startswith("SELECT campaigns"), sql
+
+    # ...the next homepage request rebuilds the snapshot with the new total
+    home = client.get("/api/v1/site/home").json()
+    featured = {c["id"]: c for c in home["featured_campaigns"]}
+    assert featured[str(campaign_id)]["raised_amount"] == 75_000
+
+    db = SessionLocal()
+    try:
+        assert db.get(Campaign, campaign_id).updated_at == updated_at
+    finally:
+        db.close()
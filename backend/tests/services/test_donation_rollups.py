@@ -0,0 +1,149 @@
+# tests/services/test_donation_rollups.py
+from uuid import uuid4
+
+from app.database import SessionLocal
+from app.models.campaign import Campaign
+from app.models.donation import Donation, DonationStatus
+from app.models.donation_rollup import DonationDailyRollup
+from app.services.donation_rollups import rebuild_rollups, reconcile_raised_amounts
+from app.services.payment_provider_service import apply_webhook_to_donation
+from app.utils.hll import HyperLogLog
+
+
+def _bucket(db, campaign_id):
+    db.expire_all()
+    return db.query(DonationDailyRollup).filter_by(campaign_id=campaign_id).one_or_none()
+
+
+def _webhook(db, donation, status):
+    apply_webhook_to_donation(
+        db, {"session_id": donation.provider_session_id, "status": status}
+    )
+
+
+def test_hyperloglog_counts_and_merges():
+    assert HyperLogLog().count() == 0
+    small = HyperLogLog.of(["a@example.com", "b@example.com", "a@example.com"])
+    assert small.count() == 2
+
+    left = HyperLogLog.of(f"donor{i}@example.com" for i in range(6000))
+    right = HyperLogLog.of(f"donor{i}@example.com" for i in range(4000, 10000))
+    left.merge(right.to_bytes())
+    assert abs(left.count() - 10000) < 10000 * 0.06
+    assert HyperLogLog(left.to_bytes()).count() == left.count()
+
+
+def test_status_changes_move_the_rollup_in_the_same_transaction():
+    db = SessionLocal()
+    try:
+        campaign = Campaign(name="Rollups", slug=f"rollups-{uuid4().hex[:8]}", currency="UGX")
+        db.add(campaign)
+        db.flush()
+        donations = [
+            Donation(
+                amount=amount,
+                currency="UGX",
+                donor_email=email,
+                payment_method="mtn_momo",
+                campaign_id=campaign.id,
+                provider_session_id=f"sess-{uuid4().hex}",
+                status=DonationStatus.PENDING,
+            )
+            for amount, email in (
+                (50_000, "a@example.com"),
+                (30_000, "A@example.com "),
+                (20_000, "c@example.com"),
+            )
+        ]
+        db.add_all(donations)
+        db.commit()
+
+        for donation in donations:
+            _webhook(db, donation, "success")
+        _webhook(db, donations[0], "success")  # duplicate delivery: no-op
+
+        bucket = _bucket(db, campaign.id)
+        assert (bucket.amount_total, bucket.donation_count) == (100_000, 3)
+        assert HyperLogLog(bucket.donor_sketch).count() == 2
+        assert (bucket.currency, bucket.payment_method) == ("UGX", "mtn_momo")
+
+        _webhook(db, donations[2], "refunded")
+        bucket = _bucket(db, campaign.id)
+        assert (bucket.amount_total, bucket.donation_count) == (80_000, 2)
+        assert HyperLogLog(bucket.donor_sketch).count() == 1
+
+        incremental = (bucket.day, bucket.amount_total, bucket.donation_count, bucket.donor_sketch)
+        rebuild_rollups(db)
+        db.commit()
+        bucket = _bucket(db, campaign.id)
+        assert (bucket.day, bucket.amount_total, bucket.donation_count, bucket.donor_sketch) == incremental
+
+        for donation in donations[:2]:
+            _webhook(db, donation, "refunded")
+        assert _bucket(db, campaign.id) is None
+    finally:
+        db.close()
+
+
+def test_donation_summary_reads_rollups(client, admin_token_headers):
+    db = SessionLocal()
+    try:
+        rebuild_rollups(db)
+        db.commit()
+        before = client.get("/api/v1/stats/donations/summary", headers=admin_token_headers).json()
+
+        donation = Donation(
+            amount=7_000,
+            currency="UGX",
+            donor_email=f"summary-{uuid4().hex[:8]}@example.com",
+            provider_session_id=f"sess-{uuid4().hex}",
+            status=DonationStatus.PENDING,
+        )
+        db.add(donation)
+        db.commit()
+        _webhook(db, donation, "success")
+    finally:
+        db.close()
+
+    after = client.get("/api/v1/stats/donations/summary", headers=admin_token_headers).json()
+    assert after["month_total"] == before["month_total"] + 7_000
+    assert after["donors_count"] >= before["donors_count"]
+
+
+def test_webhook_keeps_campaign_raised_amount_and_progress(client):
+    db = SessionLocal()
+    try:
+        slug = f"raised-{uuid4().hex[:8]}"
+        campaign = Campaign(name="Raised", slug=slug, currency="UGX", target_amount=400_000)
+        db.add(campaign)
+        db.flush()
+        donations = [
+            Donation(
+                amount=amount,
+                currency=currency,
+                campaign_id=campaign.id,
+                provider_session_id=f"sess-{uuid4().hex}",
+                status=DonationStatus.PENDING,
+            )
+            for amount, currency in ((100_000, "UGX"), (50_000, "UGX"), (20, "USD"))
+        ]
+        db.add_all(donations)
+        db.commit()
+
+        for donation in donations:
+            _webhook(db, donation, "success")
+        _webhook(db, donations[1], "refunded")
+
+        data = client.get(f"/api/v1/campaigns/{slug}").json()
+        assert data["raised_amount"] == 100_000  # other currencies don't count
+        assert data["progress_percent"] == 25.0
+
+        db.query(Campaign).filter_by(id=campaign.id).update({"raised_amount": 1})
+        db.commit()
+        assert reconcile_raised_amounts(db) >= 1
+        db.commit()
+        db.expire_all()
+        assert db.get(Campaign, campaign.id).raised_amount == 100_000
+        assert reconcile_raised_amounts(db) == 0
+    finally:
+        db.close()
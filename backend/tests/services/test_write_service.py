@@ -0,0 +1,70 @@
+# backend/tests/services/test_write_service.py
+from decimal import Decimal
+
+from app.database import Base, SessionLocal, engine
+from app.models.donation import Donation, DonationStatus
+from app.models.subscriber import Subscriber
+from app.schemas.donation import DonationCreate
+from app.services.donation_service import create_donation_with_session
+from app.services.write_service import (
+    commit_keep_loaded,
+    insert_returning,
+    update_returning,
+)
+from app.utils.query_stats import query_budget
+
+
+def setup_module():
+    Base.metadata.create_all(bind=engine)
+
+
+def test_insert_and_update_returning_skip_refresh():
+    db = SessionLocal()
+    try:
+        db.query(Subscriber).filter(
+            Subscriber.email.in_(["returning@example.com", "returned@example.com"])
+        ).delete()
+        db.commit()
+
+        # INSERT ... RETURNING + COMMIT, nothing else
+        with query_budget(2):
+            subscriber = insert_returning(
+                db, Subscriber, {"email": "returning@example.com"}
+            )
+            commit_keep_loaded(db)
+            assert subscriber.id is not None
+            assert subscriber.created_at is not None  # server default
+
+        with query_budget(2):
+            updated = update_returning(
+                db, Subscriber, subscriber.id, {"email": "returned@example.com"}
+            )
+            commit_keep_loaded(db)
+            assert updated is subscriber
+            assert updated.email == "returned@example.com"
+    finally:
+        db.close()
+
+
+def test_donation_with_session_is_one_transaction():
+    db = SessionLocal()
+    try:
+        payload = DonationCreate(
+            amount=Decimal("25.00"),
+            currency="UGX",
+            donor_name="Returning Donor",
+            payment_method="mtn_momo",
+        )
+
+        # INSERT ... RETURNING + COMMIT (no campaign lookup without campaign_id)
+        with query_budget(2):
+            donation, session_info = create_donation_with_session(db, payload)
+            assert donation.status == DonationStatus.PENDING
+            assert donation.provider_session_id == session_info["session_id"]
+            assert str(donation.id) in session_info["session_id"]
+
+        stored = db.get(Donation, donation.id)
+        assert stored.provider_status == "created"
+        assert stored.payment_method == "mtn_momo"
+    finally:
+        db.close()
@@ -0,0 +1,32 @@
+# backend/tests/test_async_db.py
+from fastapi.testclient import TestClient
+
+from app.config import Settings
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_async_database_url_swaps_driver():
+    s = Settings(
+        app_env="development",
+        database_url_local="postgresql+psycopg2://u:p@localhost:5432/db",
+    )
+    assert s.async_database_url == "postgresql+asyncpg://u:p@localhost:5432/db"
+
+    s = Settings(
+        app_env="development",
+        database_url_local="postgresql://u:p@localhost/db",
+    )
+    assert s.async_database_url == "postgresql+asyncpg://u:p@localhost/db"
+
+
+def test_async_list_endpoints_respond():
+    for path in (
+        "/api/v1/services",
+        "/api/v1/projects?sort=featured",
+        "/api/v1/campaigns",
+        "/api/v1/testimonials",
+    ):
+        resp = client.get(path)
+        assert resp.status_code == 200, (path, resp.text)
@@ -0,0 +1,115 @@
+# backend/tests/test_claims_auth.py
+import pytest
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.user import User, UserRole
+from app.schemas.user import UserCreate
+from app.services.auth_service import bump_token_version, create_user
+from app.utils.query_stats import query_budget
+from app.utils.response_cache import LRUCacheBackend, get_cache_backend, set_cache_backend
+from app.utils.token_revocation import _generation_name, token_versions
+
+
+@pytest.fixture(autouse=True)
+def claims_mode(monkeypatch):
+    monkeypatch.setattr(get_settings(), "auth_claims_mode", True)
+    token_versions.clear()
+    yield
+    token_versions.clear()
+
+
+def _upsert_user(role=UserRole.ADMIN, is_active=True):
+    db = SessionLocal()
+    create_user(
+        db,
+        UserCreate(
+            email="claims@auth.com",
+            full_name="Claims User",
+            password="claimspass",
+            role=role,
+            is_active=is_active,
+            is_superuser=False,
+        ),
+    )
+    db.close()
+
+
+def _login(client):
+    resp = client.post(
+        "/api/v1/auth/login",
+        data={"username": "claims@auth.com", "password": "claimspass"},
+    )
+    assert resp.status_code == 200, resp.text
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+def test_admin_check_uses_claims_without_db(client):
+    _upsert_user(role=UserRole.ADMIN)
+    headers = _login(client)
+
+    # The first request may load the token version once; then no queries
+    assert client.get("/api/v1/stats/db/pool", headers=headers).status_code == 200
+    with query_budget(0):
+        resp = client.get("/api/v1/stats/db/pool", headers=headers)
+    assert resp.status_code == 200
+
+
+def test_deactivation_revokes_tokens_immediately(client):
+    _upsert_user(role=UserRole.ADMIN)
+    headers = _login(client)
+    assert client.get("/api/v1/stats/db/pool", headers=headers).status_code == 200
+
+    _upsert_user(role=UserRole.ADMIN, is_active=False)
+    resp = client.get("/api/v1/stats/db/pool", headers=headers)
+    assert resp.status_code == 401
+
+
+def test_role_change_revokes_old_token(client):
+    _upsert_user(role=UserRole.ADMIN)
+    admin_headers = _login(client)
+
+    _upsert_user(role=UserRole.STAFF)
+    assert client.get("/api/v1/stats/db/pool", headers=admin_headers).status_code == 401
+
+    # A fresh token carries the new role claim
+    staff_headers = _login(client)
+    assert client.get("/api/v1/stats/db/pool", headers=staff_headers).status_code == 403
+
+
+def test_version_is_loaded_from_db_when_unknown(client):
+    _upsert_user(role=UserRole.ADMIN)
+    headers = _login(client)
+
+    # Simulate another worker: no in-memory version yet
+    token_versions.clear()
+    with query_budget(1):
+        resp = client.get("/api/v1/stats/db/pool", headers=headers)
+    assert resp.status_code == 200
+
+
+def test_revocation_by_another_worker_is_seen_through_shared_backend(client):
+    previous = get_cache_backend()
+    shared = LRUCacheBackend()
+    shared.shared = True  # stands in for Redis: one store for every worker
+    set_cache_backend(shared)
+    try:
+        _upsert_user(role=UserRole.ADMIN)
+        headers = _login(client)
+        assert client.get("/api/v1/stats/db/pool", headers=headers).status_code == 200
+
+        # Another worker deactivates the user: DB change + shared bump only
+        db = SessionLocal()
+        try:
+            user = db.query(User).filter_by(email="claims@auth.com").one()
+            user.is_active = False
+            bump_token_version(user)
+            db.commit()
+            shared.bump(_generation_name(user.id))
+        finally:
+            db.close()
+
+        resp = client.get("/api/v1/stats/db/pool", headers=headers)
+        assert resp.status_code == 401
+    finally:
+        set_cache_backend(previous)
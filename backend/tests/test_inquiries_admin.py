@@ -124,3 +124,130 @@ def test_can_add_internal_notes_via_put():
     assert resp.status_code == 200
     assert resp.json()["internal_notes"] == payload["internal_notes"]
 
+
+
+def _seed_dated_inquiries(source, count):
+    from datetime import datetime, timedelta, timezone
+
+    now = datetime.now(timezone.utc)
+    db = SessionLocal()
+    rows = [
+        Inquiry(
+            full_name=f"Cursor {i}",
+            email=f"cursor{i}@example.com",
+            status=InquiryStatus.NEW,
+            source=source,
+            # Pairs share a timestamp so the id tie-breaker is exercised
+            created_at=now - timedelta(minutes=i // 2),
+        )
+        for i in range(count)
+    ]
+    db.add_all(rows)
+    db.commit()
+    ids = {str(row.id) for row in rows}
+    db.close()
+    return ids
+
+
+def test_cursor_pagination_walks_filtered_inquiries():
+    from uuid import uuid4
+
+    source = f"cursor-{uuid4().hex[:8]}"
+    expected = _seed_dated_inquiries(source, 5)
+    headers = {"Authorization": f"Bearer {login()}"}
+
+    seen = []
+    params = {"source": source, "limit": 2}
+    while True:
+        resp = client.get("/api/v1/inquiries", params=params, headers=headers)
+        assert resp.status_code == 200
+        seen.extend(item["id"] for item in resp.json())
+        assert len(seen) < 1000, "cursor did not advance"
+        cursor = resp.headers.get("x-next-cursor")
+        if cursor is None:
+            break
+        params["cursor"] = cursor
+
+    assert len(seen) == len(expected)
+    assert set(seen) == expected
+
+
+def test_export_streams_ndjson():
+    import json
+    from uuid import uuid4
+
+    source = f"export-{uuid4().hex[:8]}"
+    expected = _seed_dated_inquiries(source, 3)
+
+    resp = client.get(
+        "/api/v1/inquiries/export",
+        params={"source": source},
+        headers={"Authorization": f"Bearer {login()}"},
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert {line["id"] for line in lines} == expected
+    assert all(line["source"] == source for line in lines)
+
+
+def test_search_matches_words_and_partial_email():
+    from uuid import uuid4
+
+    from app.api.v1.inquiries import FULL_TEXT_SEARCH
+
+    tag = uuid4().hex[:8]
+    db = SessionLocal()
+    in_message = Inquiry(
+        full_name="Message Match",
+        email=f"msg-{tag}@example.com",
+        message=f"We need solar panels {tag}zz for the farm",
+        source="search",
+    )
+    in_name = Inquiry(
+        full_name=f"Panels {tag}zz",
+        email=f"name-{tag}@example.com",
+        message="Something else entirely",
+        source="search",
+    )
+    db.add(in_name)
+    db.commit()
+    db.add(in_message)  # the newer of the two
+    db.commit()
+    message_id, name_id = str(in_message.id), str(in_name.id)
+    db.close()
+    headers = {"Authorization": f"Bearer {login()}"}
+
+    resp = client.get("/api/v1/inquiries", params={"search": f"{tag}zz"}, headers=headers)
+    assert resp.status_code == 200
+    assert [item["id"] for item in resp.json()] == [message_id, name_id]
+
+    resp = client.get(
+        "/api/v1/inquiries",
+        params={"search": f"{tag}zz", "order": "relevance"},
+        headers=headers,
+    )
+    ids = [item["id"] for item in resp.json()]
+    assert set(ids) == {message_id, name_id}
+    if FULL_TEXT_SEARCH:
+        # Name matches weigh more than message matches
+        assert ids == [name_id, message_id]
+
+    resp = client.get("/api/v1/inquiries", params={"search": f"msg-{tag[:5]}"}, headers=headers)
+    assert [item["id"] for item in resp.json()] == [message_id]
+
+    resp = client.get(
+        "/api/v1/inquiries",
+        params={"search": f"{tag}zz", "order": "newest", "limit": 1},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    assert "x-next-cursor" in resp.headers
+
+    resp = client.get(
+        "/api/v1/inquiries",
+        params={"search": "solar", "order": "relevance", "cursor": "anything"},
+        headers=headers,
+    )
+    assert resp.status_code == 400
@@ -0,0 +1,56 @@
+# backend/tests/test_lazy_sessions.py
+from sqlalchemy import inspect as sa_inspect
+
+from app.database import LazySession, SessionLocal, get_db
+from app.models.service import Service
+
+
+def _get_or_create_service(db) -> Service:
+    service = db.query(Service).filter(Service.slug == "lazy-session-svc").first()
+    if service is None:
+        service = Service(name="Lazy Session Service", slug="lazy-session-svc")
+        db.add(service)
+        db.commit()
+    return service
+
+
+def test_get_db_does_not_build_a_session_until_used():
+    gen = get_db()
+    db = next(gen)
+    assert isinstance(db, LazySession)
+    assert not db.started
+
+    gen.close()  # teardown on an unused session is a no-op
+    assert not db.started
+
+
+def test_release_returns_connection_and_keeps_loaded_state():
+    setup = SessionLocal()
+    _get_or_create_service(setup)
+    setup.close()
+
+    db = LazySession(SessionLocal)
+    service = db.query(Service).filter(Service.slug == "lazy-session-svc").one()
+    assert db.started
+    assert db.in_transaction()
+
+    db.release()
+
+    assert not db.in_transaction()
+    # attributes were not expired, so serialization needs no new query
+    assert not sa_inspect(service).expired_attributes
+    assert service.name == "Lazy Session Service"
+    db.close()
+
+
+def test_release_leaves_uncommitted_writes_alone():
+    db = LazySession(SessionLocal)
+    service = _get_or_create_service(db)
+
+    service.description = "changed but not committed"
+    db.flush()
+    db.release()
+
+    assert db.in_transaction()
+    db.rollback()
+    db.close()
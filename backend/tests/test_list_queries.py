@@ -0,0 +1,26 @@
+# backend/tests/test_list_queries.py
+from app.models.project import ProjectStatus
+from app.services import list_queries
+
+
+def test_same_shape_shares_cache_key_with_new_params():
+    a = list_queries.projects_page(status=ProjectStatus.ONGOING, offset=0, limit=10)
+    b = list_queries.projects_page(status=ProjectStatus.COMPLETED, offset=20, limit=5)
+
+    key_a = a._generate_cache_key()
+    key_b = b._generate_cache_key()
+    assert key_a == key_b
+
+    values = {p.value for p in key_b.bindparams}
+    assert {ProjectStatus.COMPLETED, 20, 5} <= values
+
+
+def test_different_filters_are_distinct_statements():
+    plain = list_queries.projects_page()
+    featured = list_queries.projects_page(is_featured=True)
+    oldest = list_queries.projects_page(sort="oldest")
+
+    keys = [s._generate_cache_key() for s in (plain, featured, oldest)]
+    assert keys[0] != keys[1]
+    assert keys[0] != keys[2]
+    assert keys[1] != keys[2]
@@ -0,0 +1,158 @@
+# backend/tests/test_login_rate_limit.py
+import threading
+import time
+
+import pytest
+from fastapi import Request
+from fastapi.testclient import TestClient
+
+from app.api.v1 import auth as auth_api
+from app.config import get_settings
+from app.main import app
+from app.utils.client_ip import client_ip
+from app.utils.rate_limit import (
+    InMemoryRateLimiter,
+    RedisRateLimiter,
+    get_login_limiter,
+    set_login_limiter,
+    take_token,
+)
+
+
+class FakeRedis:
+    """Runs the token-bucket script's logic in Python against a dict."""
+
+    def __init__(self):
+        self.buckets = {}
+        self.threads = set()
+
+    def register_script(self, lua):
+        def script(keys, args):
+            self.threads.add(threading.current_thread().name)
+            capacity, rate = float(args[0]), float(args[1])
+            now = time.time()
+            tokens, ts = self.buckets.get(keys[0], (capacity, now))
+            allowed, tokens, wait = take_token(tokens, ts, now, capacity, rate)
+            self.buckets[keys[0]] = (tokens, now)
+            return [int(allowed), int(wait * 1000)]
+
+        return script
+
+
+@pytest.fixture(params=["memory", "redis"])
+def limiter(request, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "login_ip_burst", 4)
+    monkeypatch.setattr(settings, "login_ip_per_minute", 1.0)
+    monkeypatch.setattr(settings, "login_account_burst", 2)
+    monkeypatch.setattr(settings, "login_account_per_minute", 1.0)
+
+    previous = get_login_limiter()
+    if request.param == "memory":
+        limiter = InMemoryRateLimiter()
+    else:
+        limiter = RedisRateLimiter(FakeRedis())
+    set_login_limiter(limiter)
+    yield limiter
+    set_login_limiter(previous)
+
+
+@pytest.fixture
+def authenticate_calls(monkeypatch):
+    calls = []
+
+    async def fake_authenticate(db, email, password):
+        calls.append(email)
+        return None
+
+    monkeypatch.setattr(auth_api, "authenticate_user_async", fake_authenticate)
+    return calls
+
+
+def _login(client, username):
+    return client.post(
+        "/api/v1/auth/login",
+        data={"username": username, "password": "wrong"},
+    )
+
+
+def test_account_limit_returns_429_before_authenticating(client, limiter, authenticate_calls):
+    assert _login(client, "victim@limit.com").status_code == 401
+    assert _login(client, "Victim@limit.com").status_code == 401
+
+    resp = _login(client, "victim@limit.com")
+    assert resp.status_code == 429
+    assert int(resp.headers["retry-after"]) >= 1
+    assert len(authenticate_calls) == 2
+
+
+def test_ip_limit_spans_accounts(client, limiter, authenticate_calls):
+    for i in range(4):
+        assert _login(client, f"user{i}@limit.com").status_code == 401
+
+    assert _login(client, "fresh@limit.com").status_code == 429
+    assert len(authenticate_calls) == 4
+
+
+def test_ip_limit_keys_on_the_client_behind_a_trusted_proxy(
+    limiter, authenticate_calls, monkeypatch
+):
+    monkeypatch.setattr(get_settings(), "trusted_proxies", ["10.0.0.0/8"])
+    proxy = TestClient(app, client=("10.0.0.5", 50000))
+
+    def via_proxy(username, forwarded_for):
+        return proxy.post(
+            "/api/v1/auth/login",
+            data={"username": username, "password": "wrong"},
+            headers={"X-Forwarded-For": forwarded_for},
+        )
+
+    for i in range(4):
+        assert via_proxy(f"drain{i}@limit.com", "203.0.113.9").status_code == 401
+    assert via_proxy("drain@limit.com", "203.0.113.9").status_code == 429
+    # A forged entry ahead of what the proxy appended doesn't get a new bucket
+    assert via_proxy("forged@limit.com", "198.51.100.7, 203.0.113.9").status_code == 429
+    # Other clients of the same proxy keep their own
+    assert via_proxy("other@limit.com", "198.51.100.7").status_code == 401
+
+
+def _request(peer, forwarded_for=None):
+    headers = [(b"x-forwarded-for", forwarded_for.encode())] if forwarded_for else []
+    return Request({"type": "http", "client": (peer, 1234), "headers": headers})
+
+
+def test_client_ip_only_believes_trusted_proxies(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "trusted_proxies", [])
+    assert client_ip(_request("10.0.0.5", "203.0.113.9")) == "10.0.0.5"
+
+    monkeypatch.setattr(settings, "trusted_proxies", ["10.0.0.0/8", "192.0.2.1"])
+    assert client_ip(_request("10.0.0.5", "203.0.113.9")) == "203.0.113.9"
+    # Chained proxies are skipped from the right
+    assert client_ip(_request("10.0.0.5", "1.2.3.4, 203.0.113.9, 192.0.2.1")) == "203.0.113.9"
+    assert client_ip(_request("10.0.0.5", "10.1.1.1")) == "10.1.1.1"
+    assert client_ip(_request("10.0.0.5")) == "10.0.0.5"
+    # Straight from the internet: the header is whatever the client says
+    assert client_ip(_request("203.0.113.50", "198.51.100.99")) == "203.0.113.50"
+
+
+def test_redis_limiter_runs_off_the_event_loop(client, authenticate_calls):
+    fake = FakeRedis()
+    previous = get_login_limiter()
+    set_login_limiter(RedisRateLimiter(fake))
+    try:
+        assert _login(client, "loop@limit.com").status_code == 401
+    finally:
+        set_login_limiter(previous)
+    assert fake.threads
+    assert all(name.startswith("AnyIO worker thread") for name in fake.threads)
+
+
+def test_bucket_refills_over_time():
+    allowed, tokens, _ = take_token(0.0, updated_at=0.0, now=30.0, capacity=5, rate=0.1)
+    assert allowed
+    assert tokens == pytest.approx(2.0)
+
+    allowed, tokens, wait = take_token(0.5, updated_at=10.0, now=10.0, capacity=5, rate=0.5)
+    assert not allowed
+    assert wait == pytest.approx(1.0)
@@ -0,0 +1,21 @@
+# backend/tests/test_model_types.py
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.schema import CreateTable
+
+from app.models.project import Project
+
+
+def _ddl(dialect):
+    return str(CreateTable(Project.__table__).compile(dialect=dialect))
+
+
+def test_postgres_keeps_native_types():
+    ddl = _ddl(postgresql.dialect())
+    assert "id UUID NOT NULL" in ddl
+    assert "technologies VARCHAR[]" in ddl
+
+
+def test_sqlite_degrades_to_portable_types():
+    ddl = _ddl(sqlite.dialect())
+    assert "id CHAR(32) NOT NULL" in ddl
+    assert "technologies JSON" in ddl
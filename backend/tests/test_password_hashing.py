@@ -0,0 +1,92 @@
+# backend/tests/test_password_hashing.py
+import asyncio
+import threading
+
+import pytest
+from passlib.context import CryptContext
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.user import User, UserRole
+from app.schemas.user import UserCreate
+from app.services.auth_service import create_user
+from app.utils import hashing
+
+
+def _seed_user(email, hashed_password):
+    db = SessionLocal()
+    user = create_user(
+        db,
+        UserCreate(
+            email=email,
+            full_name="Hashing User",
+            password="placeholder",
+            role=UserRole.STAFF,
+            is_active=True,
+            is_superuser=False,
+        ),
+    )
+    user.hashed_password = hashed_password
+    db.commit()
+    db.close()
+
+
+def _stored_hash(email):
+    db = SessionLocal()
+    try:
+        return db.query(User).filter(User.email == email).one().hashed_password
+    finally:
+        db.close()
+
+
+def test_login_rehashes_outdated_cost(client):
+    rounds = get_settings().bcrypt_rounds
+    old_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds + 1)
+    _seed_user("rehash@hashing.com", old_context.hash("secret-pass"))
+
+    resp = client.post(
+        "/api/v1/auth/login",
+        data={"username": "rehash@hashing.com", "password": "secret-pass"},
+    )
+    assert resp.status_code == 200, resp.text
+
+    new_hash = _stored_hash("rehash@hashing.com")
+    assert new_hash.startswith(f"$2b${rounds:02d}$")
+    assert hashing.verify_password("secret-pass", new_hash)
+
+
+def test_login_returns_503_when_hashing_pool_is_full(client, monkeypatch):
+    _seed_user("busy@hashing.com", hashing.hash_password("secret-pass"))
+
+    full = threading.BoundedSemaphore(1)
+    full.acquire()
+    monkeypatch.setattr(hashing, "_slots", full)
+
+    resp = client.post(
+        "/api/v1/auth/login",
+        data={"username": "busy@hashing.com", "password": "secret-pass"},
+    )
+    assert resp.status_code == 503
+    assert resp.headers["retry-after"] == "1"
+
+
+def test_cancelled_caller_keeps_its_slot_until_the_job_finishes(monkeypatch):
+    slots = threading.BoundedSemaphore(1)
+    monkeypatch.setattr(hashing, "_slots", slots)
+    job_done = threading.Event()
+
+    async def disconnect_mid_hash():
+        task = asyncio.create_task(hashing._run_bounded(job_done.wait))
+        await asyncio.sleep(0.05)
+        task.cancel()  # the client went away
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # Its job still holds a worker, so it still holds the slot
+        with pytest.raises(hashing.PasswordHashingBusy):
+            await hashing._run_bounded(str)
+
+    try:
+        asyncio.run(disconnect_mid_hash())
+    finally:
+        job_done.set()
+    assert slots.acquire(timeout=5)
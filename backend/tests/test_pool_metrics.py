@@ -0,0 +1,77 @@
+# backend/tests/test_pool_metrics.py
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.database import SessionLocal
+from app.models.user import UserRole
+from app.schemas.user import UserCreate
+from app.services.auth_service import create_user
+from app.utils.pool_metrics import InstrumentedQueuePool, instrument_engine
+
+
+def _admin_headers(client):
+    db = SessionLocal()
+    create_user(
+        db,
+        UserCreate(
+            email="admin@pool.com",
+            full_name="Pool Admin",
+            password="adminpass",
+            role=UserRole.ADMIN,
+            is_active=True,
+            is_superuser=False,
+        ),
+    )
+    db.close()
+
+    resp = client.post(
+        "/api/v1/auth/login",
+        data={"username": "admin@pool.com", "password": "adminpass"},
+    )
+    assert resp.status_code == 200, resp.text
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+def test_pool_events_and_timeouts_are_recorded():
+    engine = create_engine(
+        "sqlite://",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    metrics = instrument_engine("test-sqlite", engine)
+
+    conn = engine.connect()
+    conn.execute(text("SELECT 1"))
+    assert metrics.snapshot()["checked_out"] == 1
+
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+
+    conn.close()
+    stats = metrics.snapshot()
+
+    assert stats["connects"] == 1
+    assert stats["checkouts"] == 1
+    assert stats["checkins"] == 1
+    assert stats["checked_out"] == 0
+    assert stats["peak_checked_out"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["size"] == 1
+    # both attempts (success + timeout) land in the wait histogram
+    assert stats["checkout_wait"]["count"] == 2
+    assert sum(stats["checkout_wait"]["histogram"].values()) == 2
+    assert stats["checkout_wait"]["max_ms"] >= 50
+
+
+def test_pool_stats_endpoint_requires_admin(client):
+    assert client.get("/api/v1/stats/db/pool").status_code == 401
+
+    resp = client.get("/api/v1/stats/db/pool", headers=_admin_headers(client))
+    assert resp.status_code == 200, resp.text
+    data = resp.json()
+    assert "primary" in data
+    assert data["primary"]["checkouts"] >= 1
+    assert "histogram" in data["primary"]["checkout_wait"]
@@ -0,0 +1,69 @@
+# backend/tests/test_principal_cache.py
+from app.database import SessionLocal
+from app.models.user import UserRole
+from app.schemas.user import UserCreate
+from app.services.auth_service import create_user
+from app.utils.query_stats import query_budget
+
+
+def _upsert_user(role=UserRole.STAFF, is_active=True):
+    db = SessionLocal()
+    create_user(
+        db,
+        UserCreate(
+            email="principal@cache.com",
+            full_name="Principal",
+            password="principalpass",
+            role=role,
+            is_active=is_active,
+            is_superuser=False,
+        ),
+    )
+    db.close()
+
+
+def _login(client):
+    resp = client.post(
+        "/api/v1/auth/login",
+        data={"username": "principal@cache.com", "password": "principalpass"},
+    )
+    assert resp.status_code == 200, resp.text
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+def test_repeat_requests_skip_user_lookup(client):
+    _upsert_user()
+    headers = _login(client)
+
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 200
+
+    with query_budget(0):
+        resp = client.get("/api/v1/auth/me", headers=headers)
+    assert resp.status_code == 200
+    assert resp.json()["email"] == "principal@cache.com"
+
+
+def test_create_user_invalidates_cached_principal(client):
+    _upsert_user(role=UserRole.STAFF)
+    headers = _login(client)
+    assert client.get("/api/v1/auth/me", headers=headers).json()["role"] == "staff"
+
+    _upsert_user(role=UserRole.ADMIN)
+    assert client.get("/api/v1/auth/me", headers=headers).json()["role"] == "admin"
+
+    # Deactivation takes effect on the next request, not after the TTL
+    _upsert_user(role=UserRole.ADMIN, is_active=False)
+    assert client.get("/api/v1/auth/me", headers=headers).status_code == 401
+
+
+def test_hit_rate_metric(client):
+    _upsert_user(role=UserRole.ADMIN)
+    headers = _login(client)
+    client.get("/api/v1/auth/me", headers=headers)
+    client.get("/api/v1/auth/me", headers=headers)
+
+    resp = client.get("/api/v1/stats/auth/principals", headers=headers)
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["hits"] >= 2
+    assert 0 < data["hit_rate"] <= 1
@@ -72,6 +72,35 @@ def test_get_projects_returns_items_payload():
         assert "status" in project
 
 
+
+def test_project_total_strategies():
+    db = SessionLocal()
+    expected = db.query(Project).filter(Project.service.has(slug="biogas-systems")).count()
+    db.close()
+
+    exact = client.get("/api/v1/projects?service_slug=biogas-systems&limit=1").json()
+    assert exact["total"] == expected
+    assert exact["total_estimated"] is False
+
+    omitted = client.get("/api/v1/projects?include_total=false").json()
+    assert omitted["total"] is None
+    assert omitted["items"]
+
+    # Past the last page the window count has no row to ride on
+    past = client.get(f"/api/v1/projects?service_slug=biogas-systems&page={expected + 1}&limit=1").json()
+    assert past["items"] == []
+    assert past["total"] == expected
+
+    # Filtered lists ignore "estimate" and count exactly
+    filtered = client.get("/api/v1/projects?service_slug=biogas-systems&total=estimate").json()
+    assert filtered["total"] == expected
+    assert filtered["total_estimated"] is False
+
+    estimate = client.get("/api/v1/projects?total=estimate").json()
+    assert isinstance(estimate["total"], int)
+
+    assert client.get("/api/v1/projects?total=bogus").status_code == 422
+
 def test_submit_inquiry_valid():
     payload = {
         "full_name": "Test Client",
@@ -0,0 +1,93 @@
+# backend/tests/test_query_budget.py
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import Base, SessionLocal, engine
+from app.main import app
+from app.models.project import Project, ProjectStatus
+from app.models.user import UserRole
+from app.schemas.user import UserCreate
+from app.services.auth_service import create_user
+from app.utils.query_stats import QueryBudgetExceeded, query_budget
+from app.utils.response_cache import get_cache_backend, set_cache_backend
+
+client = TestClient(app)
+_cache_backend = None
+
+
+def setup_module():
+    # These tests count real queries, so bypass the response cache
+    global _cache_backend
+    _cache_backend = get_cache_backend()
+    set_cache_backend(None)
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+
+    create_user(
+        db,
+        UserCreate(
+            email="admin@budget.com",
+            full_name="Budget Admin",
+            password="adminpass",
+            role=UserRole.ADMIN,
+            is_active=True,
+            is_superuser=False,
+        ),
+    )
+
+    if not db.query(Project).filter(Project.slug == "budget-project").first():
+        db.add(
+            Project(
+                name="Budget Project",
+                slug="budget-project",
+                status=ProjectStatus.ONGOING,
+            )
+        )
+        db.commit()
+    db.close()
+
+
+def teardown_module():
+    set_cache_backend(_cache_backend)
+
+
+def _auth_headers():
+    resp = client.post(
+        "/api/v1/auth/login",
+        data={"username": "admin@budget.com", "password": "adminpass"},
+    )
+    assert resp.status_code == 200
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+def test_server_timing_header_reports_db_work():
+    resp = client.get("/api/v1/projects/budget-project")
+    assert resp.status_code == 200
+    timing = resp.headers["server-timing"]
+    assert timing.startswith("db;dur=")
+    assert '"1 queries"' in timing
+
+
+def test_project_detail_stays_single_query():
+    with query_budget(1):
+        resp = client.get("/api/v1/projects/budget-project")
+    assert resp.status_code == 200
+
+
+@pytest.mark.parametrize(
+    "path", ["/api/v1/inquiries/stats", "/api/v1/projects/stats", "/api/v1/stats/"]
+)
+def test_dashboard_stats_query_budget(path):
+    headers = _auth_headers()
+    # 1 auth lookup + 1 aggregate
+    with query_budget(2):
+        resp = client.get(path, headers=headers)
+    assert resp.status_code == 200
+
+
+def test_budget_guard_fails_when_exceeded():
+    with pytest.raises(QueryBudgetExceeded) as exc:
+        with query_budget(0):
+            client.get("/api/v1/projects/budget-project")
+    assert "got 1" in str(exc.value)
@@ -0,0 +1,60 @@
+# backend/tests/test_read_replicas.py
+from sqlalchemy import create_engine, select, text, update
+
+from app.config import Settings
+from app.database import RoutingSession, primary_reads
+from app.models.project import Project
+
+
+def _session(**info):
+    primary = create_engine("sqlite://")
+    replica = create_engine("sqlite://")
+    db = RoutingSession(primary=primary, replicas=[replica], info=info)
+    return db, primary, replica
+
+
+def test_replica_urls_parsed_from_comma_separated_env():
+    s = Settings(
+        app_env="development",
+        database_url_local="postgresql://u:p@primary/db",
+        database_url_replicas="postgresql://u:p@r1/db, postgresql://u:p@r2/db",
+    )
+    assert s.database_url_replicas == [
+        "postgresql://u:p@r1/db",
+        "postgresql://u:p@r2/db",
+    ]
+    assert s.async_database_url_replicas[0] == "postgresql+asyncpg://u:p@r1/db"
+
+
+def test_reads_go_to_replica_and_writes_to_primary():
+    db, primary, replica = _session()
+
+    assert db.get_bind(clause=select(Project)) is replica
+    assert db.get_bind(clause=select(Project).with_for_update()) is primary
+
+
+def test_session_sticks_to_primary_after_a_write():
+    db, primary, replica = _session()
+
+    assert db.get_bind(clause=text("SELECT 1")) is replica
+    assert db.get_bind(clause=update(Project).values(name="x")) is primary
+    # read-your-writes: later reads in the same session stay on the primary
+    assert db.get_bind(clause=select(Project)) is primary
+
+
+def test_pinned_session_never_uses_replica():
+    db, primary, _ = _session(use_primary=True)
+    assert db.get_bind(clause=select(Project)) is primary
+
+
+def test_primary_reads_context_pins_reads():
+    db, primary, replica = _session()
+    with primary_reads():
+        assert db.get_bind(clause=select(Project)) is primary
+    assert db.get_bind(clause=select(Project)) is replica
+
+
+def test_no_replicas_means_primary_only():
+    primary = create_engine("sqlite://")
+    db = RoutingSession(primary=primary)
+    assert db.get_bind(clause=select(Project)) is primary
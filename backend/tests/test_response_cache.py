@@ -0,0 +1,186 @@
+# backend/tests/test_response_cache.py
+import threading
+import uuid
+
+import pytest
+
+from app.database import SessionLocal
+from app.models.user import UserRole
+from app.schemas.user import UserCreate
+from app.services.auth_service import create_user
+from app.utils.response_cache import (
+    LRUCacheBackend,
+    RedisCacheBackend,
+    get_cache_backend,
+    set_cache_backend,
+)
+
+
+class FakeRedis:
+    """Just enough of the Redis protocol for RedisCacheBackend."""
+
+    def __init__(self):
+        self.data = {}
+        self.threads = set()  # threads that made request-path calls
+
+    def get(self, key):
+        self.threads.add(threading.current_thread().name)
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.threads.add(threading.current_thread().name)
+        self.data[key] = value
+
+    def mget(self, keys):
+        self.threads.add(threading.current_thread().name)
+        return [self.data.get(k) for k in keys]
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1).encode()
+        return int(self.data[key])
+
+
+@pytest.fixture(scope="module")
+def admin_headers(client):
+    db = SessionLocal()
+    create_user(
+        db,
+        UserCreate(
+            email="admin@cache.com",
+            full_name="Cache Admin",
+            password="adminpass",
+            role=UserRole.ADMIN,
+            is_active=True,
+            is_superuser=False,
+        ),
+    )
+    db.close()
+
+    resp = client.post(
+        "/api/v1/auth/login",
+        data={"username": "admin@cache.com", "password": "adminpass"},
+    )
+    assert resp.status_code == 200, resp.text
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request):
+    previous = get_cache_backend()
+    if request.param == "memory":
+        backend = LRUCacheBackend(max_entries=100)
+    else:
+        backend = RedisCacheBackend(FakeRedis())
+    set_cache_backend(backend)
+    yield backend
+    set_cache_backend(previous)
+
+
+def test_public_list_is_cached_and_invalidated_on_admin_write(client, admin_headers, backend):
+    first = client.get("/api/v1/services?limit=100")
+    assert first.status_code == 200
+    assert first.headers["x-cache"] == "MISS"
+
+    second = client.get("/api/v1/services?limit=100")
+    assert second.headers["x-cache"] == "HIT"
+    assert second.json() == first.json()
+
+    slug = f"cached-{uuid.uuid4().hex[:8]}"
+    resp = client.post(
+        "/api/v1/services",
+        json={"name": f"Cached Service {slug}", "slug": slug},
+        headers=admin_headers,
+    )
+    assert resp.status_code == 201, resp.text
+
+    after_write = client.get("/api/v1/services?limit=100")
+    assert after_write.headers["x-cache"] == "MISS"
+    assert slug in {s["slug"] for s in after_write.json()}
+
+
+def test_query_param_order_shares_cache_entry(client, backend):
+    first = client.get("/api/v1/campaigns?skip=0&limit=5")
+    assert first.headers["x-cache"] == "MISS"
+
+    reordered = client.get("/api/v1/campaigns?limit=5&skip=0")
+    assert reordered.headers["x-cache"] == "HIT"
+
+    other_page = client.get("/api/v1/campaigns?limit=5&skip=5")
+    assert other_page.headers["x-cache"] == "MISS"
+
+
+def test_errors_are_not_cached(client, backend):
+    resp = client.get("/api/v1/projects/no-such-project")
+    assert resp.status_code == 404
+    assert "x-cache" not in resp.headers
+
+    again = client.get("/api/v1/projects/no-such-project")
+    assert again.status_code == 404
+    assert "x-cache" not in again.headers
+
+
+def test_redis_calls_stay_off_the_event_loop(client):
+    previous = get_cache_backend()
+    fake = FakeRedis()
+    set_cache_backend(RedisCacheBackend(fake))
+    try:
+        assert client.get("/api/v1/services").headers["x-cache"] == "MISS"
+        assert client.get("/api/v1/services").headers["x-cache"] == "HIT"
+    finally:
+        set_cache_backend(previous)
+    assert fake.threads
+    assert all(name.startswith("AnyIO worker thread") for name in fake.threads)
+
+
+def test_lru_backend_evicts_oldest_entry():
+    backend = LRUCacheBackend(max_entries=2)
+    backend.set("a", b"1", ttl=60)
+    backend.set("b", b"2", ttl=60)
+    assert backend.get("a") == b"1"  # a is now most recent
+
+    backend.set("c", b"3", ttl=60)
+    assert backend.get("b") is None
+    assert backend.get("a") == b"1"
+    assert backend.get("c") == b"3"
+
+
+def test_if_none_match_returns_304_until_data_changes(client, admin_headers, backend):
+    first = client.get("/api/v1/services")
+    etag = first.headers["etag"]
+
+    not_modified = client.get("/api/v1/services", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+    # Weak form and lists are accepted too
+    weak = client.get(
+        "/api/v1/services", headers={"If-None-Match": f'"other", W/{etag}'}
+    )
+    assert weak.status_code == 304
+
+    slug = f"etag-{uuid.uuid4().hex[:8]}"
+    resp = client.post(
+        "/api/v1/services",
+        json={"name": f"ETag Service {slug}", "slug": slug, "display_order": -1},
+        headers=admin_headers,
+    )
+    assert resp.status_code == 201, resp.text
+
+    changed = client.get("/api/v1/services", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def test_etag_without_cache_backend(client):
+    previous = get_cache_backend()
+    set_cache_backend(None)
+    try:
+        first = client.get("/api/v1/testimonials")
+        etag = first.headers["etag"]
+        assert "x-cache" not in first.headers
+
+        again = client.get("/api/v1/testimonials", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+    finally:
+        set_cache_backend(previous)
@@ -0,0 +1,100 @@
+# backend/tests/test_site_home.py
+import uuid
+
+import pytest
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.project import Project
+from app.models.user import UserRole
+from app.schemas.user import UserCreate
+from app.services.auth_service import create_user
+from app.utils.query_stats import query_budget
+
+
+@pytest.fixture(scope="module")
+def admin_headers(client):
+    db = SessionLocal()
+    create_user(
+        db,
+        UserCreate(
+            email="admin@site.com",
+            full_name="Site Admin",
+            password="adminpass",
+            role=UserRole.ADMIN,
+            is_active=True,
+            is_superuser=False,
+        ),
+    )
+    db.close()
+
+    resp = client.post(
+        "/api/v1/auth/login",
+        data={"username": "admin@site.com", "password": "adminpass"},
+    )
+    assert resp.status_code == 200, resp.text
+    return {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+
+def test_home_bundle_shape(client):
+    resp = client.get("/api/v1/site/home")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert set(data) == {
+        "services",
+        "featured_projects",
+        "featured_testimonials",
+        "featured_campaigns",
+        "generated_at",
+    }
+    assert resp.headers["etag"]
+
+
+def test_home_is_rebuilt_on_admin_write_and_served_without_queries(client, admin_headers):
+    client.get("/api/v1/site/home")  # make sure a snapshot exists
+
+    slug = f"home-{uuid.uuid4().hex[:8]}"
+    resp = client.post(
+        "/api/v1/projects",
+        json={"name": f"Home Project {slug}", "slug": slug, "is_featured": True},
+        headers=admin_headers,
+    )
+    assert resp.status_code == 201, resp.text
+
+    # The commit already rebuilt the snapshot: no DB work on the read path
+    with query_budget(0):
+        resp = client.get("/api/v1/site/home")
+    assert resp.status_code == 200
+    assert slug in {p["slug"] for p in resp.json()["featured_projects"]}
+
+
+def test_home_answers_if_none_match(client):
+    first = client.get("/api/v1/site/home")
+    etag = first.headers["etag"]
+
+    with query_budget(0):
+        resp = client.get("/api/v1/site/home", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+
+
+def test_home_snapshot_expires_when_generations_are_per_process(client, monkeypatch):
+    client.get("/api/v1/site/home")
+
+    # A commit made by another worker: this process's generations don't move
+    slug = f"elsewhere-{uuid.uuid4().hex[:8]}"
+    db = SessionLocal()
+    try:
+        db.add(Project(name=f"Elsewhere {slug}", slug=slug, is_featured=True))
+        db.flush()
+        db.info.pop("cache_writes", None)
+        db.commit()
+    finally:
+        db.close()
+
+    resp = client.get("/api/v1/site/home")
+    assert slug not in {p["slug"] for p in resp.json()["featured_projects"]}
+
+    monkeypatch.setattr(settings, "response_cache_ttl", 0)
+    resp = client.get("/api/v1/site/home")
+    assert slug in {p["slug"] for p in resp.json()["featured_projects"]}
@@ -0,0 +1,196 @@
+# backend/tests/test_site_search.py
+from uuid import uuid4
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.campaign import Campaign, CampaignStatus
+from app.models.project import Project
+from app.models.service import Service
+from app.services.search_index import SearchIndex, KINDS_BY_TABLE
+from app.utils.response_cache import LRUCacheBackend, get_cache_backend, set_cache_backend
+
+
+def _search(client, q, **params):
+    resp = client.get("/api/v1/search", params={"q": q, **params})
+    assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
+def test_search_returns_typed_ranked_hits(client):
+    tag = f"zq{uuid4().hex[:8]}"
+    db = SessionLocal()
+    db.add_all(
+        [
+            Project(
+                name=f"Borehole {tag}",
+                slug=f"borehole-{tag}",
+                description="Solar pumped water for a rural school.",
+                technologies=["solar", "pvc"],
+            ),
+            Project(
+                name="Clinic roof",
+                slug=f"clinic-{tag}",
+                description=f"Rainwater tank and gutters <b>{tag}</b> for the clinic.",
+            ),
+            Service(name=f"Hidden {tag}", slug=f"hidden-{tag}", is_active=False),
+            Campaign(name=f"Draft {tag}", slug=f"draft-{tag}", status=CampaignStatus.DRAFT),
+            Campaign(
+                name="Water for Gulu",
+                slug=f"water-{tag}",
+                status=CampaignStatus.ACTIVE,
+                short_description=f"Help us drill {tag} boreholes.",
+            ),
+        ]
+    )
+    db.commit()
+    db.close()
+
+    data = _search(client, tag)
+    hits = data["hits"]
+    assert data["total"] == 3
+    assert [h["type"] for h in hits].count("project") == 2
+    assert {h["slug"] for h in hits} == {f"borehole-{tag}", f"clinic-{tag}", f"water-{tag}"}
+    # Title match outranks description matches
+    assert hits[0]["slug"] == f"borehole-{tag}"
+
+    clinic = next(h for h in hits if h["slug"] == f"clinic-{tag}")
+    assert f"<mark>{tag}</mark>" in clinic["snippet"]
+    assert "&lt;b&gt;" in clinic["snippet"]  # stored text is escaped
+
+    only_campaigns = _search(client, tag, type="campaign")
+    assert [h["slug"] for h in only_campaigns["hits"]] == [f"water-{tag}"]
+
+    # Last word matches as a prefix; all words must match
+    assert _search(client, f"solar {tag[:6]}")["hits"][0]["slug"] == f"borehole-{tag}"
+    assert _search(client, f"gutters {tag} nonexistentword")["total"] == 0
+
+
+def test_admin_writes_update_the_index(client, admin_token_headers):
+    tag = f"zw{uuid4().hex[:8]}"
+
+    resp = client.post(
+        "/api/v1/projects",
+        json={"name": f"Bridge {tag}", "slug": f"bridge-{tag}"},
+        headers=admin_token_headers,
+    )
+    assert resp.status_code == 201, resp.text
+    project_id = resp.json()["id"]
+    assert [h["id"] for h in _search(client, tag)["hits"]] == [project_id]
+
+    resp = client.put(
+        f"/api/v1/projects/{project_id}",
+        json={"name": "Footbridge", "description": f"Renamed {tag}x"},
+        headers=admin_token_headers,
+    )
+    assert resp.status_code == 200
+    assert _search(client, tag)["hits"][0]["title"] == "Footbridge"
+    assert _search(client, f"{tag}x")["total"] == 1
+
+    resp = client.delete(f"/api/v1/projects/{project_id}", headers=admin_token_headers)
+    assert resp.status_code == 204
+    assert _search(client, tag)["total"] == 0
+
+
+def _commit_from_another_worker(obj):
+    """Commit `obj` without this process's commit listeners seeing the write."""
+    db = SessionLocal()
+    try:
+        db.add(obj)
+        db.flush()
+        db.info.pop("cache_writes", None)
+        db.commit()
+    finally:
+        db.close()
+
+
+def test_other_workers_writes_reach_the_index_after_the_ttl(client, monkeypatch):
+    tag = f"zo{uuid4().hex[:8]}"
+    _search(client, "anything")  # make sure the index is built
+
+    _commit_from_another_worker(Project(name=f"Elsewhere {tag}", slug=f"elsewhere-{tag}"))
+    assert _search(client, tag)["total"] == 0
+
+    monkeypatch.setattr(settings, "response_cache_ttl", 0)
+    assert _search(client, tag)["total"] == 1
+
+
+def test_other_workers_writes_reach_the_index_via_shared_generations(client):
+    previous = get_cache_backend()
+    shared = LRUCacheBackend()
+    shared.shared = True  # stands in for Redis: one store for every worker
+    set_cache_backend(shared)
+    try:
+        tag = f"zg{uuid4().hex[:8]}"
+        _search(client, "anything")
+
+        _commit_from_another_worker(Campaign(name=f"Elsewhere {tag}", slug=f"elsewhere-{tag}"))
+        shared.bump("campaigns")  # what the other worker's commit publishes
+        assert _search(client, tag)["total"] == 1
+    finally:
+        set_cache_backend(previous)
+
+
+def test_hidden_rows_leave_the_index():
+    index = SearchIndex()
+    services = KINDS_BY_TABLE["services"]
+    service = Service(id=uuid4(), name="Biogas digesters", slug="biogas", is_active=True)
+
+    index.upsert(services, [service])
+    assert index.search("biogas")[0] == 1
+
+    service.is_active = False
+    index.upsert(services, [service])
+    assert index.search("biogas")[0] == 0
+    assert len(index) == 0
+
+
+def test_concurrent_stale_searches_reload_once(monkeypatch):
+    from app.services import search_index as module
+
+    loads = []
+    monkeypatch.setattr(module, "_load_kind", lambda db, kind: loads.append(kind.table))
+    monkeypatch.setattr(module.search_index, "generations", None)
+    monkeypatch.setattr(module.search_index, "loaded_at", {})
+
+    # Both searches saw the index missing; the second one waited for the
+    # build lock while the first loaded everything
+    stale = module.stale_tables()
+    module.rebuild_search_index(stale, if_stale=True)
+    module.rebuild_search_index(stale, if_stale=True)
+    assert sorted(loads) == sorted(module.SEARCH_TABLES)
+
+
+def test_reloading_a_kind_swaps_it_in_whole():
+    index = SearchIndex()
+    services = KINDS_BY_TABLE["services"]
+    old = Service(id=uuid4(), name="Borehole drilling", slug="borehole", is_active=True)
+    new = Service(id=uuid4(), name="Borehole repair", slug="repair", is_active=True)
+    index.upsert(services, [old])
+
+    index.replace_kind(services, [new])
+    total, hits = index.search("borehole")
+    assert total == 1 and hits[0].slug == "repair"
+    assert index.search("drilling")[0] == 0
+    assert index.search("rep")[0] == 1  # vocabulary sorted for prefixes
+
+
+def test_pruned_top_hits_match_scoring_every_match():
+    index = SearchIndex()
+    projects = KINDS_BY_TABLE["projects"]
+    index.upsert(
+        projects,
+        [
+            Project(
+                id=uuid4(),
+                name=f"{'Solar ' * (i % 4)}pump {i}",
+                slug=f"pump-{i}",
+                description=" ".join(["solar"] * (i % 3) + ["pump"] * (i % 5) + ["sol"]),
+            )
+            for i in range(40)
+        ],
+    )
+    for query in ("solar pump", "pump", "pump so"):
+        total, every = index.search(query, limit=50)
+        assert total == len(every)
+        for limit in (1, 3, 7):
+            assert index.search(query, limit=limit) == (total, every[:limit])
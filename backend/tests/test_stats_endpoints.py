@@ -118,3 +118,33 @@ def test_admin_dashboard_stats():
 
     assert data["projects"] >= 1
     assert data["inquiries"] >= 1
+
+
+def test_stats_match_per_table_counts():
+    token = login()
+    headers = {"Authorization": f"Bearer {token}"}
+    db = SessionLocal()
+    try:
+        projects = client.get("/api/v1/projects/stats", headers=headers).json()
+        assert projects == {
+            "total": db.query(Project).count(),
+            "completed": db.query(Project).filter(Project.status == ProjectStatus.COMPLETED).count(),
+            "ongoing": db.query(Project).filter(Project.status == ProjectStatus.ONGOING).count(),
+            "planned": db.query(Project).filter(Project.status == ProjectStatus.PLANNED).count(),
+            "on_hold": db.query(Project).filter(Project.status == ProjectStatus.ON_HOLD).count(),
+            "featured": db.query(Project).filter(Project.is_featured.is_(True)).count(),
+        }
+
+        inquiries = client.get("/api/v1/inquiries/stats", headers=headers).json()
+        by_status = {
+            s.value: db.query(Inquiry).filter(Inquiry.status == s).count()
+            for s in InquiryStatus
+        }
+        assert inquiries == {
+            "total": db.query(Inquiry).count(),
+            "open": sum(by_status.values()) - by_status["closed"],
+            "new": by_status["new"],
+            "by_status": by_status,
+        }
+    finally:
+        db.close()
@@ -65,3 +65,46 @@ def test_admin_can_list_subscribers():
 def test_anonymous_cannot_list_subscribers():
     resp = client.get("/api/v1/subscribers")
     assert resp.status_code in (401, 403)
+
+
+def test_cursor_pagination_and_export_cover_every_subscriber():
+    import json
+    from uuid import uuid4
+
+    tag = uuid4().hex[:8]
+    db = SessionLocal()
+    db.add_all(Subscriber(email=f"cursor{i}-{tag}@newsletter.com") for i in range(5))
+    db.commit()
+    db.close()
+    mine = {f"cursor{i}-{tag}@newsletter.com" for i in range(5)}
+    headers = {"Authorization": f"Bearer {login()}"}
+
+    # Same transaction → same server-side created_at; the id breaks ties
+    seen = []
+    params = {"limit": 2}
+    while True:
+        resp = client.get("/api/v1/subscribers", params=params, headers=headers)
+        assert resp.status_code == 200
+        seen.extend(item["email"] for item in resp.json())
+        assert len(seen) < 1000, "cursor did not advance"
+        cursor = resp.headers.get("x-next-cursor")
+        if cursor is None:
+            break
+        params["cursor"] = cursor
+
+    assert sorted(e for e in seen if e in mine) == sorted(mine)
+
+    resp = client.get("/api/v1/subscribers/export", headers=headers)
+    assert resp.status_code == 200
+    exported = [json.loads(line)["email"] for line in resp.text.splitlines()]
+    assert mine <= set(exported)
+    assert len(exported) == len(set(exported))
+
+
+def test_invalid_cursor_is_rejected():
+    resp = client.get(
+        "/api/v1/subscribers",
+        params={"cursor": "garbage"},
+        headers={"Authorization": f"Bearer {login()}"},
+    )
+    assert resp.status_code == 400